@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class NoteErrorCountDTO:
+    note_correct: str
+    note_played: str
+    count: int
+
+
+@dataclass
+class TimeBucketCountDTO:
+    start_sec: int
+    count: int
+
+
+@dataclass
+class MusicalErrorSummaryDTO:
+    bucket_sec: int
+    total: int
+    by_note: List[NoteErrorCountDTO]
+    by_time: List[TimeBucketCountDTO]
+
+
+@dataclass
+class ExplicationSummaryDTO:
+    explication: str
+    count: int
+    duration_sec: int
+
+
+@dataclass
+class PosturalErrorSummaryDTO:
+    total: int
+    total_duration_sec: int
+    by_explication: List[ExplicationSummaryDTO]
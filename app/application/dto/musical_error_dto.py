@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import List, Optional
 
 
 @dataclass
@@ -7,4 +8,10 @@ class MusicalErrorDTO:
     min_sec: str
     note_played: str
     note_correct: str
-    id_practice: int
\ No newline at end of file
+    id_practice: int
+
+
+@dataclass
+class MusicalErrorPageDTO:
+    errors: List[MusicalErrorDTO]
+    next_cursor: Optional[str]
@@ -1,8 +1,15 @@
 from dataclasses import dataclass
+from typing import List, Optional
 
 
 @dataclass
 class PosturalErrorDTO:
     min_sec_init: str
     min_sec_end: str
-    explication: str
\ No newline at end of file
+    explication: str
+
+
+@dataclass
+class PosturalErrorPageDTO:
+    errors: List[PosturalErrorDTO]
+    next_cursor: Optional[str]
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import List, Optional
 
 
 @dataclass
@@ -16,4 +17,10 @@ class PracticeDTO:
     time: str
     state: str
     local_video_url: str
-    pdf_url: str
\ No newline at end of file
+    pdf_url: str
+
+
+@dataclass
+class PracticePageDTO:
+    practices: List[PracticeDTO]
+    next_cursor: Optional[str]
\ No newline at end of file
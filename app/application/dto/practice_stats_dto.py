@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class StatsDTO:
+    num_practices: int
+    total_practice_sec: float
+    avg_bpm: float
+    postural_errors_per_min: float
+    musical_errors_per_min: float
+
+
+@dataclass
+class ScaleStatsDTO(StatsDTO):
+    scale: str
+    scale_type: str
+
+
+@dataclass
+class WeekStatsDTO(StatsDTO):
+    week_start: str
+
+
+@dataclass
+class PracticeStatsDTO:
+    totals: StatsDTO
+    by_scale: List[ScaleStatsDTO]
+    by_week: List[WeekStatsDTO]
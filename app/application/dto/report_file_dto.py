@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ReportFileDTO:
+    path: str
+    size: int
+    modified_ns: int
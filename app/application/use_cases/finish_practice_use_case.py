@@ -1,16 +1,45 @@
+import logging
+from typing import Dict, List, Optional
+
 from app.application.dto.practice_metadata_dto import PracticeMetadataDTO
+from app.core.tracing import traced
 from app.domain.services.practice_metadata_service import PracticeMetadataService
 from app.domain.services.video_service import VideoService
+from app.shared.constants import FINISH_BATCH_MAX_IDS
+from app.shared.utils import unique_practice_ids
+
+logger = logging.getLogger(__name__)
 
 
+@traced
 class FinishPracticeUseCase:
     def __init__(self, practice_metadata_service: PracticeMetadataService, video_service: VideoService):
         self.practice_metadata_service = practice_metadata_service
         self.video_service = video_service
 
     async def execute(self, uid: str, practice_id: int) -> PracticeMetadataDTO:
-        # Delete video
-        await self.video_service.delete_video(uid, practice_id)
-        
-        # Update metadata
-        return await self.practice_metadata_service.finish_practice(uid, practice_id)
\ No newline at end of file
+        # Update metadata first: a practice that cannot be finished keeps its video
+        metadata = await self.practice_metadata_service.finish_practice(uid, practice_id)
+
+        # The video itself is deleted in the background
+        try:
+            await self.video_service.schedule_video_deletion(uid, practice_id)
+        except Exception as e:
+            # The practice is already finished: leave the file behind rather than failing the request
+            logger.error(f"Could not schedule video deletion for uid={uid}, practice_id={practice_id}: {e}", exc_info=True)
+
+        return metadata
+
+    async def execute_batch(self, uid: str, practice_ids: List[int]) -> Dict[int, Optional[PracticeMetadataDTO]]:
+        """Finishes several practices, keyed by practice id in request order (None when not found)."""
+        practice_ids = unique_practice_ids(practice_ids, FINISH_BATCH_MAX_IDS)
+        metadata = await self.practice_metadata_service.finish_practices(uid, practice_ids)
+
+        finished_ids = [practice_id for practice_id in practice_ids if practice_id in metadata]
+        if finished_ids:
+            try:
+                await self.video_service.schedule_video_deletions(uid, finished_ids)
+            except Exception as e:
+                logger.error(f"Could not schedule video deletions for uid={uid}, practice_ids={finished_ids}: {e}", exc_info=True)
+
+        return {practice_id: metadata.get(practice_id) for practice_id in practice_ids}
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from typing import Optional
+
+from app.application.dto.error_summary_dto import (
+    ExplicationSummaryDTO,
+    MusicalErrorSummaryDTO,
+    NoteErrorCountDTO,
+    PosturalErrorSummaryDTO,
+    TimeBucketCountDTO,
+)
+from app.core.exceptions import PracticeServiceException
+from app.core.tracing import traced
+from app.domain.repositories.cache_repo import ICacheRepository
+from app.domain.services.musical_error_service import MusicalErrorService
+from app.domain.services.postural_error_service import PosturalErrorService
+from app.domain.services.practice_metadata_service import PracticeMetadataService
+from app.domain.services.practice_service import PracticeService
+
+logger = logging.getLogger(__name__)
+
+@traced
+class GetErrorSummaryUseCase:
+    """Use case for the per-practice error histograms.
+
+    Errors are only written while a practice is being analyzed, so once the
+    practice is finished its summaries can no longer change and are memoized
+    in `cache` without expiration. Summaries of unfinished practices are
+    always recomputed.
+    """
+
+    def __init__(
+        self,
+        musical_error_service: MusicalErrorService,
+        postural_error_service: PosturalErrorService,
+        practice_service: PracticeService,
+        practice_metadata_service: PracticeMetadataService,
+        cache: Optional[ICacheRepository] = None,
+    ):
+        self.musical_error_service = musical_error_service
+        self.postural_error_service = postural_error_service
+        self.practice_service = practice_service
+        self.practice_metadata_service = practice_metadata_service
+        self.cache = cache
+
+    async def musical_summary(self, practice_id: int, bucket_sec: int) -> MusicalErrorSummaryDTO:
+        """Musical error counts by note pair and by time bucket."""
+        key = f"musical_error_summary:{practice_id}:{bucket_sec}"
+        cached = await self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        logger.debug("Aggregating musical errors for practice_id=%s", practice_id)
+        summary, finished = await asyncio.gather(
+            self.musical_error_service.get_musical_error_summary(practice_id, bucket_sec),
+            self._is_finished(practice_id),
+        )
+        dto = MusicalErrorSummaryDTO(
+            bucket_sec=summary.bucket_sec,
+            total=summary.total,
+            by_note=[NoteErrorCountDTO(note_correct=n.note_correct, note_played=n.note_played, count=n.count) for n in summary.by_note],
+            by_time=[TimeBucketCountDTO(start_sec=b.start_sec, count=b.count) for b in summary.by_time],
+        )
+        if finished:
+            await self.cache.set(key, dto)
+        return dto
+
+    async def postural_summary(self, practice_id: int) -> PosturalErrorSummaryDTO:
+        """Postural error counts and durations by explication."""
+        key = f"postural_error_summary:{practice_id}"
+        cached = await self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        logger.debug("Aggregating postural errors for practice_id=%s", practice_id)
+        summary, finished = await asyncio.gather(
+            self.postural_error_service.get_postural_error_summary(practice_id),
+            self._is_finished(practice_id),
+        )
+        dto = PosturalErrorSummaryDTO(
+            total=summary.total,
+            total_duration_sec=summary.total_duration_sec,
+            by_explication=[
+                ExplicationSummaryDTO(explication=e.explication, count=e.count, duration_sec=e.duration_sec)
+                for e in summary.by_explication
+            ],
+        )
+        if finished:
+            await self.cache.set(key, dto)
+        return dto
+
+    async def _get_cached(self, key: str):
+        if self.cache is None:
+            return None
+        return await self.cache.get(key)
+
+    async def _is_finished(self, practice_id: int) -> bool:
+        """Whether the practice reached its terminal state. Any lookup failure counts as not finished."""
+        if self.cache is None:
+            return False
+        try:
+            uid = await self.practice_service.get_practice_owner(practice_id)
+            metadata = await self.practice_metadata_service.get_practice_metadata(uid, practice_id)
+        except PracticeServiceException as e:
+            logger.debug("Not memoizing error summaries of practice %s: %s", practice_id, e.message)
+            return False
+        except Exception:
+            # e.g. MongoDB unreachable: the summary itself only needs MySQL
+            logger.warning("Could not check whether practice %s is finished", practice_id, exc_info=True)
+            return False
+        return self.practice_metadata_service.is_finished(metadata)
@@ -1,19 +1,65 @@
-from typing import List
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional
 
-from app.application.dto.musical_error_dto import MusicalErrorDTO
+from app.application.dto.musical_error_dto import MusicalErrorDTO, MusicalErrorPageDTO
+from app.core.tracing import traced
+from app.domain.entities.musical_error import MusicalError
 from app.domain.services.musical_error_service import MusicalErrorService
+from app.shared.constants import ERRORS_BATCH_MAX_IDS, ERRORS_PAGE_LIMIT
+from app.shared.utils import decode_int_cursor, encode_cursor, unique_practice_ids, validate_time_window
 
 
+@traced
 class GetMusicalErrorsUseCase:
     def __init__(self, musical_error_service: MusicalErrorService):
         self.musical_error_service = musical_error_service
 
     async def execute(self, practice_id: int) -> List[MusicalErrorDTO]:
         musical_errors = await self.musical_error_service.get_musical_errors_by_practice(practice_id)
-        return [MusicalErrorDTO(
+        return [self._to_dto(error) for error in musical_errors]
+
+    async def execute_batch(self, practice_ids: List[int]) -> Dict[int, List[MusicalErrorDTO]]:
+        """Musical errors of several practices, keyed by practice id in request order."""
+        practice_ids = unique_practice_ids(practice_ids, ERRORS_BATCH_MAX_IDS)
+        errors_by_practice = await self.musical_error_service.get_musical_errors_by_practices(practice_ids)
+        return {
+            practice_id: [self._to_dto(error) for error in errors_by_practice.get(practice_id, [])]
+            for practice_id in practice_ids
+        }
+
+    async def stream(self, practice_id: int) -> AsyncIterator[MusicalErrorDTO]:
+        """Musical errors of a practice, yielded as they are read from the database."""
+        async with aclosing(self.musical_error_service.stream_musical_errors_by_practice(practice_id)) as errors:
+            async for error in errors:
+                yield self._to_dto(error)
+
+    async def execute_page(
+        self,
+        practice_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        from_sec: Optional[int] = None,
+        to_sec: Optional[int] = None,
+    ) -> MusicalErrorPageDTO:
+        """A page of musical errors ordered by time, optionally restricted to [from_sec, to_sec]."""
+        validate_time_window(from_sec, to_sec)
+        keyset = decode_int_cursor(cursor, size=2) if cursor else None
+        page_limit = limit if limit is not None else ERRORS_PAGE_LIMIT
+
+        errors = await self.musical_error_service.get_musical_errors_page(practice_id, page_limit, keyset, from_sec, to_sec)
+
+        next_cursor = None
+        if errors and len(errors) >= page_limit:
+            last = errors[-1]
+            next_cursor = encode_cursor(last.seconds, last.id)
+
+        return MusicalErrorPageDTO(errors=[self._to_dto(error) for error in errors], next_cursor=next_cursor)
+
+    def _to_dto(self, error: MusicalError) -> MusicalErrorDTO:
+        return MusicalErrorDTO(
             id=error.id,
             min_sec=error.min_sec,
             note_played=error.note_played,
             note_correct=error.note_correct,
             id_practice=error.id_practice
-        ) for error in musical_errors]
\ No newline at end of file
+        )
@@ -1,16 +1,55 @@
-from typing import List
-from app.application.dto.postural_error_dto import PosturalErrorDTO
+from typing import Dict, List, Optional
+from app.application.dto.postural_error_dto import PosturalErrorDTO, PosturalErrorPageDTO
+from app.core.tracing import traced
+from app.domain.entities.postural_error import PosturalError
 from app.domain.services.postural_error_service import PosturalErrorService
+from app.shared.constants import ERRORS_BATCH_MAX_IDS, ERRORS_PAGE_LIMIT
+from app.shared.utils import decode_int_cursor, encode_cursor, unique_practice_ids, validate_time_window
 
 
+@traced
 class GetPosturalErrorsUseCase:
     def __init__(self, postural_error_service: PosturalErrorService):
         self.postural_error_service = postural_error_service
 
     async def execute(self, practice_id: int) -> List[PosturalErrorDTO]:
         potural_errors = await self.postural_error_service.get_postural_errors_by_practice_id(practice_id)
-        return [PosturalErrorDTO(
+        return [self._to_dto(error) for error in potural_errors]
+
+    async def execute_batch(self, practice_ids: List[int]) -> Dict[int, List[PosturalErrorDTO]]:
+        """Postural errors of several practices, keyed by practice id in request order."""
+        practice_ids = unique_practice_ids(practice_ids, ERRORS_BATCH_MAX_IDS)
+        errors_by_practice = await self.postural_error_service.get_postural_errors_by_practice_ids(practice_ids)
+        return {
+            practice_id: [self._to_dto(error) for error in errors_by_practice.get(practice_id, [])]
+            for practice_id in practice_ids
+        }
+
+    async def execute_page(
+        self,
+        practice_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        from_sec: Optional[int] = None,
+        to_sec: Optional[int] = None,
+    ) -> PosturalErrorPageDTO:
+        """A page of postural errors ordered by time, optionally restricted to [from_sec, to_sec]."""
+        validate_time_window(from_sec, to_sec)
+        keyset = decode_int_cursor(cursor, size=2) if cursor else None
+        page_limit = limit if limit is not None else ERRORS_PAGE_LIMIT
+
+        errors = await self.postural_error_service.get_postural_errors_page(practice_id, page_limit, keyset, from_sec, to_sec)
+
+        next_cursor = None
+        if errors and len(errors) >= page_limit:
+            last = errors[-1]
+            next_cursor = encode_cursor(last.seconds, last.id)
+
+        return PosturalErrorPageDTO(errors=[self._to_dto(error) for error in errors], next_cursor=next_cursor)
+
+    def _to_dto(self, error: PosturalError) -> PosturalErrorDTO:
+        return PosturalErrorDTO(
             min_sec_init=error.min_sec_init,
             min_sec_end=error.min_sec_end,
             explication=error.explication,
-        ) for error in potural_errors]
\ No newline at end of file
+        )
@@ -0,0 +1,40 @@
+import logging
+
+from app.application.dto.practice_stats_dto import PracticeStatsDTO, ScaleStatsDTO, StatsDTO, WeekStatsDTO
+from app.core.tracing import traced
+from app.domain.entities.practice_stats import PracticeStatsTotals
+from app.domain.services.practice_stats_service import PracticeStatsService
+
+logger = logging.getLogger(__name__)
+
+@traced
+class GetPracticeStatsUseCase:
+    """Use case for retrieving a user's progress statistics."""
+
+    def __init__(self, practice_stats_service: PracticeStatsService):
+        self.practice_stats_service = practice_stats_service
+
+    async def execute(self, uid: str, weeks: int) -> PracticeStatsDTO:
+        logger.debug("Fetching practice stats for user %s (last %s weeks)", uid, weeks)
+        stats = await self.practice_stats_service.get_user_stats(uid, weeks)
+
+        return PracticeStatsDTO(
+            totals=StatsDTO(**self._metrics(stats.totals)),
+            by_scale=[
+                ScaleStatsDTO(scale=s.scale, scale_type=s.scale_type, **self._metrics(s))
+                for s in stats.by_scale
+            ],
+            by_week=[
+                WeekStatsDTO(week_start=w.week_start.isoformat(), **self._metrics(w))
+                for w in stats.by_week
+            ],
+        )
+
+    def _metrics(self, totals: PracticeStatsTotals) -> dict:
+        return {
+            "num_practices": totals.num_practices,
+            "total_practice_sec": round(float(totals.total_duration), 2),
+            "avg_bpm": round(totals.avg_bpm, 2),
+            "postural_errors_per_min": round(totals.postural_errors_per_min, 2),
+            "musical_errors_per_min": round(totals.musical_errors_per_min, 2),
+        }
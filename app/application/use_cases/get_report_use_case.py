@@ -1,16 +1,25 @@
 import logging
 
+from app.application.dto.report_file_dto import ReportFileDTO
+from app.core.tracing import traced
 from app.domain.services.report_service import ReportService
 
 
 logger = logging.getLogger(__name__)
 
+@traced
 class GetReportUseCase:
     def __init__(self, report_service: ReportService):
         self.report_service = report_service
 
     async def execute(self, uid: str, practice_id: int) -> bytes:
         """Retrieve the report for a specific practice."""
-        logger.info(f"Fetching report for user {uid}, practice_id={practice_id}")
+        logger.debug("Fetching report for user %s, practice_id=%s", uid, practice_id)
         report = await self.report_service.get_report(uid, practice_id)
-        return report
\ No newline at end of file
+        return report
+
+    async def get_file(self, uid: str, practice_id: int) -> ReportFileDTO:
+        """Locate the report file so it can be streamed from disk."""
+        logger.debug("Locating report for user %s, practice_id=%s", uid, practice_id)
+        report_file = await self.report_service.get_report_file(uid, practice_id)
+        return ReportFileDTO(path=report_file.path, size=report_file.size, modified_ns=report_file.modified_ns)
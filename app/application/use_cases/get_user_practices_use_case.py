@@ -1,14 +1,22 @@
-from datetime import date
+import asyncio
+from datetime import date, datetime
 import logging
-from typing import List, Optional
+from typing import Optional, Tuple
 
-from app.application.dto.practice_dto import PracticeDTO
+from app.application.dto.practice_dto import PracticeDTO, PracticePageDTO
+from app.core.exceptions import PracticeNotFoundException, ValidationException
+from app.core.tracing import traced
+from app.domain.entities.practice import Practice
+from app.domain.entities.practice_metadata import PracticeMetadata
 from app.domain.services.practice_metadata_service import PracticeMetadataService
 from app.domain.services.practice_service import PracticeService
+from app.shared.constants import PRACTICES_PAGE_LIMIT
 from app.shared.enums import Figure, PracticeState
+from app.shared.utils import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
+@traced
 class GetUserPracticesUseCase:
     """Use case for retrieving user practices within a date range."""
     
@@ -16,78 +24,77 @@ class GetUserPracticesUseCase:
         self.practice_service = practice_service
         self.practice_metadata_service = practice_metadata_service
 
-    async def get_all(self, uid: str, last_id: Optional[int] = None, limit: Optional[int] = None) -> List[PracticeDTO]:
-        """Retrieve practices for a user within the specified date range."""
+    async def get_all(
+        self,
+        uid: str,
+        last_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> PracticePageDTO:
+        """Retrieve a page of practices for a user, newest first."""
         
-        logger.info(f"Fetching practices for user {uid} with last_id={last_id} and limit={limit}")
-        practices = await self.practice_service.get_practices_for_user(uid, last_id, limit)
+        logger.debug("Fetching practices for user %s with last_id=%s, cursor=%s and limit=%s", uid, last_id, cursor, limit)
+        keyset = self._decode_cursor(cursor) if cursor else None
+        practices = await self.practice_service.get_practices_for_user(uid, last_id, limit, keyset)
         
-        # 2. Get practices info from MongoDB
-        logger.info(f"Fetching metadata for {len(practices)} practices")
+        # 2. Get practices info from MongoDB in a single round trip
+        logger.debug("Fetching metadata for %s practices", len(practices))
+        metadata_by_id = await self.practice_metadata_service.get_practices_metadata(uid, [p.id for p in practices])
         for p in practices:
-            metadata = await self.practice_metadata_service.get_practice_metadata(uid, p.id)
-            p.local_video_url = metadata.video_in_local
-            p.pdf_url = metadata.report
-            
-            # FINISHED: Report ready and video deleted from local
-            if metadata.report != "" and metadata.video_in_local == "":
-                p.state = PracticeState.FINISHED
-            # COMPLETED: Report ready and video still in local
-            elif metadata.report != "" and metadata.video_in_local != "":
-                p.state = PracticeState.COMPLETED
-            # ANALYZED: Audio/video analysis done, report pending
-            if metadata.video_done and metadata.audio_done and metadata.report == "":
-                p.state = PracticeState.ANALYZED
-            # IN_PROGRESS: Audio or video analysis in progress
-            elif not (metadata.video_done and metadata.audio_done):
-                p.state = PracticeState.IN_PROGRESS
-            
+            metadata = metadata_by_id.get(p.id)
+            if metadata is None:
+                logger.warning(f"No practice found with id={p.id} for uid={uid}")
+                raise PracticeNotFoundException(practice_id=p.id)
+            self._apply_metadata(p, metadata)
         
-        logger.info(f"Retrieved {len(practices)} practices for user {uid}")
+        logger.debug("Retrieved %s practices for user %s", len(practices), uid)
         
-        # 3. Convert to DTOs and return
-        return [PracticeDTO(id=p.id,
-                            scale=p.scale,
-                            scale_type=p.scale_type,
-                            duration=p.duration,
-                            bpm=p.bpm,
-                            figure=Figure.to_str(p.figure),
-                            octaves=p.octaves,
-                            num_postural_errors=p.num_postural_errors,
-                            num_musical_errors=p.num_musical_errors,
-                            date=p.date,
-                            time=p.time,
-                            state=p.state,
-                            local_video_url=p.local_video_url,
-                            pdf_url=p.pdf_url
-                            ) for p in practices]
+        # 3. Convert to DTOs and return, with the cursor of the next page if this one is full
+        page_limit = limit if limit is not None else PRACTICES_PAGE_LIMIT
+        next_cursor = None
+        if practices and len(practices) >= page_limit:
+            last = practices[-1]
+            next_cursor = encode_cursor(f"{last.date}T{last.time}", last.id)
+
+        return PracticePageDTO(
+            practices=[PracticeDTO(id=p.id,
+                                   scale=p.scale,
+                                   scale_type=p.scale_type,
+                                   duration=p.duration,
+                                   bpm=p.bpm,
+                                   figure=Figure.to_str(p.figure),
+                                   octaves=p.octaves,
+                                   num_postural_errors=p.num_postural_errors,
+                                   num_musical_errors=p.num_musical_errors,
+                                   date=p.date,
+                                   time=p.time,
+                                   state=p.state,
+                                   local_video_url=p.local_video_url,
+                                   pdf_url=p.pdf_url
+                                   ) for p in practices],
+            next_cursor=next_cursor,
+        )
         
     async def get_one(self, uid: str, practice_id: int) -> PracticeDTO:
         """Retrieve practice for a user."""
         
-        logger.info(f"Getting practice for user {uid} with practice id {practice_id}")
-        practice = await self.practice_service.get_practice_by_id(uid, practice_id)
+        logger.debug("Getting practice for user %s with practice id %s", uid, practice_id)
         
-        # 2. Get practice info from MongoDB
-        logger.info(f"Fetching metadata for practice {practice_id}")
-        metadata = await self.practice_metadata_service.get_practice_metadata(uid, practice.id)
-        practice.local_video_url = metadata.video_in_local
-        practice.pdf_url = metadata.report
-
-        # FINISHED: Report ready and video deleted from local
-        if metadata.report != "" and metadata.video_in_local == "":
-            practice.state = PracticeState.FINISHED
-        # COMPLETED: Report ready and video still in local
-        elif metadata.report != "" and metadata.video_in_local != "":
-            practice.state = PracticeState.COMPLETED
-        # ANALYZED: Audio/video analysis done, report pending
-        if metadata.video_done and metadata.audio_done and metadata.report == "":
-            practice.state = PracticeState.ANALYZED
-        # IN_PROGRESS: Audio or video analysis in progress
-        elif not (metadata.video_done and metadata.audio_done):
-            practice.state = PracticeState.IN_PROGRESS
+        # 2. Get practice from MySQL and its info from MongoDB concurrently
+        practice, metadata = await asyncio.gather(
+            self.practice_service.get_practice_by_id(uid, practice_id),
+            self.practice_metadata_service.get_practice_metadata(uid, practice_id),
+            return_exceptions=True,
+        )
+        # MySQL errors take priority: a practice missing in MySQL is reported
+        # as such even if the MongoDB lookup failed too
+        if isinstance(practice, BaseException):
+            raise practice
+        if isinstance(metadata, BaseException):
+            raise metadata
+        self._apply_metadata(practice, metadata)
 
-        logger.info(f"Retrieved practice {practice.id} for user {uid}")
+        logger.debug("Retrieved practice %s for user %s", practice.id, uid)
 
         # 3. Convert to DTOs and return
         return PracticeDTO(id=practice.id,
@@ -104,4 +111,29 @@ class GetUserPracticesUseCase:
                            state=practice.state,
                            local_video_url=practice.local_video_url,
                            pdf_url=practice.pdf_url
-                           )
\ No newline at end of file
+                           )
+
+    def _decode_cursor(self, cursor: str) -> Tuple[datetime, int]:
+        practice_datetime, practice_id = decode_cursor(cursor, size=2)
+        try:
+            return datetime.fromisoformat(practice_datetime), int(practice_id)
+        except (TypeError, ValueError):
+            raise ValidationException("Invalid pagination cursor", details={"cursor": cursor})
+
+    def _apply_metadata(self, practice: Practice, metadata: PracticeMetadata) -> None:
+        """Fill in the MongoDB fields of a practice and derive its state."""
+        practice.local_video_url = metadata.video_in_local
+        practice.pdf_url = metadata.report
+
+        # FINISHED: Report ready and video deleted from local
+        if metadata.report != "" and metadata.video_in_local == "":
+            practice.state = PracticeState.FINISHED
+        # COMPLETED: Report ready and video still in local
+        elif metadata.report != "" and metadata.video_in_local != "":
+            practice.state = PracticeState.COMPLETED
+        # ANALYZED: Audio/video analysis done, report pending
+        if metadata.video_done and metadata.audio_done and metadata.report == "":
+            practice.state = PracticeState.ANALYZED
+        # IN_PROGRESS: Audio or video analysis in progress
+        elif not (metadata.video_done and metadata.audio_done):
+            practice.state = PracticeState.IN_PROGRESS
@@ -14,6 +14,15 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     RELOAD: bool = False
     PRACTICE_SERVICE_PORT: int
+    FAST_JSON_RESPONSES: bool = False  # Serialize DTOs with orjson, skipping response_model validation
+    WORKERS: int = 0  # Production server worker processes, 0 = one per CPU core
+    GRACEFUL_TIMEOUT: int = 30  # Seconds workers get to finish in-flight requests on shutdown
+    WORKER_TIMEOUT: int = 60  # Seconds before a silent worker is killed and replaced
+    KEEPALIVE_TIMEOUT: int = 5  # Seconds an idle keep-alive connection is kept open
+
+    # Startup
+    DB_CONNECT_BASE_DELAY: float = 0.5  # First retry delay, doubled on each failure (with full jitter)
+    DB_CONNECT_MAX_DELAY: float = 10.0
 
     # MySQL
     MYSQL_HOST: str
@@ -21,6 +30,11 @@ class Settings(BaseSettings):
     MYSQL_USER: str
     MYSQL_PASSWORD: str
     MYSQL_DB: str
+    MYSQL_POOL_SIZE: int = 10
+    MYSQL_MAX_OVERFLOW: int = 20
+    MYSQL_POOL_TIMEOUT: float = 10.0  # Seconds to wait for a pooled connection before failing
+    MYSQL_POOL_RECYCLE: int = 300  # Seconds before a connection is replaced
+    MYSQL_POOL_PREWARM: int = 5  # Connections opened at startup (capped at MYSQL_POOL_SIZE)
 
     @property
     def ASYNC_MYSQL_URL(self) -> str:
@@ -42,6 +56,11 @@ class Settings(BaseSettings):
     MONGO_USER: str
     MONGO_PASSWORD: str
     MONGO_DB: str
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 10  # Also the number of connections opened at startup
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 10000  # Milliseconds to wait for a pooled connection before failing
+    MONGO_METADATA_LAYOUT: str = "embedded"  # embedded | collection
+    MONGO_METADATA_COLLECTION: str = "practice_metadata"
 
     @property
     def MONGO_URI(self) -> str:
@@ -50,13 +69,39 @@ class Settings(BaseSettings):
             f"@{self.MONGO_HOST}:{self.MONGO_PORT}/{self.MONGO_DB}"
         )
 
+    # Cache
+    SCALE_CATALOG_REFRESH_SECONDS: float = 300.0
+    METADATA_CACHE_BACKEND: str = "memory"  # none | memory | redis
+    METADATA_CACHE_TTL_SECONDS: float = 5.0
+    METADATA_CACHE_MAX_SIZE: int = 10000
+    REDIS_URL: str = "redis://localhost:6379/0"
+    ERROR_SUMMARY_CACHE_MAX_SIZE: int = 2000  # Memoized summaries of finished practices
+
     # Storage
     HOST_PATH: str
     CONTAINER_PATH: str
+    VIDEO_DELETION_QUEUE_PATH: str = ""  # SQLite file of pending deletions, defaults to CONTAINER_PATH/.video_deletion_queue.db
+    VIDEO_DELETION_CONCURRENCY: int = 2  # Videos deleted at the same time per worker process
+    VIDEO_DELETION_MAX_ATTEMPTS: int = 10  # Failed deletions are retried with backoff up to this many times
+    VIDEO_DELETION_POLL_SECONDS: float = 2.0
 
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    LOG_JSON: bool = False  # One JSON object per line instead of LOG_FORMAT
+    LOG_QUEUE: bool = True  # Format and write records in a background thread
+    LOG_DEBUG_SAMPLING: dict[str, float] = {}  # Logger prefix -> fraction of DEBUG records kept
+
+    # Metrics
+    METRICS_ENABLED: bool = True  # Request/repository histograms served at /metrics
+    INTERNAL_ENDPOINTS_ENABLED: bool = False  # Operator endpoints under /internal (pool statistics)
+
+    # Tracing
+    TRACING_ENABLED: bool = True
+    TRACING_EXPORTER: str = "log"  # none | log
+    TRACING_SERVER_TIMING: bool = True  # Per-span timings in the Server-Timing response header
+    TRACING_SLOW_MS: float = 500.0  # Requests logged with their spans when slower than this
+    TRACING_REPEATED_SPAN_THRESHOLD: int = 5  # Same span this many times in a request is logged as N+1
 
     # CORS
     CORS_ORIGINS: list[str] = ["*"]
@@ -1,15 +1,126 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+import random
 import sys
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import orjson
+
 from app.core.config import settings
+from app.core.tracing import current_trace_id
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "trace_id"}
+# `extra=` keys containing any of these may carry credentials (e.g. a connection URI) and are masked
+_REDACTED_KEY_PARTS = ("password", "passwd", "secret", "token", "credential", "uri", "url", "dsn")
+_REDACTED = "***"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, including `extra=` fields and the trace id.
+
+    Extra fields whose name looks credential-bearing are masked, so a
+    connection string passed as `extra` never reaches the output.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            entry["trace_id"] = trace_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = _REDACTED if _is_sensitive(key) else value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+def _is_sensitive(key: str) -> bool:
+    key = key.lower()
+    return any(part in key for part in _REDACTED_KEY_PARTS)
+
+
+class TraceIdFilter(logging.Filter):
+    """Stamps records with the current trace id. Runs in the caller's thread, where the contextvar is set."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.trace_id = current_trace_id()
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Keeps only a fraction of DEBUG records per module.
+
+    `rates` maps logger name prefixes to the fraction kept (e.g.
+    {"app.infrastructure.repositories": 0.1}); the longest matching prefix
+    wins and unmatched loggers keep everything. Records above DEBUG are
+    never dropped.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._rate_by_logger: Dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._rate_by_logger.get(name)
+        if rate is None:
+            matches = [prefix for prefix in self.rates if name == prefix or name.startswith(prefix + ".")]
+            rate = self.rates[max(matches, key=len)] if matches else 1.0
+            self._rate_by_logger[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
 
 
 def configure_logging():
-    """Configures logging for the application."""
+    """Configures logging for the application.
+
+    With LOG_QUEUE enabled the root logger only has a QueueHandler: records
+    are enqueued by the event loop thread and formatted and written to stdout
+    by a QueueListener thread, so slow writes never block a request.
+    """
+    global _listener
+
+    stream_handler = logging.StreamHandler(sys.stdout)  # stdout para Docker/K8s
+    stream_handler.setFormatter(JsonFormatter() if settings.LOG_JSON else logging.Formatter(settings.LOG_FORMAT))
+
+    handler = stream_handler
+    if settings.LOG_QUEUE:
+        if _listener is not None:
+            _listener.stop()
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        handler = logging.handlers.QueueHandler(log_queue)
+        # Only merges msg % args before enqueueing; the listener's formatter renders the line
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
+
+    # Handler filters run before the record is formatted or enqueued
+    if settings.LOG_DEBUG_SAMPLING:
+        handler.addFilter(DebugSamplingFilter(settings.LOG_DEBUG_SAMPLING))
+    handler.addFilter(TraceIdFilter())
 
     logging.basicConfig(
         level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
-        format=settings.LOG_FORMAT,
-        handlers=[logging.StreamHandler(sys.stdout)],  # stdout para Docker/K8s
+        handlers=[handler],
+        force=True,
     )
 
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -17,4 +128,12 @@ def configure_logging():
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
     logging.getLogger("fastapi").setLevel(logging.WARNING)
-    logging.getLogger("aiomysql").setLevel(logging.WARNING)
\ No newline at end of file
+    logging.getLogger("aiomysql").setLevel(logging.WARNING)
+
+
+def stop_logging():
+    """Flushes the queued records and stops the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,132 @@
+import functools
+import inspect
+import os
+import time
+from contextlib import aclosing
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Label used for requests that did not match any route, so unknown paths cannot blow up cardinality
+UNMATCHED_ROUTE = "unmatched"
+# Same for methods outside the standard set, which any client can send
+HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT"})
+OTHER_METHOD = "other"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status code",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+HTTP_REQUEST_SIZE = Histogram(
+    "http_request_size_bytes",
+    "HTTP request body size (from Content-Length)",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+REPOSITORY_DURATION = Histogram(
+    "repository_operation_duration_seconds",
+    "Latency of repository methods by backend (mysql, mongo, disk)",
+    ["backend", "repository", "method", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+VIDEO_DELETION_QUEUE_DEPTH = Gauge(
+    "video_deletion_queue_depth",
+    "Video deletions waiting in the durable queue",
+    multiprocess_mode="mostrecent",
+)
+VIDEO_DELETION_DURATION = Histogram(
+    "video_deletion_duration_seconds",
+    "Time spent deleting a local video, by outcome (deleted, missing, error)",
+    ["outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Returns the metrics in the Prometheus text format and its content type.
+
+    When PROMETHEUS_MULTIPROC_DIR is set (several worker processes), the
+    samples written by every worker are aggregated.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def _timed_coroutine(fn, ok, error):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException:
+            error.observe(time.perf_counter() - start)
+            raise
+        ok.observe(time.perf_counter() - start)
+        return result
+    return wrapper
+
+
+def _timed_async_generator(fn, ok, error):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        outcome = error
+        try:
+            async with aclosing(fn(*args, **kwargs)) as items:
+                async for item in items:
+                    yield item
+            outcome = ok
+        finally:
+            outcome.observe(time.perf_counter() - start)
+    return wrapper
+
+
+def instrument_repository(backend: str):
+    """Class decorator that records the latency of every public async method.
+
+    Histogram children are bound once per method at decoration time, so a
+    call only pays two `perf_counter()` reads and one `observe()`. Async
+    generators (streams) are timed until they are exhausted or closed.
+    """
+    def decorate(cls):
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_"):
+                continue
+            if inspect.isasyncgenfunction(member):
+                wrap = _timed_async_generator
+            elif inspect.iscoroutinefunction(member):
+                wrap = _timed_coroutine
+            else:
+                continue
+            ok = REPOSITORY_DURATION.labels(backend, cls.__name__, name, "ok")
+            error = REPOSITORY_DURATION.labels(backend, cls.__name__, name, "error")
+            setattr(cls, name, wrap(member, ok, error))
+        return cls
+    return decorate
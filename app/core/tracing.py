@@ -0,0 +1,230 @@
+import functools
+import inspect
+import logging
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import aclosing, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    start: float
+    duration: Optional[float] = None  # Seconds, set when the span ends
+    error: bool = False
+
+
+@dataclass
+class Trace:
+    """All the spans recorded while serving one request."""
+    trace_id: str
+    name: str = ""
+    spans: List[Span] = field(default_factory=list)
+
+    def span_counts(self) -> Dict[str, int]:
+        return Counter(span.name for span in self.spans)
+
+    def repeated_spans(self, min_count: int) -> Dict[str, int]:
+        """Span names recorded at least `min_count` times: the N+1 query pattern."""
+        return {name: count for name, count in self.span_counts().items() if count >= min_count}
+
+    def server_timing(self) -> str:
+        """`Server-Timing` header value with the total duration per span name."""
+        totals: Dict[str, List[float]] = {}
+        for span in self.spans:
+            if span.duration is not None:
+                totals.setdefault(span.name, []).append(span.duration)
+        metrics = []
+        for name, durations in totals.items():
+            metric = f"{name};dur={sum(durations) * 1000:.2f}"
+            if len(durations) > 1:
+                metric += f';desc="x{len(durations)}"'
+            metrics.append(metric)
+        return ", ".join(metrics)
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def new_id(num_bytes: int = 8) -> str:
+    return secrets.token_hex(num_bytes)
+
+
+def current_trace_id() -> Optional[str]:
+    trace = _current_trace.get()
+    return trace.trace_id if trace else None
+
+
+@contextmanager
+def start_trace(trace_id: Optional[str] = None) -> Iterator[Trace]:
+    """Runs the block inside a new trace. Spans opened in it (and in tasks created from it) join the trace."""
+    trace = Trace(trace_id=trace_id or new_id(16))
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(None)
+    try:
+        yield trace
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+class span:
+    """Context manager timing a nested span of the current trace.
+
+    Outside of a trace (scripts, tests calling services directly) it does
+    nothing, so instrumented code never needs to know whether it is traced.
+    """
+
+    __slots__ = ("name", "_span", "_token")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._span = None
+        self._token = None
+
+    def __enter__(self) -> Optional[Span]:
+        trace = _current_trace.get()
+        if trace is None:
+            return None
+        parent = _current_span.get()
+        self._span = Span(
+            name=self.name,
+            span_id=new_id(),
+            parent_id=parent.span_id if parent else None,
+            start=time.perf_counter(),
+        )
+        trace.spans.append(self._span)
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._span is None:
+            return
+        self._span.duration = time.perf_counter() - self._span.start
+        self._span.error = exc_type is not None
+        _current_span.reset(self._token)
+
+
+def _traced_coroutine(fn, name):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        with span(name):
+            return await fn(*args, **kwargs)
+    return wrapper
+
+
+def _traced_async_generator(fn, name):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        # The span stays open across yields, so it is not made current for the consumer's code
+        trace = _current_trace.get()
+        record = None
+        if trace is not None:
+            parent = _current_span.get()
+            record = Span(name=name, span_id=new_id(), parent_id=parent.span_id if parent else None, start=time.perf_counter())
+            trace.spans.append(record)
+        try:
+            async with aclosing(fn(*args, **kwargs)) as items:
+                async for item in items:
+                    yield item
+        except BaseException:
+            if record is not None:
+                record.error = True
+            raise
+        finally:
+            if record is not None:
+                record.duration = time.perf_counter() - record.start
+    return wrapper
+
+
+def traced(cls):
+    """Class decorator opening a `<Class>.<method>` span around every public async method."""
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        span_name = f"{cls.__name__}.{name}"
+        if inspect.isasyncgenfunction(member):
+            setattr(cls, name, _traced_async_generator(member, span_name))
+        elif inspect.iscoroutinefunction(member):
+            setattr(cls, name, _traced_coroutine(member, span_name))
+    return cls
+
+
+class SpanExporter(ABC):
+    """Receives every finished trace."""
+
+    @abstractmethod
+    def export(self, trace: Trace) -> None:
+        pass
+
+
+class NoopSpanExporter(SpanExporter):
+    def export(self, trace: Trace) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished traces in memory, for tests."""
+
+    def __init__(self):
+        self.traces: List[Trace] = []
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        with self._lock:
+            self.traces.append(trace)
+
+    def clear(self):
+        with self._lock:
+            self.traces.clear()
+
+
+class LoggingSpanExporter(SpanExporter):
+    """Logs slow traces and traces repeating the same span (N+1 patterns)."""
+
+    def __init__(self, slow_ms: float = 500.0, repeated_span_threshold: int = 5):
+        self.slow_ms = slow_ms
+        self.repeated_span_threshold = repeated_span_threshold
+
+    def export(self, trace: Trace) -> None:
+        repeated = trace.repeated_spans(self.repeated_span_threshold)
+        if repeated:
+            logger.warning(f"Trace {trace.trace_id} ({trace.name}) repeats spans {repeated}")
+
+        root = trace.spans[0] if trace.spans else None
+        if root is not None and root.duration is not None and root.duration * 1000 >= self.slow_ms:
+            logger.warning(f"Slow trace {trace.trace_id} ({trace.name}): {trace.server_timing()}")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Trace %s (%s): %s", trace.trace_id, trace.name, trace.server_timing())
+
+
+class Tracer:
+    """Holds the exporter that finished traces are sent to."""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        self.exporter = exporter or NoopSpanExporter()
+
+    def set_exporter(self, exporter: SpanExporter):
+        self.exporter = exporter
+
+    def export(self, trace: Trace):
+        try:
+            self.exporter.export(trace)
+        except Exception as e:
+            # Tracing must never fail a request
+            logger.error(f"Error exporting trace {trace.trace_id}: {e}", exc_info=True)
+
+
+# Global instance
+tracer = Tracer()
@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class NoteErrorCount:
+    note_correct: str
+    note_played: str
+    count: int
+
+
+@dataclass
+class TimeBucketCount:
+    start_sec: int
+    count: int
+
+
+@dataclass
+class MusicalErrorSummary:
+    bucket_sec: int
+    total: int = 0
+    by_note: List[NoteErrorCount] = field(default_factory=list)
+    by_time: List[TimeBucketCount] = field(default_factory=list)
+
+
+@dataclass
+class ExplicationSummary:
+    explication: str
+    count: int
+    duration_sec: int
+
+
+@dataclass
+class PosturalErrorSummary:
+    total: int = 0
+    total_duration_sec: int = 0
+    by_explication: List[ExplicationSummary] = field(default_factory=list)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 @dataclass
 class MusicalError:
@@ -6,4 +7,5 @@ class MusicalError:
     min_sec: str
     note_played: str
     note_correct: str
-    id_practice: int
\ No newline at end of file
+    id_practice: int
+    seconds: Optional[int] = None
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 @dataclass
 class PosturalError:
@@ -6,4 +7,5 @@ class PosturalError:
     min_sec_init: str
     min_sec_end: str
     explication: str
-    id_practice: int
\ No newline at end of file
+    id_practice: int
+    seconds: Optional[int] = None
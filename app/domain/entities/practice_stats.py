@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List
+
+
+@dataclass
+class PracticeStatsTotals:
+    num_practices: int = 0
+    total_duration: float = 0
+    total_bpm: float = 0
+    total_postural_errors: int = 0
+    total_musical_errors: int = 0
+
+    @property
+    def avg_bpm(self) -> float:
+        return self.total_bpm / self.num_practices if self.num_practices else 0.0
+
+    @property
+    def postural_errors_per_min(self) -> float:
+        return self.total_postural_errors * 60 / self.total_duration if self.total_duration else 0.0
+
+    @property
+    def musical_errors_per_min(self) -> float:
+        return self.total_musical_errors * 60 / self.total_duration if self.total_duration else 0.0
+
+
+@dataclass
+class ScaleStats(PracticeStatsTotals):
+    id_scale: int = 0
+    scale: str = ""
+    scale_type: str = ""
+
+
+@dataclass
+class WeekStats(PracticeStatsTotals):
+    week_start: date = date.min
+
+
+@dataclass
+class PracticeStats:
+    totals: PracticeStatsTotals = field(default_factory=PracticeStatsTotals)
+    by_scale: List[ScaleStats] = field(default_factory=list)
+    by_week: List[WeekStats] = field(default_factory=list)
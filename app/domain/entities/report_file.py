@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ReportFile:
+    path: str
+    size: int
+    modified_ns: int
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class VideoDeletionJob:
+    id: int
+    uid: str
+    practice_id: int
+    attempts: int
+    lease_token: str  # Identifies the claim; completing or failing a lease that expired is a no-op
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class ICacheRepository(ABC):
+    """Abstract key/value cache. A ttl of None keeps the entry until it is evicted or deleted."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def set_many(self, values: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
\ No newline at end of file
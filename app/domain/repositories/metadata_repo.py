@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Dict, List
 
 from app.domain.entities.practice_metadata import PracticeMetadata
 
@@ -10,6 +11,15 @@ class IMetaDataRepository(ABC):
     async def get_practice_metadata(self, uid: str, practice_id: int) -> PracticeMetadata:
         pass
     
+    @abstractmethod
+    async def get_practices_metadata(self, uid: str, practice_ids: List[int]) -> Dict[int, PracticeMetadata]:
+        pass
+    
     @abstractmethod
     async def finish_practice(self, uid: str, practice_id: int) -> PracticeMetadata:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def finish_practices(self, uid: str, practice_ids: List[int]) -> Dict[int, PracticeMetadata]:
+        """Finishes several practices at once. Returns the updated metadata of the ones that exist."""
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
+from app.domain.entities.error_summary import MusicalErrorSummary
 from app.domain.entities.musical_error import MusicalError
 
 
@@ -8,4 +9,31 @@ class IMusicalErrorRepository(ABC):
     
     @abstractmethod
     async def get_musical_errors_by_practice_id(self, practice_id: int) -> List[MusicalError]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_musical_errors_by_practice_ids(self, practice_ids: List[int]) -> Dict[int, List[MusicalError]]:
+        """Errors of several practices in one query, grouped by practice id (empty list when none)."""
+        pass
+
+    @abstractmethod
+    def stream_musical_errors_by_practice_id(self, practice_id: int) -> AsyncIterator[MusicalError]:
+        """Yields the errors as the rows arrive. Raises MusicalErrorNotFoundException before the first item when there are none."""
+        pass
+
+    @abstractmethod
+    async def get_musical_errors_page(
+        self,
+        practice_id: int,
+        limit: int,
+        cursor: Optional[Tuple[int, int]] = None,
+        from_sec: Optional[int] = None,
+        to_sec: Optional[int] = None,
+    ) -> List[MusicalError]:
+        """Up to `limit` errors ordered by (seconds, id), after the `cursor` (seconds, id) and within [from_sec, to_sec]."""
+        pass
+
+    @abstractmethod
+    async def get_musical_error_summary(self, practice_id: int, bucket_sec: int) -> MusicalErrorSummary:
+        """Error counts by (note_correct, note_played) pair and by time bucket of `bucket_sec` seconds."""
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+from app.domain.entities.error_summary import PosturalErrorSummary
 from app.domain.entities.postural_error import PosturalError
 
 
@@ -8,4 +9,26 @@ class IPosturalErrorRepository(ABC):
     
     @abstractmethod
     async def get_postural_errors_by_practice_id(self, practice_id: int) -> List[PosturalError]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_postural_errors_by_practice_ids(self, practice_ids: List[int]) -> Dict[int, List[PosturalError]]:
+        """Errors of several practices in one query, grouped by practice id (empty list when none)."""
+        pass
+
+    @abstractmethod
+    async def get_postural_errors_page(
+        self,
+        practice_id: int,
+        limit: int,
+        cursor: Optional[Tuple[int, int]] = None,
+        from_sec: Optional[int] = None,
+        to_sec: Optional[int] = None,
+    ) -> List[PosturalError]:
+        """Up to `limit` errors ordered by (seconds, id), after the `cursor` (seconds, id) and within [from_sec, to_sec]."""
+        pass
+
+    @abstractmethod
+    async def get_postural_error_summary(self, practice_id: int) -> PosturalErrorSummary:
+        """Error counts and total duration, overall and by explication."""
+        pass
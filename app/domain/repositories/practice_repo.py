@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime
+from typing import List, Optional, Tuple
 
 from app.domain.entities.practice import Practice
 
@@ -8,9 +8,20 @@ from app.domain.entities.practice import Practice
 class IPracticeRepository(ABC): 
     
     @abstractmethod
-    async def get_practices_for_user(self, uid: str, last_id: Optional[int] = None, limit: Optional[int] = None) -> List[Practice]:
+    async def get_practices_for_user(
+        self,
+        uid: str,
+        last_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Practice]:
         pass
     
     @abstractmethod
     async def get_practice_by_id(self, uid: str, practice_id: int) -> Practice:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_practice_owner(self, practice_id: int) -> str:
+        """Returns the uid of the student that owns the practice."""
+        pass
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+
+from app.domain.entities.practice_stats import PracticeStats
+
+
+class IPracticeStatsRepository(ABC):
+
+    @abstractmethod
+    async def refresh_user_stats(self, uid: str) -> int:
+        """Folds the practices newer than the user's watermark into the rollup. Returns how many were added."""
+        pass
+
+    @abstractmethod
+    async def rebuild_user_stats(self, uid: str) -> int:
+        """Drops the user's rollup and recomputes it from all practices. Returns how many were added."""
+        pass
+
+    @abstractmethod
+    async def get_user_stats(self, uid: str, weeks: int) -> PracticeStats:
+        """Aggregates read from the rollup: totals, per scale and for the last `weeks` weeks with practices."""
+        pass
@@ -1,7 +1,14 @@
 from abc import ABC, abstractmethod
 
+from app.domain.entities.report_file import ReportFile
+
 
 class IReportRepository(ABC):
     @abstractmethod
     async def get_pdf(self, uid: str, practice_id: int) -> bytes:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_pdf_file(self, uid: str, practice_id: int) -> ReportFile:
+        """Returns where the PDF lives and its size/mtime, without reading it."""
+        pass
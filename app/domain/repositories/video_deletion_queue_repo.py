@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.domain.entities.video_deletion_job import VideoDeletionJob
+
+
+class IVideoDeletionQueue(ABC):
+    """Durable queue of local videos waiting to be deleted.
+
+    Claimed jobs are leased: if they are neither completed nor failed before
+    the lease expires (e.g. the process died), they are handed out again,
+    and completing or failing the expired claim afterwards has no effect.
+    """
+
+    @abstractmethod
+    async def enqueue(self, uid: str, practice_id: int) -> None:
+        pass
+
+    @abstractmethod
+    async def enqueue_many(self, uid: str, practice_ids: List[int]) -> None:
+        pass
+
+    @abstractmethod
+    async def claim(self, limit: int) -> List[VideoDeletionJob]:
+        pass
+
+    @abstractmethod
+    async def complete(self, job: VideoDeletionJob) -> None:
+        pass
+
+    @abstractmethod
+    async def fail(self, job: VideoDeletionJob, error: str) -> None:
+        pass
+
+    @abstractmethod
+    async def depth(self) -> int:
+        pass
@@ -1,15 +1,41 @@
 import logging
-from typing import List
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from app.core.tracing import traced
+from app.domain.entities.error_summary import MusicalErrorSummary
 from app.domain.entities.musical_error import MusicalError
 from app.domain.repositories.musical_errror_repo import IMusicalErrorRepository
 
 
 logger = logging.getLogger(__name__)
 
+@traced
 class MusicalErrorService:
     def __init__(self, musical_error_repo: IMusicalErrorRepository):
         self.musical_error_repo = musical_error_repo
 
     async def get_musical_errors_by_practice(self, practice_id: int) -> List[MusicalError]:
-        logger.debug(f"Fetching musical errors for practice ID: {practice_id}")
-        return await self.musical_error_repo.get_musical_errors_by_practice_id(practice_id)
\ No newline at end of file
+        logger.debug("Fetching musical errors for practice ID: %s", practice_id)
+        return await self.musical_error_repo.get_musical_errors_by_practice_id(practice_id)
+
+    async def get_musical_errors_by_practices(self, practice_ids: List[int]) -> Dict[int, List[MusicalError]]:
+        logger.debug("Fetching musical errors for %s practices", len(practice_ids))
+        return await self.musical_error_repo.get_musical_errors_by_practice_ids(practice_ids)
+
+    def stream_musical_errors_by_practice(self, practice_id: int) -> AsyncIterator[MusicalError]:
+        logger.debug("Streaming musical errors for practice ID: %s", practice_id)
+        return self.musical_error_repo.stream_musical_errors_by_practice_id(practice_id)
+
+    async def get_musical_errors_page(
+        self,
+        practice_id: int,
+        limit: int,
+        cursor: Optional[Tuple[int, int]] = None,
+        from_sec: Optional[int] = None,
+        to_sec: Optional[int] = None,
+    ) -> List[MusicalError]:
+        logger.debug("Fetching musical errors page for practice ID: %s (limit=%s, cursor=%s, window=%s-%s)", practice_id, limit, cursor, from_sec, to_sec)
+        return await self.musical_error_repo.get_musical_errors_page(practice_id, limit, cursor, from_sec, to_sec)
+
+    async def get_musical_error_summary(self, practice_id: int, bucket_sec: int) -> MusicalErrorSummary:
+        logger.debug("Aggregating musical errors for practice ID: %s in %ss buckets", practice_id, bucket_sec)
+        return await self.musical_error_repo.get_musical_error_summary(practice_id, bucket_sec)
@@ -1,16 +1,38 @@
 import logging
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+from app.core.tracing import traced
+from app.domain.entities.error_summary import PosturalErrorSummary
 from app.domain.entities.postural_error import PosturalError
 from app.domain.repositories.postural_error_repo import IPosturalErrorRepository
 
 
 logger = logging.getLogger(__name__)
 
+@traced
 class PosturalErrorService:
     def __init__(self, postural_error_repo: IPosturalErrorRepository):
         self.postural_error_repo = postural_error_repo
 
     async def get_postural_errors_by_practice_id(self, practice_id: int) -> List[PosturalError]:
-        logger.debug(f"Fetching postural errors for practice ID: {practice_id}")
-        return await self.postural_error_repo.get_postural_errors_by_practice_id(practice_id)
\ No newline at end of file
+        logger.debug("Fetching postural errors for practice ID: %s", practice_id)
+        return await self.postural_error_repo.get_postural_errors_by_practice_id(practice_id)
+
+    async def get_postural_errors_by_practice_ids(self, practice_ids: List[int]) -> Dict[int, List[PosturalError]]:
+        logger.debug("Fetching postural errors for %s practices", len(practice_ids))
+        return await self.postural_error_repo.get_postural_errors_by_practice_ids(practice_ids)
+
+    async def get_postural_errors_page(
+        self,
+        practice_id: int,
+        limit: int,
+        cursor: Optional[Tuple[int, int]] = None,
+        from_sec: Optional[int] = None,
+        to_sec: Optional[int] = None,
+    ) -> List[PosturalError]:
+        logger.debug("Fetching postural errors page for practice ID: %s (limit=%s, cursor=%s, window=%s-%s)", practice_id, limit, cursor, from_sec, to_sec)
+        return await self.postural_error_repo.get_postural_errors_page(practice_id, limit, cursor, from_sec, to_sec)
+
+    async def get_postural_error_summary(self, practice_id: int) -> PosturalErrorSummary:
+        logger.debug("Aggregating postural errors for practice ID: %s", practice_id)
+        return await self.postural_error_repo.get_postural_error_summary(practice_id)
@@ -1,20 +1,84 @@
+import asyncio
 import logging
+from typing import Dict, List, Optional
+
+from app.core.tracing import traced
 from app.domain.entities.practice import Practice
 from app.domain.entities.practice_metadata import PracticeMetadata
+from app.domain.repositories.cache_repo import ICacheRepository
 from app.domain.repositories.metadata_repo import IMetaDataRepository
 
 logger = logging.getLogger(__name__)
 
+@traced
 class PracticeMetadataService:
-    """Service for managing practice metadata."""
+    """Service for managing practice metadata.
+
+    When a cache is given, reads go through it. Entries of practices still in
+    progress expire after `cache_ttl` seconds, because their flags are flipped
+    by other services. Finished practices (report ready, local video deleted)
+    no longer change and are cached without expiration.
+    """
 
-    def __init__(self, metadata_repository: IMetaDataRepository):
+    def __init__(self, metadata_repository: IMetaDataRepository, cache: Optional[ICacheRepository] = None, cache_ttl: float = 5.0):
         self.metadata_repository = metadata_repository
-        
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+
     async def get_practice_metadata(self, uid: str, practice_id: int) -> PracticeMetadata:
-        logger.debug(f"Service fetching metadata for uid={uid}, practice_id={practice_id}")
-        return await self.metadata_repository.get_practice_metadata(uid, practice_id)
-    
+        logger.debug("Service fetching metadata for uid=%s, practice_id=%s", uid, practice_id)
+        if self.cache is None:
+            return await self.metadata_repository.get_practice_metadata(uid, practice_id)
+
+        key = self._cache_key(uid, practice_id)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        metadata = await self.metadata_repository.get_practice_metadata(uid, practice_id)
+        await self.cache.set(key, metadata, self._cache_ttl_for(metadata))
+        return metadata
+
+    async def get_practices_metadata(self, uid: str, practice_ids: List[int]) -> Dict[int, PracticeMetadata]:
+        logger.debug("Service fetching metadata for uid=%s, %s practices", uid, len(practice_ids))
+        if self.cache is None:
+            return await self.metadata_repository.get_practices_metadata(uid, practice_ids)
+
+        cached = await self.cache.get_many([self._cache_key(uid, practice_id) for practice_id in practice_ids])
+        metadata = {m.id_practice: m for m in cached.values()}
+
+        missing_ids = [practice_id for practice_id in practice_ids if practice_id not in metadata]
+        if missing_ids:
+            fetched = await self.metadata_repository.get_practices_metadata(uid, missing_ids)
+            metadata.update(fetched)
+
+            finished = {self._cache_key(uid, m.id_practice): m for m in fetched.values() if self.is_finished(m)}
+            pending = {self._cache_key(uid, m.id_practice): m for m in fetched.values() if not self.is_finished(m)}
+            await self.cache.set_many(finished, None)
+            await self.cache.set_many(pending, self.cache_ttl)
+
+        return metadata
+
     async def finish_practice(self, uid: str, practice_id: int) -> PracticeMetadata:
-        logger.debug(f"Service finishing practice for uid={uid}, practice_id={practice_id}")
-        return await self.metadata_repository.finish_practice(uid, practice_id)
\ No newline at end of file
+        logger.debug("Service finishing practice for uid=%s, practice_id=%s", uid, practice_id)
+        metadata = await self.metadata_repository.finish_practice(uid, practice_id)
+        if self.cache is not None:
+            await self.cache.delete(self._cache_key(uid, practice_id))
+        return metadata
+
+    async def finish_practices(self, uid: str, practice_ids: List[int]) -> Dict[int, PracticeMetadata]:
+        logger.debug("Service finishing %s practices for uid=%s", len(practice_ids), uid)
+        metadata = await self.metadata_repository.finish_practices(uid, practice_ids)
+        if self.cache is not None:
+            await asyncio.gather(*(self.cache.delete(self._cache_key(uid, practice_id)) for practice_id in practice_ids))
+        return metadata
+
+    def _cache_key(self, uid: str, practice_id: int) -> str:
+        return f"practice_metadata:{uid}:{practice_id}"
+
+    def _cache_ttl_for(self, metadata: PracticeMetadata) -> Optional[float]:
+        return None if self.is_finished(metadata) else self.cache_ttl
+
+    def is_finished(self, metadata: PracticeMetadata) -> bool:
+        # Terminal state: report ready and video deleted from local
+        return bool(metadata.report) and not metadata.video_in_local
@@ -0,0 +1,20 @@
+import logging
+
+from app.core.tracing import traced
+from app.domain.entities.practice_stats import PracticeStats
+from app.domain.repositories.practice_stats_repo import IPracticeStatsRepository
+
+logger = logging.getLogger(__name__)
+
+@traced
+class PracticeStatsService:
+    """Service for the per-user practice statistics."""
+
+    def __init__(self, stats_repository: IPracticeStatsRepository):
+        self.stats_repository = stats_repository
+
+    async def get_user_stats(self, uid: str, weeks: int) -> PracticeStats:
+        # Bring the rollup up to date with the newest practices before reading it
+        added = await self.stats_repository.refresh_user_stats(uid)
+        logger.debug("Service refreshed stats for uid=%s with %s new practices", uid, added)
+        return await self.stats_repository.get_user_stats(uid, weeks)
@@ -1,15 +1,22 @@
 import logging
 
+from app.core.tracing import traced
+from app.domain.entities.report_file import ReportFile
 from app.domain.repositories.report_repo import IReportRepository
 
 
 logger = logging.getLogger(__name__)
 
+@traced
 class ReportService:
 
     def __init__(self, report_repository: IReportRepository):
         self.report_repository = report_repository
 
     async def get_report(self, uid: str, practice_id: int) -> bytes:
-        logger.info(f"Service getting report for user {uid}, practice_id={practice_id}")
-        return await self.report_repository.get_pdf(uid, practice_id)
\ No newline at end of file
+        logger.debug("Service getting report for user %s, practice_id=%s", uid, practice_id)
+        return await self.report_repository.get_pdf(uid, practice_id)
+
+    async def get_report_file(self, uid: str, practice_id: int) -> ReportFile:
+        logger.debug("Service locating report file for user %s, practice_id=%s", uid, practice_id)
+        return await self.report_repository.get_pdf_file(uid, practice_id)
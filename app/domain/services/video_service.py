@@ -1,17 +1,46 @@
+import asyncio
 import logging
+from typing import List, Optional
+
+from app.core.tracing import traced
+from app.domain.repositories.video_deletion_queue_repo import IVideoDeletionQueue
 from app.domain.repositories.video_repo import ILocalVideoRepository
 
 logger = logging.getLogger(__name__)
 
+@traced
 class VideoService:
-    def __init__(self, video_repository: ILocalVideoRepository):
+    def __init__(self, video_repository: ILocalVideoRepository, deletion_queue: Optional[IVideoDeletionQueue] = None):
         self.video_repository = video_repository
+        self.deletion_queue = deletion_queue
 
     async def delete_video(self, uid: str, practice_id: int) -> bool:
-        logger.info(f"Deleting video for user {uid}, practice {practice_id}")
+        logger.info("Deleting video for user %s, practice %s", uid, practice_id)
         success = await self.video_repository.delete_video(uid, practice_id)
         if success:
-            logger.info(f"Successfully deleted video for user {uid}, practice {practice_id}")
+            logger.info("Successfully deleted video for user %s, practice %s", uid, practice_id)
         else:
             logger.warning(f"Failed to delete video for user {uid}, practice {practice_id}")
-        return success
\ No newline at end of file
+        return success
+
+    async def schedule_video_deletion(self, uid: str, practice_id: int) -> None:
+        """Queues the deletion for the background worker, or deletes right away when there is no queue."""
+        if self.deletion_queue is None:
+            await self.delete_video(uid, practice_id)
+            return
+        await self.deletion_queue.enqueue(uid, practice_id)
+        logger.info("Scheduled video deletion for user %s, practice %s", uid, practice_id)
+
+    async def schedule_video_deletions(self, uid: str, practice_ids: List[int]) -> None:
+        """Queues several deletions at once, or deletes the videos concurrently when there is no queue."""
+        if self.deletion_queue is None:
+            results = await asyncio.gather(
+                *(self.delete_video(uid, practice_id) for practice_id in practice_ids),
+                return_exceptions=True,
+            )
+            for practice_id, result in zip(practice_ids, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to delete video for user {uid}, practice {practice_id}: {result}")
+            return
+        await self.deletion_queue.enqueue_many(uid, practice_ids)
+        logger.info("Scheduled video deletion for user %s, %s practices", uid, len(practice_ids))
@@ -0,0 +1,71 @@
+import json
+import logging
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.repositories.cache_repo import ICacheRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache(ICacheRepository):
+    """Cache backed by any Redis-protocol server, storing dataclass entities as JSON.
+
+    Per-key TTLs map to PX expirations. LRU eviction and the size bound are
+    delegated to the server (`maxmemory` with `allkeys-lru` or `volatile-lru`).
+    Redis failures are logged and treated as cache misses so requests fall
+    back to the database.
+    """
+
+    def __init__(self, client: Redis, entity_type: type, key_prefix: str = "practice-service:"):
+        self.client = client
+        self.entity_type = entity_type
+        self.key_prefix = key_prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = await self.client.get(self.key_prefix + key)
+        except RedisError as e:
+            logger.warning(f"Redis cache get failed for key={key}: {e}")
+            return None
+        return self._decode(raw) if raw is not None else None
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if not keys:
+            return {}
+        try:
+            raws = await self.client.mget([self.key_prefix + key for key in keys])
+        except RedisError as e:
+            logger.warning(f"Redis cache mget failed for {len(keys)} keys: {e}")
+            return {}
+        return {key: self._decode(raw) for key, raw in zip(keys, raws) if raw is not None}
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self.set_many({key: value}, ttl)
+
+    async def set_many(self, values: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        if not values:
+            return
+        px = max(1, int(ttl * 1000)) if ttl is not None else None
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.set(self.key_prefix + key, self._encode(value), px=px)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Redis cache set failed for {len(values)} keys: {e}")
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.client.delete(self.key_prefix + key)
+        except RedisError as e:
+            logger.warning(f"Redis cache delete failed for key={key}: {e}")
+
+    def _encode(self, value: Any) -> str:
+        return json.dumps(asdict(value))
+
+    def _decode(self, raw: str | bytes) -> Any:
+        return self.entity_type(**json.loads(raw))
@@ -1,3 +1,11 @@
 from sqlalchemy.orm import declarative_base
 
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+def mm_ss_to_seconds(column: str) -> str:
+    """SQL expression turning an 'mm:ss' string column into seconds.
+
+    Uses only SUBSTR/INSTR and implicit string-to-number arithmetic, which
+    MySQL and SQLite evaluate the same way.
+    """
+    return f"SUBSTR({column}, 1, INSTR({column}, ':') - 1) * 60 + SUBSTR({column}, INSTR({column}, ':') + 1)"
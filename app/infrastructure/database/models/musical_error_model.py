@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, UniqueConstraint
+from sqlalchemy import Column, Computed, Index, Integer, String, UniqueConstraint
 
-from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.base import Base, mm_ss_to_seconds
 
 class MusicalErrorModel(Base):
     __tablename__ = "MusicalError"
@@ -11,10 +11,14 @@ class MusicalErrorModel(Base):
     note_played = Column(String(10), nullable=True)
     note_correct = Column(String(10), nullable=True)
     id_practice = Column(Integer, nullable=False)
+    # Generated from min_sec, indexed with id_practice for time-window queries
+    seconds = Column(Integer, Computed(mm_ss_to_seconds("min_sec"), persisted=False))
     
     __table_args__ = (
         UniqueConstraint(
             "min_sec", "note_played", "note_correct", "id_practice",
             name="uq_musical_error"
         ),
+        Index("ix_musical_error_practice", "id_practice"),
+        Index("ix_musical_error_practice_seconds", "id_practice", "seconds"),
     )
\ No newline at end of file
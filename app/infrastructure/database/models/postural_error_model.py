@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, UniqueConstraint
+from sqlalchemy import Column, Computed, Index, Integer, String, UniqueConstraint
 
-from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.base import Base, mm_ss_to_seconds
 
 
 class PosturalErrorModel(Base):
@@ -12,7 +12,11 @@ class PosturalErrorModel(Base):
     frame = Column(Integer, nullable=False)
     explication = Column(String(500), nullable=True)
     id_practice = Column(Integer, nullable=False)
+    # Generated from min_sec_init, indexed with id_practice for time-window queries
+    seconds = Column(Integer, Computed(mm_ss_to_seconds("min_sec_init"), persisted=False))
     
     __table_args__ = (
         UniqueConstraint("min_sec_init", "min_sec_end", "explication", "id_practice", name="uq_postural_error"),
+        Index("ix_postural_error_practice", "id_practice"),
+        Index("ix_postural_error_practice_seconds", "id_practice", "seconds"),
     )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.database.models.base import Base
@@ -22,3 +22,8 @@ class PracticeModel(Base):
 
     scale = relationship(ScaleModel, back_populates="practices")
 
+    __table_args__ = (
+        # Keyset pagination of a student's practices (scripts/migrations/001_practice_keyset_index.sql)
+        Index("ix_practice_student_datetime_id", id_student, practice_datetime.desc(), id.desc()),
+    )
+
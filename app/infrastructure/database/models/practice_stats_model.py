@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Date, DateTime, Integer, Numeric, String
+
+from app.infrastructure.database.models.base import Base
+
+
+class PracticeStatsRollupModel(Base):
+    """Running totals of a student's practices per scale and week (scripts/migrations/004_practice_stats_rollup.sql)"""
+    __tablename__ = "PracticeStatsRollup"
+
+    id_student = Column(String(128), primary_key=True)
+    id_scale = Column(Integer, primary_key=True)
+    week_start = Column(Date, primary_key=True)  # Monday of the week
+    num_practices = Column(Integer, nullable=False, default=0)
+    total_duration = Column(Numeric(14, 2), nullable=False, default=0)
+    total_bpm = Column(Numeric(14, 2), nullable=False, default=0)
+    total_postural_errors = Column(Integer, nullable=False, default=0)
+    total_musical_errors = Column(Integer, nullable=False, default=0)
+
+
+class PracticeStatsWatermarkModel(Base):
+    """Newest practice id of each student already folded into PracticeStatsRollup"""
+    __tablename__ = "PracticeStatsWatermark"
+
+    id_student = Column(String(128), primary_key=True)
+    last_practice_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+
+class PracticeStatsPendingModel(Base):
+    """Practices behind the watermark whose analysis was still pending (NULL error counts) when it passed them"""
+    __tablename__ = "PracticeStatsPending"
+
+    id_student = Column(String(128), primary_key=True)
+    id_practice = Column(Integer, primary_key=True)
@@ -1,7 +1,11 @@
-import os
+import asyncio
 import logging
+from typing import Dict
 from motor.motor_asyncio import AsyncIOMotorClient
 
+from app.core.config import settings
+from app.infrastructure.database.pool_metrics import MongoPoolListener
+
 logger = logging.getLogger(__name__)
 
 
@@ -9,27 +13,25 @@ class MongoConnection:
     """MongoDB connection singleton"""
 
     def __init__(self):
-        mongo_user = os.getenv("MONGO_USER")
-        mongo_password = os.getenv("MONGO_PASSWORD")
-        mongo_host = os.getenv("MONGO_HOST", "localhost")
-        mongo_port = os.getenv("MONGO_PORT", "27017")
-        mongo_db = os.getenv("MONGO_DB", "keyfairy")
-
-        # Build the MongoDB URI
-        self.mongo_uri = f"mongodb://{mongo_user}:{mongo_password}@{mongo_host}:{mongo_port}/{mongo_db}"
-        self.mongo_db_name = mongo_db
+        self.mongo_uri = settings.MONGO_URI
+        self.mongo_db_name = settings.MONGO_DB
         self.client: AsyncIOMotorClient | None = None
         self.db = None
+        self.pool_listener = MongoPoolListener()
 
     def connect(self):
         if self.client is None:
             try:
-                self.client = AsyncIOMotorClient(self.mongo_uri)
-                self.db = self.client[self.mongo_db_name]
-                logger.info(
-                    "MongoDB connection established",
-                    extra={"db_name": self.mongo_db_name, "uri": self.mongo_uri},
+                self.client = AsyncIOMotorClient(
+                    self.mongo_uri,
+                    maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+                    minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                    waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+                    event_listeners=[self.pool_listener],
                 )
+                self.db = self.client[self.mongo_db_name]
+                # The URI carries the credentials: never log it
+                logger.info("MongoDB connection established", extra={"db_name": self.mongo_db_name})
             except Exception as e:
                 logger.exception("Error connecting to MongoDB")
                 raise RuntimeError(f"Failed to connect to MongoDB: {str(e)}")
@@ -46,6 +48,25 @@ class MongoConnection:
             logger.error(f"❌ MongoDB connection verification failed: {e}")
             raise
 
+    async def prewarm(self, size: int):
+        """Runs `size` concurrent pings so the pool opens that many connections up front.
+
+        minPoolSize alone fills the pool from a background thread, after the
+        first requests may already have arrived.
+        """
+        if size <= 0:
+            return
+        await asyncio.gather(*(self.client.admin.command("ping") for _ in range(size)))
+        logger.info(f"MongoDB pool prewarmed with {size} connections")
+
+    def pool_stats(self) -> Dict:
+        """Live statistics of the connection pools, aggregated over all servers."""
+        return {
+            **self.pool_listener.stats(),
+            "max_pool_size": settings.MONGO_MAX_POOL_SIZE,
+            "min_pool_size": settings.MONGO_MIN_POOL_SIZE,
+        }
+
     async def close(self):
         if self.client:
             self.client.close()
@@ -1,24 +1,23 @@
-import os
+import asyncio
 import logging
+from contextlib import AsyncExitStack
+from typing import Dict
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
+from app.core.config import settings
+from app.infrastructure.database.pool_metrics import InstrumentedAsyncAdaptedQueuePool
+
 logger = logging.getLogger(__name__)
 
 class DatabaseConnection:
     """MySQL async connection manager using SQLAlchemy"""
 
     def __init__(self):
-        self.mysql_host = os.getenv("MYSQL_HOST", "localhost")
-        self.mysql_port = os.getenv("MYSQL_PORT", "3306")
-        self.mysql_user = os.getenv("MYSQL_USER", "root")
-        self.mysql_password = os.getenv("MYSQL_PASSWORD", "")
-        self.mysql_db = os.getenv("MYSQL_DB", "music_db")
-
-        self.async_database_url = (
-            f"mysql+aiomysql://{self.mysql_user}:{self.mysql_password}"
-            f"@{self.mysql_host}:{self.mysql_port}/{self.mysql_db}"
-        )
+        self.mysql_host = settings.MYSQL_HOST
+        self.mysql_port = settings.MYSQL_PORT
+        self.mysql_db = settings.MYSQL_DB
+        self.async_database_url = settings.ASYNC_MYSQL_URL
 
         self.async_engine = None
         self.async_session_factory: async_sessionmaker[AsyncSession] | None = None
@@ -30,11 +29,12 @@ class DatabaseConnection:
                 self.async_engine = create_async_engine(
                     self.async_database_url,
                     echo=False,
+                    poolclass=InstrumentedAsyncAdaptedQueuePool,  # Exposes waiters and checkout wait times
                     pool_pre_ping=True,
-                    pool_recycle=300,  # Reciclar conexiones cada 5 minutos
-                    pool_size=5,       # Máximo 5 conexiones en el pool
-                    max_overflow=10,   # Máximo 10 conexiones adicionales
-                    pool_timeout=30,   # Timeout para obtener conexión del pool
+                    pool_recycle=settings.MYSQL_POOL_RECYCLE,
+                    pool_size=settings.MYSQL_POOL_SIZE,
+                    max_overflow=settings.MYSQL_MAX_OVERFLOW,
+                    pool_timeout=settings.MYSQL_POOL_TIMEOUT,
                     isolation_level="READ_COMMITTED",  # Nivel de aislamiento consistente
                 )
                 self.async_session_factory = async_sessionmaker(
@@ -42,7 +42,11 @@ class DatabaseConnection:
                     class_=AsyncSession,
                     expire_on_commit=False,
                 )
-                logger.info("Async database engine created successfully")
+                logger.info(
+                    f"Async database engine created successfully "
+                    f"(pool_size={settings.MYSQL_POOL_SIZE}, max_overflow={settings.MYSQL_MAX_OVERFLOW}, "
+                    f"pool_timeout={settings.MYSQL_POOL_TIMEOUT}s)"
+                )
             except Exception as e:
                 logger.error("Error creating async database engine", exc_info=True)
                 raise RuntimeError(f"Failed to create database connection: {e}")
@@ -60,12 +64,30 @@ class DatabaseConnection:
             logger.error(f"❌ MySQL connection verification failed: {e}")
             raise
         
+    async def prewarm(self, size: int):
+        """Opens `size` pooled connections at once, so the first requests do not pay for the handshakes."""
+        size = min(size, settings.MYSQL_POOL_SIZE)  # Overflow connections are discarded when released
+        if size <= 0:
+            return
+        async with AsyncExitStack() as stack:
+            conns = await asyncio.gather(
+                *(stack.enter_async_context(self.async_engine.connect()) for _ in range(size))
+            )
+            await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+        logger.info(f"MySQL pool prewarmed with {size} connections")
+
     def get_async_session(self) -> AsyncSession:
         """Gets a new async session."""
         if not self.async_session_factory:
             self.init_engine()
         return self.async_session_factory()
 
+    def pool_stats(self) -> Dict:
+        """Live statistics of the connection pool (empty before the engine is created)."""
+        if not self.async_engine:
+            return {}
+        return self.async_engine.sync_engine.pool.stats()
+
     async def close_connections(self):
         """Closes the database engine connections."""
         if self.async_engine:
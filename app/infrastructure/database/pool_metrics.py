@@ -0,0 +1,143 @@
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional
+
+from pymongo import monitoring
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class WaitHistogram:
+    """Thread-safe fixed-bucket histogram of checkout wait times."""
+
+    def __init__(self, buckets: tuple = WAIT_BUCKETS):
+        self.buckets = buckets
+        self._counts: List[int] = [0] * (len(buckets) + 1)  # Last one is +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += seconds
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+        # Cumulative counts, as in Prometheus histograms
+        cumulative, running = {}, 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], counts):
+            running += count
+            cumulative[bound] = running
+        return {"count": running, "sum_seconds": round(total_sum, 6), "buckets": cumulative}
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout waiters, wait times and timeouts."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = WaitHistogram()
+        self.waiting = 0
+        self.timeouts = 0
+
+    def connect(self):
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.waiting -= 1
+            self.wait_histogram.observe(time.perf_counter() - start)
+
+    def stats(self) -> Dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "waiting": self.waiting,
+            "timeouts": self.timeouts,
+            "checkout_wait": self.wait_histogram.snapshot(),
+        }
+
+
+class MongoPoolListener(monitoring.ConnectionPoolListener):
+    """Aggregates pymongo connection pool events over all the servers of a client.
+
+    Events are published from driver threads, so counters are updated under a lock.
+    """
+
+    def __init__(self):
+        self.wait_histogram = WaitHistogram()
+        self._lock = threading.Lock()
+        self.open_connections = 0
+        self.checked_out = 0
+        self.waiting = 0
+        self.check_out_failures: Dict[str, int] = {}
+
+    def _add(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def _observe(self, duration: Optional[float]):
+        if duration is not None:
+            self.wait_histogram.observe(duration)
+
+    def connection_check_out_started(self, event):
+        self._add(waiting=1)
+
+    def connection_checked_out(self, event):
+        self._add(waiting=-1, checked_out=1)
+        self._observe(event.duration)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.waiting -= 1
+            self.check_out_failures[event.reason] = self.check_out_failures.get(event.reason, 0) + 1
+        self._observe(event.duration)
+
+    def connection_checked_in(self, event):
+        self._add(checked_out=-1)
+
+    def connection_created(self, event):
+        self._add(open_connections=1)
+
+    def connection_closed(self, event):
+        self._add(open_connections=-1)
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counters = {
+                "open_connections": self.open_connections,
+                "checked_out": self.checked_out,
+                "waiting": self.waiting,
+                "check_out_failures": dict(self.check_out_failures),
+            }
+        return {**counters, "checkout_wait": self.wait_histogram.snapshot()}
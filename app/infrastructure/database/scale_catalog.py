@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.exceptions import DatabaseConnectionException
+from app.infrastructure.database.models.scale_model import ScaleModel
+from app.infrastructure.database.mysql_connection import mysql_connection
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_SCALE = ("", "")
+
+
+class ScaleCatalog:
+    """Process-wide in-memory copy of the Scale table (id -> (name, scale_type)).
+
+    The table is small and nearly static, so practice queries select only
+    `id_scale` and resolve names here instead of joining Scale. The catalog
+    is loaded at startup and reloaded when it is older than
+    `refresh_interval` seconds or when an unknown id is requested (at most
+    once every `miss_cooldown` seconds, so a dangling id cannot cause a
+    reload per query).
+    """
+
+    def __init__(self, refresh_interval: float = 300, miss_cooldown: float = 5):
+        self.refresh_interval = refresh_interval
+        self.miss_cooldown = miss_cooldown
+        self._scales: Dict[int, Tuple[str, str]] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def load(self):
+        """Loads the whole Scale table, replacing the current catalog."""
+        scales = await self._fetch_scales()
+        self._scales = scales
+        self._loaded_at = time.monotonic()
+        logger.info(f"Scale catalog loaded with {len(scales)} scales")
+
+    async def resolve(self, scale_ids: Iterable[int]) -> Dict[int, Tuple[str, str]]:
+        """Returns (name, scale_type) for each id, reloading the catalog if needed."""
+        scale_ids = set(scale_ids)
+        if self._needs_refresh(scale_ids):
+            await self._refresh()
+        return {scale_id: self._scales.get(scale_id, UNKNOWN_SCALE) for scale_id in scale_ids}
+
+    def _needs_refresh(self, scale_ids: set) -> bool:
+        if self._loaded_at is None:
+            return True
+        age = time.monotonic() - self._loaded_at
+        if age >= self.refresh_interval:
+            return True
+        return age >= self.miss_cooldown and not scale_ids.issubset(self._scales)
+
+    async def _refresh(self):
+        loaded_at = self._loaded_at
+        async with self._lock:
+            # Another request reloaded the catalog while we waited for the lock
+            if self._loaded_at != loaded_at:
+                return
+            try:
+                await self.load()
+            except (SQLAlchemyError, DatabaseConnectionException) as e:
+                if self._loaded_at is None:
+                    raise DatabaseConnectionException(f"Error loading scale catalog: {str(e)}")
+                # Keep serving the previous catalog and retry after the cooldown
+                logger.warning(f"Scale catalog refresh failed, keeping {len(self._scales)} cached scales: {e}")
+                self._loaded_at = time.monotonic() - self.refresh_interval + self.miss_cooldown
+
+    async def _fetch_scales(self) -> Dict[int, Tuple[str, str]]:
+        async with mysql_connection.get_async_session() as session:
+            result = await session.execute(select(ScaleModel.id, ScaleModel.name, ScaleModel.scale_type))
+            return {scale_id: (name, scale_type) for scale_id, name, scale_type in result.all()}
+
+
+# Global instance
+scale_catalog = ScaleCatalog()
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Dict
+
+from app.core.config import settings
+from app.infrastructure.database.mongo_connection import mongo_connection
+from app.infrastructure.database.mysql_connection import mysql_connection
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """Tracks which startup steps are done, for the /readyz probe."""
+
+    def __init__(self, *checks: str):
+        self._checks: Dict[str, bool] = {check: False for check in checks}
+        self.shutting_down = False
+
+    def mark(self, check: str, ok: bool = True):
+        self._checks[check] = ok
+
+    def checks(self) -> Dict[str, bool]:
+        return dict(self._checks)
+
+    @property
+    def ready(self) -> bool:
+        return not self.shutting_down and all(self._checks.values())
+
+
+readiness = Readiness("mysql", "mongo", "startup")
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Exponential backoff with full jitter: uniform in [0, min(max_delay, base_delay * 2**attempt)]."""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+async def retry_with_backoff(
+    name: str,
+    operation: Callable[[], Awaitable[None]],
+    base_delay: float,
+    max_delay: float,
+):
+    """Runs `operation` until it succeeds. The first attempt is immediate."""
+    attempt = 0
+    while True:
+        try:
+            await operation()
+            return
+        except Exception as e:
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            attempt += 1
+            logger.warning(f"⚠️  {name} failed (attempt {attempt}), retrying in {delay:.2f}s: {e}")
+            await asyncio.sleep(delay)
+
+
+async def connect_mysql():
+    mysql_connection.init_engine()
+    await mysql_connection.verify_connection()
+    await mysql_connection.prewarm(settings.MYSQL_POOL_PREWARM)
+    readiness.mark("mysql")
+
+
+async def connect_mongo():
+    mongo_connection.connect()
+    await mongo_connection.verify_connection()
+    await mongo_connection.prewarm(settings.MONGO_MIN_POOL_SIZE)
+    readiness.mark("mongo")
+
+
+async def initialize_databases():
+    """Connects MySQL and MongoDB in parallel, each retried with backoff until it is reachable."""
+    await asyncio.gather(
+        retry_with_backoff("MySQL connection", connect_mysql, settings.DB_CONNECT_BASE_DELAY, settings.DB_CONNECT_MAX_DELAY),
+        retry_with_backoff("MongoDB connection", connect_mongo, settings.DB_CONNECT_BASE_DELAY, settings.DB_CONNECT_MAX_DELAY),
+    )
+    logger.info("✅ Todas las conexiones de BD establecidas y verificadas")
@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import os
+import secrets
+import sqlite3
+import time
+from contextlib import closing
+from typing import List
+
+from app.domain.entities.video_deletion_job import VideoDeletionJob
+from app.domain.repositories.video_deletion_queue_repo import IVideoDeletionQueue
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS video_deletions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    uid TEXT NOT NULL,
+    practice_id INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',  -- pending | failed (gave up, kept for inspection)
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_token TEXT,  -- set by each claim; complete/fail only apply to the current one
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    UNIQUE (uid, practice_id)
+);
+CREATE INDEX IF NOT EXISTS ix_video_deletions_due ON video_deletions (status, available_at);
+"""
+
+
+class SQLiteVideoDeletionQueue(IVideoDeletionQueue):
+    """IVideoDeletionQueue stored in a SQLite file, so pending deletions survive restarts.
+
+    Every gunicorn worker can poll the same file: claims run in an IMMEDIATE
+    transaction, so a job is leased to a single process at a time, and each
+    claim gets a new lease token that `complete` and `fail` must match, so a
+    worker that outlived its lease cannot touch the job re-claimed by another. Failed
+    jobs are retried with exponential backoff up to `max_attempts`.
+    sqlite3 calls block, so they run in a thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = 10,
+        lease_seconds: float = 300.0,
+        base_backoff: float = 5.0,
+        max_backoff: float = 3600.0,
+    ):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            # Files created before lease tokens existed
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(video_deletions)")}
+            if "lease_token" not in columns:
+                conn.execute("ALTER TABLE video_deletions ADD COLUMN lease_token TEXT")
+            self._initialized = True
+        return conn
+
+    async def enqueue(self, uid: str, practice_id: int) -> None:
+        await asyncio.to_thread(self._enqueue, uid, [practice_id])
+
+    async def enqueue_many(self, uid: str, practice_ids: List[int]) -> None:
+        if practice_ids:
+            await asyncio.to_thread(self._enqueue, uid, practice_ids)
+
+    def _enqueue(self, uid: str, practice_ids: List[int]) -> None:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            # A practice already queued keeps its job; one that had given up starts over.
+            # One transaction, so a batch is a single commit instead of one per row
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    """
+                    INSERT INTO video_deletions (uid, practice_id, available_at, created_at) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (uid, practice_id) DO UPDATE
+                    SET status = 'pending', attempts = 0, available_at = excluded.available_at,
+                        lease_token = NULL, last_error = NULL
+                    WHERE status = 'failed'
+                    """,
+                    [(uid, practice_id, now, now) for practice_id in practice_ids],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        logger.debug("Queued video deletion for uid=%s, practice_ids=%s", uid, practice_ids)
+
+    async def claim(self, limit: int) -> List[VideoDeletionJob]:
+        return await asyncio.to_thread(self._claim, limit)
+
+    def _claim(self, limit: int) -> List[VideoDeletionJob]:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    """
+                    SELECT id, uid, practice_id, attempts FROM video_deletions
+                    WHERE status = 'pending' AND available_at <= ?
+                    ORDER BY available_at LIMIT ?
+                    """,
+                    (now, limit),
+                ).fetchall()
+                jobs = [
+                    VideoDeletionJob(id=row[0], uid=row[1], practice_id=row[2], attempts=row[3], lease_token=secrets.token_hex(8))
+                    for row in rows
+                ]
+                conn.executemany(
+                    "UPDATE video_deletions SET available_at = ?, lease_token = ? WHERE id = ?",
+                    [(now + self.lease_seconds, job.lease_token, job.id) for job in jobs],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return jobs
+
+    async def complete(self, job: VideoDeletionJob) -> None:
+        await self._execute_leased(job, "DELETE FROM video_deletions WHERE id = ? AND lease_token = ?", ())
+
+    async def fail(self, job: VideoDeletionJob, error: str) -> None:
+        attempts = job.attempts + 1
+        if attempts >= self.max_attempts:
+            logger.error(
+                f"Giving up deleting video of uid={job.uid}, practice_id={job.practice_id} after {attempts} attempts: {error}"
+            )
+            await self._execute_leased(
+                job,
+                "UPDATE video_deletions SET status = 'failed', attempts = ?, last_error = ? WHERE id = ? AND lease_token = ?",
+                (attempts, error),
+            )
+            return
+
+        delay = min(self.base_backoff * 2 ** job.attempts, self.max_backoff)
+        logger.warning(
+            f"Video deletion of uid={job.uid}, practice_id={job.practice_id} failed "
+            f"(attempt {attempts}/{self.max_attempts}), retrying in {delay:.0f}s: {error}"
+        )
+        await self._execute_leased(
+            job,
+            "UPDATE video_deletions SET attempts = ?, available_at = ?, last_error = ? WHERE id = ? AND lease_token = ?",
+            (attempts, time.time() + delay, error),
+        )
+
+    async def depth(self) -> int:
+        return await asyncio.to_thread(self._depth)
+
+    def _depth(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM video_deletions WHERE status = 'pending'").fetchone()[0]
+
+    async def _execute_leased(self, job: VideoDeletionJob, sql: str, params: tuple) -> None:
+        """Runs `sql` with `params` + (job id, lease token); a lease that expired matches nothing."""
+        updated = await asyncio.to_thread(self._execute, sql, (*params, job.id, job.lease_token))
+        if not updated:
+            logger.warning(
+                f"Lease of video deletion uid={job.uid}, practice_id={job.practice_id} expired, "
+                "the job was claimed again; ignoring this result"
+            )
+
+    def _execute(self, sql: str, params: tuple) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute(sql, params).rowcount
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from app.core.metrics import VIDEO_DELETION_DURATION, VIDEO_DELETION_QUEUE_DEPTH
+from app.domain.entities.video_deletion_job import VideoDeletionJob
+from app.domain.repositories.video_deletion_queue_repo import IVideoDeletionQueue
+from app.domain.services.video_service import VideoService
+
+logger = logging.getLogger(__name__)
+
+
+class VideoDeletionWorker:
+    """Background task draining the video deletion queue.
+
+    At most `concurrency` deletions run at a time; the blocking file removal
+    itself happens in the video repository's executor. Jobs that raise are
+    handed back to the queue, which schedules the retry.
+    """
+
+    def __init__(
+        self,
+        queue: IVideoDeletionQueue,
+        video_service: VideoService,
+        concurrency: int = 2,
+        poll_interval: float = 2.0,
+    ):
+        self.queue = queue
+        self.video_service = video_service
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    def start(self):
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="video-deletion-worker")
+            logger.info(f"Video deletion worker started (concurrency={self.concurrency})")
+
+    async def stop(self):
+        """Stops polling and waits for the deletions in progress."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        logger.info("Video deletion worker stopped")
+
+    async def _run(self):
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Video deletion worker iteration failed: {e}", exc_info=True)
+                processed = 0
+            if not processed:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_once(self) -> int:
+        """Claims and processes one batch of due jobs. Returns how many were processed."""
+        VIDEO_DELETION_QUEUE_DEPTH.set(await self.queue.depth())
+        jobs = await self.queue.claim(self.concurrency)
+        if jobs:
+            await asyncio.gather(*(self._process(job) for job in jobs))
+        return len(jobs)
+
+    async def _process(self, job: VideoDeletionJob):
+        start = time.perf_counter()
+        try:
+            deleted = await self.video_service.delete_video(job.uid, job.practice_id)
+        except Exception as e:
+            VIDEO_DELETION_DURATION.labels("error").observe(time.perf_counter() - start)
+            await self.queue.fail(job, str(e))
+            return
+        VIDEO_DELETION_DURATION.labels("deleted" if deleted else "missing").observe(time.perf_counter() - start)
+        await self.queue.complete(job)
@@ -1,12 +1,19 @@
 import os
+import stat
 import logging
 import aiofiles
+import aiofiles.os
 
 from app.core.exceptions import PracticeServiceException, ReportNotFoundException
+from app.core.metrics import instrument_repository
+from app.core.tracing import traced
+from app.domain.entities.report_file import ReportFile
 from app.domain.repositories.report_repo import IReportRepository
 
 logger = logging.getLogger(__name__)
 
+@traced
+@instrument_repository("disk")
 class LocalReportRepository(IReportRepository):
     """Concrete implementation of IReportRepository that retrieves PDFs from local file system."""
 
@@ -14,10 +21,13 @@ class LocalReportRepository(IReportRepository):
         self.base_dir = base_dir or os.getenv("CONTAINER_PATH", "/app/storage")
         os.makedirs(self.base_dir, exist_ok=True)
 
+    def _pdf_path(self, uid: str, practice_id: int) -> str:
+        return os.path.join(self.base_dir, uid, "reports", f"report_{practice_id}.pdf")
+
     async def get_pdf(self, uid: str, practice_id: int) -> bytes:
-        file_path = os.path.join(self.base_dir, uid, "reports", f"report_{practice_id}.pdf")
+        file_path = self._pdf_path(uid, practice_id)
 
-        logger.debug(f"Looking for PDF at: {file_path}")
+        logger.debug("Looking for PDF at: %s", file_path)
 
         if not os.path.exists(file_path):
             logger.error(f"PDF not found at path: {file_path}")
@@ -26,7 +36,7 @@ class LocalReportRepository(IReportRepository):
         try:
             async with aiofiles.open(file_path, "rb") as pdf_file:
                 content = await pdf_file.read()
-            logger.info(f"Successfully loaded PDF for uid={uid}, practice_id={practice_id}, path={file_path}")
+            logger.debug("Successfully loaded PDF for uid=%s, practice_id=%s, path=%s", uid, practice_id, file_path)
             return content
         except Exception as e:
             logger.error(f"Error reading PDF {file_path}: {e}", exc_info=True)
@@ -35,4 +45,29 @@ class LocalReportRepository(IReportRepository):
                 code=500,
                 error_code="REPORT_READ_ERROR",
                 details={"practice_id": practice_id, "error": str(e)}
-            )
\ No newline at end of file
+            )
+
+    async def get_pdf_file(self, uid: str, practice_id: int) -> ReportFile:
+        file_path = self._pdf_path(uid, practice_id)
+
+        logger.debug("Looking for PDF at: %s", file_path)
+
+        try:
+            file_stat = await aiofiles.os.stat(file_path)
+        except FileNotFoundError:
+            logger.error(f"PDF not found at path: {file_path}")
+            raise ReportNotFoundException(practice_id=practice_id)
+        except OSError as e:
+            logger.error(f"Error reading PDF {file_path}: {e}", exc_info=True)
+            raise PracticeServiceException(
+                message=f"Error reading report {practice_id}",
+                code=500,
+                error_code="REPORT_READ_ERROR",
+                details={"practice_id": practice_id, "error": str(e)}
+            )
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            logger.error(f"PDF path is not a regular file: {file_path}")
+            raise ReportNotFoundException(practice_id=practice_id)
+
+        return ReportFile(path=file_path, size=file_stat.st_size, modified_ns=file_stat.st_mtime_ns)
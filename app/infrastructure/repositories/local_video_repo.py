@@ -1,27 +1,36 @@
 import logging
 import os
+from concurrent.futures import Executor
 
+import aiofiles.os
+
+from app.core.metrics import instrument_repository
+from app.core.tracing import traced
 from app.domain.repositories.video_repo import ILocalVideoRepository
 
 logger = logging.getLogger(__name__)
 
+@traced
+@instrument_repository("disk")
 class LocalVideoRepository(ILocalVideoRepository):
     """Concrete implementation of ILocalVideoRepository using local filesystem."""
 
-    def __init__(self, base_dir: str | None = None):
+    def __init__(self, base_dir: str | None = None, executor: Executor | None = None):
         self.base_dir = base_dir or os.getenv("CONTAINER_PATH", "/app/storage")
+        # Deleting a large file can take long on slow volumes, so it runs in
+        # this (bounded) executor instead of on the event loop
+        self.executor = executor
 
     async def delete_video(self, uid: str, practice_id: int) -> bool:
-        """Delete a video file if it exists."""
+        """Delete a video file. Returns False if it did not exist; other OS errors are raised so they can be retried."""
         file_path = os.path.join(self.base_dir, uid, "videos", f"practice_{practice_id}.mp4")
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.info(f"Video deleted: {file_path}")
-                return True
-            else:
-                logger.warning(f"Video not found for deletion: {file_path}")
-                return False
-        except Exception as e:
+            await aiofiles.os.remove(file_path, executor=self.executor)
+            logger.info("Video deleted: %s", file_path)
+            return True
+        except FileNotFoundError:
+            logger.warning(f"Video not found for deletion: {file_path}")
+            return False
+        except OSError as e:
             logger.error(f"Error deleting video {file_path}: {e}")
-            return False
\ No newline at end of file
+            raise
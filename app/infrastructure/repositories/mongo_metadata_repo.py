@@ -1,40 +1,72 @@
 import logging
+from typing import Dict, List
+
+from pymongo import ReturnDocument
 
 from app.core.exceptions import PracticeNotFoundException, UserNotFoundException
+from app.core.metrics import instrument_repository
+from app.core.tracing import traced
 from app.domain.entities.practice_metadata import PracticeMetadata
 from app.domain.repositories.metadata_repo import IMetaDataRepository
 from app.infrastructure.database.mongo_connection import mongo_connection
+from app.shared.enums import MetadataLayout
 
 logger = logging.getLogger(__name__)
 
 
+@traced
+@instrument_repository("mongo")
 class MongoMetadataRepository(IMetaDataRepository):
-    """Concrete implementation of MetadataRepository using Motor (async MongoDB driver)."""
+    """Concrete implementation of MetadataRepository using Motor (async MongoDB driver).
+
+    Supports two storage layouts:
+    - embedded: practices array inside each `users` document (legacy).
+    - collection: one document per (uid, id_practice) in its own collection.
+
+    Both raise UserNotFoundException for an unknown uid: the collection layout
+    checks the `users` collection once a lookup misses.
+    """
+
+    def __init__(self, layout: str = MetadataLayout.EMBEDDED, collection_name: str = "practice_metadata"):
+        self.layout = MetadataLayout(layout)
+        self.collection_name = collection_name
+
+    async def ensure_indexes(self):
+        """Creates the unique (uid, id_practice) index used by the collection layout."""
+        if self.layout != MetadataLayout.COLLECTION:
+            return
+
+        db = mongo_connection.connect()
+        await db[self.collection_name].create_index(
+            [("uid", 1), ("id_practice", 1)],
+            unique=True,
+            name="uq_uid_id_practice",
+        )
+        logger.info("Ensured indexes on %s", self.collection_name)
 
     async def get_practice_metadata(self, uid: str, practice_id: int) -> PracticeMetadata:
+        if self.layout == MetadataLayout.COLLECTION:
+            return await self._get_practice_metadata_from_collection(uid, practice_id)
+
         try:
             db = mongo_connection.connect()
 
-            # Get user document by uid
-            user_doc = await db["users"].find_one({"uid": uid})
+            # Get user document by uid, projecting only the requested practice
+            user_doc = await db["users"].find_one(
+                {"uid": uid},
+                {"_id": 0, "practices": {"$elemMatch": {"id_practice": practice_id}}},
+            )
             if not user_doc:
                 logger.warning(f"User with uid={uid} not found")
                 raise UserNotFoundException(user_id=uid)
 
-            # Get practice metadata by practice_id
-            for pr in user_doc.get("practices", []):
-                if pr.get("id_practice") == practice_id:
-                    logger.info(f"Found practice metadata for uid={uid}, practice_id={practice_id}")
-                    return PracticeMetadata(
-                        id_practice=practice_id,
-                        video_in_local=pr.get("video_in_local"),
-                        report=pr.get("report"),
-                        video_done=pr.get("video_done", False),
-                        audio_done=pr.get("audio_done", False)
-                    )
-
-            logger.warning(f"No practice found with id={practice_id} for uid={uid}")
-            raise PracticeNotFoundException(practice_id=practice_id)
+            practices = user_doc.get("practices") or []
+            if not practices:
+                logger.warning(f"No practice found with id={practice_id} for uid={uid}")
+                raise PracticeNotFoundException(practice_id=practice_id)
+
+            logger.debug("Found practice metadata for uid=%s, practice_id=%s", uid, practice_id)
+            return self._doc_to_entity(practices[0])
 
         except (UserNotFoundException, PracticeNotFoundException):
             raise
@@ -45,35 +77,197 @@ class MongoMetadataRepository(IMetaDataRepository):
             )
             raise
     
-    async def finish_practice(self, uid: str, practice_id: int) -> PracticeMetadata:
+    async def get_practices_metadata(self, uid: str, practice_ids: List[int]) -> Dict[int, PracticeMetadata]:
+        if not practice_ids:
+            return {}
+
+        if self.layout == MetadataLayout.COLLECTION:
+            return await self._get_practices_metadata_from_collection(uid, practice_ids)
+
         try:
             db = mongo_connection.connect()
 
-            # Get user document by uid
-            user_doc = await db["users"].find_one({"uid": uid})
-            if not user_doc:
+            # Single round trip: filter the practices array server-side so only
+            # the requested entries are sent back
+            cursor = db["users"].aggregate([
+                {"$match": {"uid": uid}},
+                {"$project": {
+                    "_id": 0,
+                    "practices": {
+                        "$filter": {
+                            "input": {"$ifNull": ["$practices", []]},
+                            "as": "pr",
+                            "cond": {"$in": ["$$pr.id_practice", list(practice_ids)]},
+                        }
+                    },
+                }},
+            ])
+            user_docs = await cursor.to_list(length=1)
+            if not user_docs:
                 logger.warning(f"User with uid={uid} not found")
                 raise UserNotFoundException(user_id=uid)
 
-            # Update only video_in_local field
-            for pr in user_doc.get("practices", []):
-                if pr.get("id_practice") == practice_id:
-                    await db["users"].update_one(
-                        {"uid": uid, "practices.id_practice": practice_id},
-                        {"$set": {"practices.$.video_in_local": ""}}
-                    )
-
-                    logger.info(f"Cleared video_in_local for uid={uid}, practice_id={practice_id}")
-                    return PracticeMetadata(
-                        id_practice=practice_id,
-                        video_in_local="",  # siempre vacío
-                        report=pr.get("report"),
-                        video_done=pr.get("video_done", False),
-                        audio_done=pr.get("audio_done", False)
-                    )
-
-            logger.warning(f"No practice found with id={practice_id} for uid={uid}")
-            raise PracticeNotFoundException(practice_id=practice_id)
+            metadata = {
+                pr.get("id_practice"): self._doc_to_entity(pr)
+                for pr in user_docs[0].get("practices", [])
+            }
+            logger.debug("Found metadata for %s/%s practices of uid=%s", len(metadata), len(practice_ids), uid)
+            return metadata
+
+        except UserNotFoundException:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error fetching practices metadata for uid={uid}, practice_ids={practice_ids}: {e}",
+                exc_info=True
+            )
+            raise
+    
+    async def finish_practice(self, uid: str, practice_id: int) -> PracticeMetadata:
+        if self.layout == MetadataLayout.COLLECTION:
+            return await self._finish_practice_in_collection(uid, practice_id)
+
+        try:
+            db = mongo_connection.connect()
+
+            # Single atomic round trip: the positional update clears the matched
+            # practice and the projection sends back only that (updated) entry
+            user_doc = await db["users"].find_one_and_update(
+                {"uid": uid, "practices.id_practice": practice_id},
+                {"$set": {"practices.$.video_in_local": ""}},
+                projection={"_id": 0, "practices": {"$elemMatch": {"id_practice": practice_id}}},
+                return_document=ReturnDocument.AFTER,
+            )
+            if not user_doc:
+                # Miss: only now tell a missing user from a missing practice
+                if not await db["users"].count_documents({"uid": uid}, limit=1):
+                    logger.warning(f"User with uid={uid} not found")
+                    raise UserNotFoundException(user_id=uid)
+                logger.warning(f"No practice found with id={practice_id} for uid={uid}")
+                raise PracticeNotFoundException(practice_id=practice_id)
+
+            logger.info("Cleared video_in_local for uid=%s, practice_id=%s", uid, practice_id)
+            return self._doc_to_entity(user_doc["practices"][0])
+
+        except (UserNotFoundException, PracticeNotFoundException):
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error finishing practice for uid={uid}, practice_id={practice_id}: {e}",
+                exc_info=True
+            )
+            raise
+
+    async def finish_practices(self, uid: str, practice_ids: List[int]) -> Dict[int, PracticeMetadata]:
+        if not practice_ids:
+            return {}
+
+        if self.layout == MetadataLayout.COLLECTION:
+            return await self._finish_practices_in_collection(uid, practice_ids)
+
+        try:
+            db = mongo_connection.connect()
+
+            # One write for every practice: the array filter matches all the
+            # requested entries of the user document. Filtering on them too
+            # skips users without a practices array, where MongoDB rejects
+            # array filters
+            result = await db["users"].update_one(
+                {"uid": uid, "practices.id_practice": {"$in": list(practice_ids)}},
+                {"$set": {"practices.$[pr].video_in_local": ""}},
+                array_filters=[{"pr.id_practice": {"$in": list(practice_ids)}}],
+            )
+            if not result.matched_count:
+                # Miss: only now tell a missing user from none of the practices existing
+                if not await db["users"].count_documents({"uid": uid}, limit=1):
+                    logger.warning(f"User with uid={uid} not found")
+                    raise UserNotFoundException(user_id=uid)
+                logger.warning(f"None of practices {practice_ids} found for uid={uid}")
+                return {}
+
+            logger.info("Cleared video_in_local for uid=%s, %s practices", uid, len(practice_ids))
+            return await self.get_practices_metadata(uid, practice_ids)
+
+        except UserNotFoundException:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error finishing practices for uid={uid}, practice_ids={practice_ids}: {e}",
+                exc_info=True
+            )
+            raise
+
+    # ---------- Collection layout ----------
+
+    async def _get_practice_metadata_from_collection(self, uid: str, practice_id: int) -> PracticeMetadata:
+        try:
+            db = mongo_connection.connect()
+
+            doc = await db[self.collection_name].find_one(
+                {"uid": uid, "id_practice": practice_id},
+                {"_id": 0},
+            )
+            if not doc:
+                # Miss: only now tell a missing user from a missing practice
+                await self._ensure_user_exists(db, uid)
+                logger.warning(f"No practice found with id={practice_id} for uid={uid}")
+                raise PracticeNotFoundException(practice_id=practice_id)
+
+            logger.debug("Found practice metadata for uid=%s, practice_id=%s", uid, practice_id)
+            return self._doc_to_entity(doc)
+
+        except (UserNotFoundException, PracticeNotFoundException):
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error fetching practice metadata for uid={uid}, practice_id={practice_id}: {e}",
+                exc_info=True
+            )
+            raise
+
+    async def _get_practices_metadata_from_collection(self, uid: str, practice_ids: List[int]) -> Dict[int, PracticeMetadata]:
+        try:
+            db = mongo_connection.connect()
+
+            cursor = db[self.collection_name].find(
+                {"uid": uid, "id_practice": {"$in": list(practice_ids)}},
+                {"_id": 0},
+            )
+            docs = await cursor.to_list(length=len(practice_ids))
+            if not docs:
+                await self._ensure_user_exists(db, uid)
+
+            metadata = {doc.get("id_practice"): self._doc_to_entity(doc) for doc in docs}
+            logger.debug("Found metadata for %s/%s practices of uid=%s", len(metadata), len(practice_ids), uid)
+            return metadata
+
+        except UserNotFoundException:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error fetching practices metadata for uid={uid}, practice_ids={practice_ids}: {e}",
+                exc_info=True
+            )
+            raise
+
+    async def _finish_practice_in_collection(self, uid: str, practice_id: int) -> PracticeMetadata:
+        try:
+            db = mongo_connection.connect()
+
+            doc = await db[self.collection_name].find_one_and_update(
+                {"uid": uid, "id_practice": practice_id},
+                {"$set": {"video_in_local": ""}},
+                projection={"_id": 0},
+                return_document=ReturnDocument.AFTER,
+            )
+            if not doc:
+                # Miss: only now tell a missing user from a missing practice
+                await self._ensure_user_exists(db, uid)
+                logger.warning(f"No practice found with id={practice_id} for uid={uid}")
+                raise PracticeNotFoundException(practice_id=practice_id)
+
+            logger.info("Cleared video_in_local for uid=%s, practice_id=%s", uid, practice_id)
+            return self._doc_to_entity(doc)
 
         except (UserNotFoundException, PracticeNotFoundException):
             raise
@@ -82,4 +276,39 @@ class MongoMetadataRepository(IMetaDataRepository):
                 f"Error finishing practice for uid={uid}, practice_id={practice_id}: {e}",
                 exc_info=True
             )
-            raise
\ No newline at end of file
+            raise
+
+    async def _finish_practices_in_collection(self, uid: str, practice_ids: List[int]) -> Dict[int, PracticeMetadata]:
+        try:
+            db = mongo_connection.connect()
+
+            await db[self.collection_name].update_many(
+                {"uid": uid, "id_practice": {"$in": list(practice_ids)}},
+                {"$set": {"video_in_local": ""}},
+            )
+
+            logger.info("Cleared video_in_local for uid=%s, %s practices", uid, len(practice_ids))
+            return await self._get_practices_metadata_from_collection(uid, practice_ids)
+
+        except UserNotFoundException:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error finishing practices for uid={uid}, practice_ids={practice_ids}: {e}",
+                exc_info=True
+            )
+            raise
+
+    async def _ensure_user_exists(self, db, uid: str) -> None:
+        if not await db["users"].count_documents({"uid": uid}, limit=1):
+            logger.warning(f"User with uid={uid} not found")
+            raise UserNotFoundException(user_id=uid)
+
+    def _doc_to_entity(self, doc: dict) -> PracticeMetadata:
+        return PracticeMetadata(
+            id_practice=doc.get("id_practice"),
+            video_in_local=doc.get("video_in_local"),
+            report=doc.get("report"),
+            video_done=doc.get("video_done", False),
+            audio_done=doc.get("audio_done", False)
+        )
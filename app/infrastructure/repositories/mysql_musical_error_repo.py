@@ -1,16 +1,22 @@
 import logging
-from typing import List
-from sqlalchemy import select
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from app.core.exceptions import DatabaseConnectionException, MusicalErrorNotFoundException
+from app.core.metrics import instrument_repository
+from app.core.tracing import traced
+from app.domain.entities.error_summary import MusicalErrorSummary, NoteErrorCount, TimeBucketCount
 from app.domain.entities.musical_error import MusicalError
 from app.domain.repositories.musical_errror_repo import IMusicalErrorRepository
 from app.infrastructure.database.models.musical_error_model import MusicalErrorModel
 from app.infrastructure.database.mysql_connection import mysql_connection
+from app.shared.constants import STREAM_YIELD_PER
 
 logger = logging.getLogger(__name__)
 
+@traced
+@instrument_repository("mysql")
 class MySQLMusicalErrorRepository(IMusicalErrorRepository):
     """Concrete implementation of IMusicalErrorRepository using MySQL."""
 
@@ -26,7 +32,7 @@ class MySQLMusicalErrorRepository(IMusicalErrorRepository):
                     logger.warning(f"No musical errors found for practice_id={practice_id}")
                     raise MusicalErrorNotFoundException(practice_id, f"No musical errors for practice {practice_id}")
 
-                logger.debug(f"Fetched {len(rows)} musical errors for practice_id={practice_id}")
+                logger.debug("Fetched %s musical errors for practice_id=%s", len(rows), practice_id)
                 return [self._model_to_entity(row) for row in rows]
 
         except IntegrityError as e:
@@ -36,11 +42,159 @@ class MySQLMusicalErrorRepository(IMusicalErrorRepository):
             logger.error(f"MySQL error fetching musical errors for practice_id={practice_id}: {e}", exc_info=True)
             raise DatabaseConnectionException(f"Error fetching musical errors: {str(e)}")
 
+    async def get_musical_errors_by_practice_ids(self, practice_ids: List[int]) -> Dict[int, List[MusicalError]]:
+        errors: Dict[int, List[MusicalError]] = {practice_id: [] for practice_id in practice_ids}
+        if not practice_ids:
+            return errors
+
+        try:
+            async with mysql_connection.get_async_session() as session:
+                result = await session.execute(
+                    select(MusicalErrorModel)
+                    .where(MusicalErrorModel.id_practice.in_(practice_ids))
+                    .order_by(MusicalErrorModel.id_practice, MusicalErrorModel.id)
+                )
+                rows = result.scalars().all()
+
+                for row in rows:
+                    errors[row.id_practice].append(self._model_to_entity(row))
+
+                logger.debug("Fetched %s musical errors for %s practices", len(rows), len(practice_ids))
+                return errors
+
+        except SQLAlchemyError as e:
+            logger.error(f"MySQL error fetching musical errors for practice_ids={practice_ids}: {e}", exc_info=True)
+            raise DatabaseConnectionException(f"Error fetching musical errors: {str(e)}")
+
+    async def stream_musical_errors_by_practice_id(self, practice_id: int) -> AsyncIterator[MusicalError]:
+        try:
+            async with mysql_connection.get_async_session() as session:
+                # Server-side cursor: rows are fetched STREAM_YIELD_PER at a time instead of all at once
+                result = await session.stream(
+                    select(
+                        MusicalErrorModel.id,
+                        MusicalErrorModel.min_sec,
+                        MusicalErrorModel.note_played,
+                        MusicalErrorModel.note_correct,
+                        MusicalErrorModel.id_practice,
+                    )
+                    .where(MusicalErrorModel.id_practice == practice_id)
+                    .order_by(MusicalErrorModel.id)
+                    .execution_options(yield_per=STREAM_YIELD_PER)
+                )
+
+                count = 0
+                async for row in result:
+                    count += 1
+                    yield MusicalError(
+                        id=row.id,
+                        min_sec=row.min_sec,
+                        note_played=row.note_played,
+                        note_correct=row.note_correct,
+                        id_practice=row.id_practice
+                    )
+
+                if not count:
+                    logger.warning(f"No musical errors found for practice_id={practice_id}")
+                    raise MusicalErrorNotFoundException(practice_id, f"No musical errors for practice {practice_id}")
+
+                logger.debug("Streamed %s musical errors for practice_id=%s", count, practice_id)
+
+        except SQLAlchemyError as e:
+            logger.error(f"MySQL error streaming musical errors for practice_id={practice_id}: {e}", exc_info=True)
+            raise DatabaseConnectionException(f"Error fetching musical errors: {str(e)}")
+
+    async def get_musical_errors_page(
+        self,
+        practice_id: int,
+        limit: int,
+        cursor: Optional[Tuple[int, int]] = None,
+        from_sec: Optional[int] = None,
+        to_sec: Optional[int] = None,
+    ) -> List[MusicalError]:
+        query = select(
+            MusicalErrorModel.id,
+            MusicalErrorModel.min_sec,
+            MusicalErrorModel.note_played,
+            MusicalErrorModel.note_correct,
+            MusicalErrorModel.id_practice,
+            MusicalErrorModel.seconds,
+        ).where(MusicalErrorModel.id_practice == practice_id)
+
+        if from_sec is not None:
+            query = query.where(MusicalErrorModel.seconds >= from_sec)
+        if to_sec is not None:
+            query = query.where(MusicalErrorModel.seconds <= to_sec)
+        if cursor is not None:
+            seconds, error_id = cursor
+            query = query.where(or_(
+                MusicalErrorModel.seconds > seconds,
+                and_(MusicalErrorModel.seconds == seconds, MusicalErrorModel.id > error_id),
+            ))
+
+        # Range scan on ix_musical_error_practice_seconds
+        query = query.order_by(MusicalErrorModel.seconds, MusicalErrorModel.id).limit(limit)
+
+        try:
+            async with mysql_connection.get_async_session() as session:
+                result = await session.execute(query)
+                rows = result.all()
+                logger.debug("Fetched %s musical errors for practice_id=%s (cursor=%s, window=%s-%s)", len(rows), practice_id, cursor, from_sec, to_sec)
+                return [
+                    MusicalError(
+                        id=row.id,
+                        min_sec=row.min_sec,
+                        note_played=row.note_played,
+                        note_correct=row.note_correct,
+                        id_practice=row.id_practice,
+                        seconds=row.seconds,
+                    )
+                    for row in rows
+                ]
+
+        except SQLAlchemyError as e:
+            logger.error(f"MySQL error fetching musical errors page for practice_id={practice_id}: {e}", exc_info=True)
+            raise DatabaseConnectionException(f"Error fetching musical errors: {str(e)}")
+
+    async def get_musical_error_summary(self, practice_id: int, bucket_sec: int) -> MusicalErrorSummary:
+        count = func.count().label("count")
+        by_note_query = (
+            select(MusicalErrorModel.note_correct, MusicalErrorModel.note_played, count)
+            .where(MusicalErrorModel.id_practice == practice_id)
+            .group_by(MusicalErrorModel.note_correct, MusicalErrorModel.note_played)
+            .order_by(count.desc(), MusicalErrorModel.note_correct, MusicalErrorModel.note_played)
+        )
+        bucket = (MusicalErrorModel.seconds - MusicalErrorModel.seconds % bucket_sec).label("start_sec")
+        by_time_query = (
+            select(bucket, func.count().label("count"))
+            .where(MusicalErrorModel.id_practice == practice_id)
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+
+        try:
+            async with mysql_connection.get_async_session() as session:
+                by_note = (await session.execute(by_note_query)).all()
+                by_time = (await session.execute(by_time_query)).all()
+
+                logger.debug("Aggregated musical errors for practice_id=%s into %s note pairs and %s buckets", practice_id, len(by_note), len(by_time))
+                return MusicalErrorSummary(
+                    bucket_sec=bucket_sec,
+                    total=sum(row.count for row in by_note),
+                    by_note=[NoteErrorCount(note_correct=row.note_correct, note_played=row.note_played, count=row.count) for row in by_note],
+                    by_time=[TimeBucketCount(start_sec=row.start_sec, count=row.count) for row in by_time],
+                )
+
+        except SQLAlchemyError as e:
+            logger.error(f"MySQL error aggregating musical errors for practice_id={practice_id}: {e}", exc_info=True)
+            raise DatabaseConnectionException(f"Error aggregating musical errors: {str(e)}")
+
     def _model_to_entity(self, model: MusicalErrorModel) -> MusicalError:
         return MusicalError(
             id=model.id,
             min_sec=model.min_sec,
             note_played=model.note_played,
             note_correct=model.note_correct,
-            id_practice=model.id_practice
+            id_practice=model.id_practice,
+            seconds=model.seconds
         )
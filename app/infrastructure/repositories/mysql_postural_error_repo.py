@@ -1,16 +1,22 @@
 import logging
-from typing import List
-from sqlalchemy import select
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import and_, func, literal_column, or_, select
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
+from app.core.metrics import instrument_repository
+from app.core.tracing import traced
+from app.domain.entities.error_summary import ExplicationSummary, PosturalErrorSummary
 from app.domain.entities.postural_error import PosturalError
 from app.domain.repositories.postural_error_repo import IPosturalErrorRepository
+from app.infrastructure.database.models.base import mm_ss_to_seconds
 from app.infrastructure.database.models.postural_error_model import PosturalErrorModel
 from app.infrastructure.database.mysql_connection import mysql_connection
 from app.core.exceptions import DatabaseConnectionException, PosturalErrorNotFoundException
 
 logger = logging.getLogger(__name__)
 
+@traced
+@instrument_repository("mysql")
 class MySQLPosturalErrorRepository(IPosturalErrorRepository):
     """Concrete implementation of IPosturalErrorRepository using MySQL."""
 
@@ -26,7 +32,7 @@ class MySQLPosturalErrorRepository(IPosturalErrorRepository):
                     logger.warning(f"No postural errors found for practice_id={practice_id}")
                     raise PosturalErrorNotFoundException(practice_id, f"No postural errors for practice {practice_id}")
 
-                logger.debug(f"Fetched {len(rows)} postural errors for practice_id={practice_id}")
+                logger.debug("Fetched %s postural errors for practice_id=%s", len(rows), practice_id)
                 return [self._model_to_entity(row) for row in rows]
 
         except IntegrityError as e:
@@ -36,11 +42,121 @@ class MySQLPosturalErrorRepository(IPosturalErrorRepository):
             logger.error(f"MySQL error fetching postural errors for practice_id={practice_id}: {e}", exc_info=True)
             raise DatabaseConnectionException(f"Error fetching postural errors: {str(e)}")
 
+    async def get_postural_errors_by_practice_ids(self, practice_ids: List[int]) -> Dict[int, List[PosturalError]]:
+        errors: Dict[int, List[PosturalError]] = {practice_id: [] for practice_id in practice_ids}
+        if not practice_ids:
+            return errors
+
+        try:
+            async with mysql_connection.get_async_session() as session:
+                result = await session.execute(
+                    select(PosturalErrorModel)
+                    .where(PosturalErrorModel.id_practice.in_(practice_ids))
+                    .order_by(PosturalErrorModel.id_practice, PosturalErrorModel.id)
+                )
+                rows = result.scalars().all()
+
+                for row in rows:
+                    errors[row.id_practice].append(self._model_to_entity(row))
+
+                logger.debug("Fetched %s postural errors for %s practices", len(rows), len(practice_ids))
+                return errors
+
+        except SQLAlchemyError as e:
+            logger.error(f"MySQL error fetching postural errors for practice_ids={practice_ids}: {e}", exc_info=True)
+            raise DatabaseConnectionException(f"Error fetching postural errors: {str(e)}")
+
+    async def get_postural_errors_page(
+        self,
+        practice_id: int,
+        limit: int,
+        cursor: Optional[Tuple[int, int]] = None,
+        from_sec: Optional[int] = None,
+        to_sec: Optional[int] = None,
+    ) -> List[PosturalError]:
+        query = select(
+            PosturalErrorModel.id,
+            PosturalErrorModel.min_sec_init,
+            PosturalErrorModel.min_sec_end,
+            PosturalErrorModel.explication,
+            PosturalErrorModel.id_practice,
+            PosturalErrorModel.seconds,
+        ).where(PosturalErrorModel.id_practice == practice_id)
+
+        if from_sec is not None:
+            query = query.where(PosturalErrorModel.seconds >= from_sec)
+        if to_sec is not None:
+            query = query.where(PosturalErrorModel.seconds <= to_sec)
+        if cursor is not None:
+            seconds, error_id = cursor
+            query = query.where(or_(
+                PosturalErrorModel.seconds > seconds,
+                and_(PosturalErrorModel.seconds == seconds, PosturalErrorModel.id > error_id),
+            ))
+
+        # Range scan on ix_postural_error_practice_seconds
+        query = query.order_by(PosturalErrorModel.seconds, PosturalErrorModel.id).limit(limit)
+
+        try:
+            async with mysql_connection.get_async_session() as session:
+                result = await session.execute(query)
+                rows = result.all()
+                logger.debug("Fetched %s postural errors for practice_id=%s (cursor=%s, window=%s-%s)", len(rows), practice_id, cursor, from_sec, to_sec)
+                return [
+                    PosturalError(
+                        id=row.id,
+                        min_sec_init=row.min_sec_init,
+                        min_sec_end=row.min_sec_end,
+                        explication=row.explication,
+                        id_practice=row.id_practice,
+                        seconds=row.seconds,
+                    )
+                    for row in rows
+                ]
+
+        except SQLAlchemyError as e:
+            logger.error(f"MySQL error fetching postural errors page for practice_id={practice_id}: {e}", exc_info=True)
+            raise DatabaseConnectionException(f"Error fetching postural errors: {str(e)}")
+
+    async def get_postural_error_summary(self, practice_id: int) -> PosturalErrorSummary:
+        end_seconds = literal_column(mm_ss_to_seconds("min_sec_end"))
+        count = func.count().label("count")
+        query = (
+            select(
+                PosturalErrorModel.explication,
+                count,
+                func.coalesce(func.sum(end_seconds - PosturalErrorModel.seconds), 0).label("duration_sec"),
+            )
+            .where(PosturalErrorModel.id_practice == practice_id)
+            .group_by(PosturalErrorModel.explication)
+            .order_by(count.desc(), PosturalErrorModel.explication)
+        )
+
+        try:
+            async with mysql_connection.get_async_session() as session:
+                rows = (await session.execute(query)).all()
+
+                logger.debug("Aggregated postural errors for practice_id=%s into %s explications", practice_id, len(rows))
+                by_explication = [
+                    ExplicationSummary(explication=row.explication or "", count=row.count, duration_sec=int(row.duration_sec))
+                    for row in rows
+                ]
+                return PosturalErrorSummary(
+                    total=sum(item.count for item in by_explication),
+                    total_duration_sec=sum(item.duration_sec for item in by_explication),
+                    by_explication=by_explication,
+                )
+
+        except SQLAlchemyError as e:
+            logger.error(f"MySQL error aggregating postural errors for practice_id={practice_id}: {e}", exc_info=True)
+            raise DatabaseConnectionException(f"Error aggregating postural errors: {str(e)}")
+
     def _model_to_entity(self, model: PosturalErrorModel) -> PosturalError:
         return PosturalError(
             id=model.id,
             min_sec_init=model.min_sec_init,
             min_sec_end=model.min_sec_end,
             explication=model.explication,
-            id_practice=model.id_practice
+            id_practice=model.id_practice,
+            seconds=model.seconds
         )
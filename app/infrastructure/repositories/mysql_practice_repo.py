@@ -1,19 +1,24 @@
 import logging
-from typing import List, Optional
-from sqlalchemy import select
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import and_, or_, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
 
 from app.core.exceptions import DatabaseConnectionException, PracticeNotFoundException
+from app.core.metrics import instrument_repository
+from app.core.tracing import traced
 from app.domain.entities.practice import Practice
 from app.domain.repositories.practice_repo import IPracticeRepository
 from app.infrastructure.database.models.practice_model import PracticeModel
 from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.database.scale_catalog import UNKNOWN_SCALE, scale_catalog
 from app.shared.constants import PRACTICES_PAGE_LIMIT
 
 logger = logging.getLogger(__name__)
 
 
+@traced
+@instrument_repository("mysql")
 class MySQLPracticeRepository(IPracticeRepository):
     """Concrete implementation of IPracticeRepository for Practice using MySQL."""
 
@@ -22,39 +27,48 @@ class MySQLPracticeRepository(IPracticeRepository):
         uid: str,
         last_id: Optional[int] = None,
         limit: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
     ) -> List[Practice]:
         
         query_limit = limit if limit is not None else PRACTICES_PAGE_LIMIT
                 
-        logger.info(f"Repository: uid={uid}, last_id={last_id}, limit={limit}, effective_limit={query_limit}")
+        logger.debug("Repository: uid=%s, last_id=%s, cursor=%s, limit=%s, effective_limit=%s", uid, last_id, cursor, limit, query_limit)
 
         async with mysql_connection.get_async_session() as session:
             try:
+                # Keyset pagination on (practice_datetime, id), served by ix_practice_student_datetime_id
                 stmt = (
-                    select(PracticeModel)
-                    .options(joinedload(PracticeModel.scale))
+                    self._select_practices()
                     .where(PracticeModel.id_student == uid)
-                    .order_by(PracticeModel.practice_datetime.desc())
+                    .order_by(PracticeModel.practice_datetime.desc(), PracticeModel.id.desc())
                     .limit(query_limit)
                 )
 
-                if last_id:
+                if cursor:
+                    cursor_datetime, cursor_id = cursor
+                    stmt = stmt.where(self._before(cursor_datetime, cursor_id))
+                elif last_id:
+                    # Legacy pagination: resolve the datetime of the last practice seen
                     subq = (
                         select(PracticeModel.practice_datetime)
                         .where(PracticeModel.id == last_id)
                         .scalar_subquery()
                     )
-                    stmt = stmt.where(PracticeModel.practice_datetime < subq)
+                    stmt = stmt.where(self._before(subq, last_id))
 
                 result = await session.execute(stmt)
-                models = result.scalars().all()
-
-                logger.info(f"Fetched {len(models)} practices for uid={uid}")
-                return [self._model_to_entity(m) for m in models]
+                rows = result.all()
 
             except SQLAlchemyError as e:
                 logger.error(f"MySQL error fetching practices for uid={uid}: {e}", exc_info=True)
                 raise DatabaseConnectionException(f"Error fetching practices: {str(e)}")
+
+        # Resolved after the session is closed: a catalog refresh needs a
+        # connection of its own and must not wait while this one is held
+        scales = await scale_catalog.resolve(row.id_scale for row in rows)
+
+        logger.debug("Fetched %s practices for uid=%s", len(rows), uid)
+        return [self._row_to_entity(row, scales) for row in rows]
             
     async def get_practice_by_id(
         self,
@@ -62,13 +76,12 @@ class MySQLPracticeRepository(IPracticeRepository):
         practice_id: int
     ) -> Practice:
                         
-        logger.info(f"Repository: uid={uid}, practice_id={practice_id}")
+        logger.debug("Repository: uid=%s, practice_id=%s", uid, practice_id)
 
         async with mysql_connection.get_async_session() as session:
             try:
                 stmt = (
-                    select(PracticeModel)
-                    .options(joinedload(PracticeModel.scale))
+                    self._select_practices()
                     .where(
                         PracticeModel.id == practice_id,
                         PracticeModel.id_student == uid
@@ -76,33 +89,84 @@ class MySQLPracticeRepository(IPracticeRepository):
                 )
 
                 result = await session.execute(stmt)
-                model = result.scalar_one_or_none()
+                row = result.one_or_none()
 
-                if model is None:
+                if row is None:
                     logger.warning(f"Practice {practice_id} not found for user {uid}")
                     raise PracticeNotFoundException(f"Practice {practice_id} not found")
 
-                logger.info(f"Successfully fetched practice {practice_id} for uid={uid}")
-                return self._model_to_entity(model)
-
             except SQLAlchemyError as e:
                 logger.error(f"MySQL error fetching practice {practice_id} for uid={uid}: {e}", exc_info=True)
                 raise DatabaseConnectionException(f"Error fetching practice {practice_id}: {str(e)}")
 
-    def _model_to_entity(self, model: PracticeModel) -> Practice: 
-        dt = model.practice_datetime
+        scales = await scale_catalog.resolve([row.id_scale])
+
+        logger.debug("Successfully fetched practice %s for uid=%s", practice_id, uid)
+        return self._row_to_entity(row, scales)
+
+    async def get_practice_owner(self, practice_id: int) -> str:
+        async with mysql_connection.get_async_session() as session:
+            try:
+                result = await session.execute(
+                    select(PracticeModel.id_student).where(PracticeModel.id == practice_id)
+                )
+                uid = result.scalar_one_or_none()
+
+                if uid is None:
+                    logger.warning(f"Practice {practice_id} not found")
+                    raise PracticeNotFoundException(f"Practice {practice_id} not found")
+
+                return uid
+
+            except SQLAlchemyError as e:
+                logger.error(f"MySQL error fetching owner of practice {practice_id}: {e}", exc_info=True)
+                raise DatabaseConnectionException(f"Error fetching practice {practice_id}: {str(e)}")
+
+    def _before(self, practice_datetime, practice_id):
+        """Rows strictly after (practice_datetime, practice_id) in descending order."""
+        return or_(
+            PracticeModel.practice_datetime < practice_datetime,
+            and_(
+                PracticeModel.practice_datetime == practice_datetime,
+                PracticeModel.id < practice_id,
+            ),
+        )
+
+    def _select_practices(self):
+        """Selects only the columns a Practice needs, as plain rows.
+
+        Skips ORM instance hydration (identity map, attribute state) on the
+        read path. Scale names are resolved from the in-memory scale catalog
+        instead of joining the Scale table.
+        """
+        return select(
+            PracticeModel.id,
+            PracticeModel.practice_datetime,
+            PracticeModel.duration,
+            PracticeModel.bpm,
+            PracticeModel.figure,
+            PracticeModel.octaves,
+            PracticeModel.num_postural_errors,
+            PracticeModel.num_musical_errors,
+            PracticeModel.id_scale,
+        )
+
+    def _row_to_entity(self, row, scales: Dict[int, Tuple[str, str]]) -> Practice:
+        (practice_id, dt, duration, bpm, figure, octaves,
+         num_postural_errors, num_musical_errors, id_scale) = row
+        scale_name, scale_type = scales.get(id_scale, UNKNOWN_SCALE)
         return Practice(
-            id=model.id,
-            scale=model.scale.name if model.scale else "",
-            scale_type=model.scale.scale_type if model.scale else "",
-            duration=model.duration,
-            bpm=model.bpm,
-            figure=model.figure,
-            octaves=model.octaves,
-            num_postural_errors=model.num_postural_errors,
-            num_musical_errors=model.num_musical_errors,
-            date=dt.strftime("%Y-%m-%d"),
-            time=dt.strftime("%H:%M:%S"),
+            id=practice_id,
+            scale=scale_name,
+            scale_type=scale_type,
+            duration=duration,
+            bpm=bpm,
+            figure=figure,
+            octaves=octaves,
+            num_postural_errors=num_postural_errors,
+            num_musical_errors=num_musical_errors,
+            date=dt.date().isoformat(),
+            time=dt.time().isoformat(timespec="seconds"),
             state="",           # lo completa el use case
             local_video_url="", # lo completa el use case
             pdf_url="",         # lo completa el use case
@@ -0,0 +1,236 @@
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from sqlalchemy import and_, delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.exceptions import DatabaseConnectionException
+from app.core.metrics import instrument_repository
+from app.core.tracing import traced
+from app.domain.entities.practice_stats import PracticeStats, PracticeStatsTotals, ScaleStats, WeekStats
+from app.domain.repositories.practice_stats_repo import IPracticeStatsRepository
+from app.infrastructure.database.models.practice_model import PracticeModel
+from app.infrastructure.database.models.practice_stats_model import (
+    PracticeStatsPendingModel,
+    PracticeStatsRollupModel,
+    PracticeStatsWatermarkModel,
+)
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.database.scale_catalog import scale_catalog
+
+logger = logging.getLogger(__name__)
+
+RollupKey = Tuple[int, date]
+
+
+@traced
+@instrument_repository("mysql")
+class MySQLPracticeStatsRepository(IPracticeStatsRepository):
+    """Concrete implementation of IPracticeStatsRepository using MySQL.
+
+    PracticeStatsRollup keeps running totals per (student, scale, week) and
+    PracticeStatsWatermark the newest practice id folded into them, so a
+    refresh only reads the practices inserted since the previous one.
+    The watermark also moves past practices whose error counts are still
+    NULL (analysis pending); their ids go to PracticeStatsPending and are
+    folded in by a later refresh once the counts are written.
+    """
+
+    async def refresh_user_stats(self, uid: str) -> int:
+        try:
+            if not await self._has_new_practices(uid):
+                return 0
+            return await self._refresh(uid, rebuild=False)
+        except SQLAlchemyError as e:
+            logger.error(f"MySQL error refreshing practice stats for uid={uid}: {e}", exc_info=True)
+            raise DatabaseConnectionException(f"Error refreshing practice stats: {str(e)}")
+
+    async def rebuild_user_stats(self, uid: str) -> int:
+        try:
+            return await self._refresh(uid, rebuild=True)
+        except SQLAlchemyError as e:
+            logger.error(f"MySQL error rebuilding practice stats for uid={uid}: {e}", exc_info=True)
+            raise DatabaseConnectionException(f"Error rebuilding practice stats: {str(e)}")
+
+    async def get_user_stats(self, uid: str, weeks: int) -> PracticeStats:
+        try:
+            async with mysql_connection.get_async_session() as session:
+                result = await session.execute(
+                    select(PracticeStatsRollupModel).where(PracticeStatsRollupModel.id_student == uid)
+                )
+                rows = result.scalars().all()
+        except SQLAlchemyError as e:
+            logger.error(f"MySQL error reading practice stats for uid={uid}: {e}", exc_info=True)
+            raise DatabaseConnectionException(f"Error reading practice stats: {str(e)}")
+
+        stats = PracticeStats()
+        by_scale: Dict[int, ScaleStats] = {}
+        by_week: Dict[date, WeekStats] = {}
+        for row in rows:
+            self._accumulate(stats.totals, row)
+            self._accumulate(by_scale.setdefault(row.id_scale, ScaleStats(id_scale=row.id_scale)), row)
+            self._accumulate(by_week.setdefault(row.week_start, WeekStats(week_start=row.week_start)), row)
+
+        scales = await scale_catalog.resolve(by_scale.keys())
+        for scale_id, scale_stats in by_scale.items():
+            scale_stats.scale, scale_stats.scale_type = scales[scale_id]
+
+        stats.by_scale = sorted(by_scale.values(), key=lambda s: s.num_practices, reverse=True)
+        stats.by_week = sorted(by_week.values(), key=lambda w: w.week_start, reverse=True)[:weeks]
+        logger.debug("Read %s rollup rows for uid=%s", len(rows), uid)
+        return stats
+
+    async def _has_new_practices(self, uid: str) -> bool:
+        async with mysql_connection.get_async_session() as session:
+            newest_id = (await session.execute(
+                select(func.max(PracticeModel.id)).where(PracticeModel.id_student == uid)
+            )).scalar_one_or_none()
+            last_practice_id = (await session.execute(
+                select(PracticeStatsWatermarkModel.last_practice_id).where(PracticeStatsWatermarkModel.id_student == uid)
+            )).scalar_one_or_none()
+            if newest_id is not None and newest_id > (last_practice_id or 0):
+                return True
+
+            # Practices left pending by an earlier refresh whose analysis has finished since
+            ready = (await session.execute(
+                self._ready_pending_query(uid, PracticeStatsPendingModel.id_practice).limit(1)
+            )).first()
+            return ready is not None
+
+    async def _refresh(self, uid: str, rebuild: bool) -> int:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        await self._ensure_watermark(uid, now)
+        async with mysql_connection.get_async_session() as session:
+            async with session.begin():
+                # The watermark row lock serializes refreshes of the same user
+                watermark = (await session.execute(
+                    select(PracticeStatsWatermarkModel)
+                    .where(PracticeStatsWatermarkModel.id_student == uid)
+                    .with_for_update()
+                )).scalar_one()
+
+                if rebuild:
+                    await session.execute(delete(PracticeStatsRollupModel).where(PracticeStatsRollupModel.id_student == uid))
+                    await session.execute(delete(PracticeStatsPendingModel).where(PracticeStatsPendingModel.id_student == uid))
+                    watermark.last_practice_id = 0
+
+                new_practices = (await session.execute(
+                    select(*self._stats_columns())
+                    .where(PracticeModel.id_student == uid, PracticeModel.id > watermark.last_practice_id)
+                    .order_by(PracticeModel.id)
+                )).all()
+                ready = (await session.execute(self._ready_pending_query(uid, *self._stats_columns()))).all()
+                if not new_practices and not ready:
+                    return 0
+
+                analyzed = [p for p in new_practices if self._is_analyzed(p)]
+                pending_ids = [p.id for p in new_practices if not self._is_analyzed(p)]
+                if pending_ids:
+                    session.add_all([PracticeStatsPendingModel(id_student=uid, id_practice=pid) for pid in pending_ids])
+                if ready:
+                    await session.execute(delete(PracticeStatsPendingModel).where(
+                        PracticeStatsPendingModel.id_student == uid,
+                        PracticeStatsPendingModel.id_practice.in_([p.id for p in ready]),
+                    ))
+
+                practices = analyzed + ready
+                if practices:
+                    await self._fold(session, uid, practices)
+                if new_practices:
+                    watermark.last_practice_id = new_practices[-1].id
+                watermark.updated_at = now
+
+        logger.info("Folded %s practices into the stats rollup of uid=%s (%s pending analysis)", len(practices), uid, len(pending_ids))
+        return len(practices)
+
+    async def _ensure_watermark(self, uid: str, now: datetime) -> None:
+        """Creates the user's watermark row if missing, in its own transaction.
+
+        Inserting it after a SELECT ... FOR UPDATE that found nothing would
+        make two first-time refreshes deadlock on the gap lock; with the row
+        always present they just queue on its lock.
+        """
+        async with mysql_connection.get_async_session() as session:
+            async with session.begin():
+                await session.execute(
+                    insert(PracticeStatsWatermarkModel)
+                    .values(id_student=uid, last_practice_id=0, updated_at=now)
+                    .prefix_with("IGNORE", dialect="mysql")
+                    .prefix_with("OR IGNORE", dialect="sqlite")
+                )
+
+    def _stats_columns(self) -> tuple:
+        return (
+            PracticeModel.id,
+            PracticeModel.practice_datetime,
+            PracticeModel.id_scale,
+            PracticeModel.duration,
+            PracticeModel.bpm,
+            PracticeModel.num_postural_errors,
+            PracticeModel.num_musical_errors,
+        )
+
+    def _ready_pending_query(self, uid: str, *columns):
+        """Pending practices of the user whose error counts have been written."""
+        return (
+            select(*columns)
+            .select_from(PracticeStatsPendingModel)
+            .join(PracticeModel, PracticeModel.id == PracticeStatsPendingModel.id_practice)
+            .where(
+                PracticeStatsPendingModel.id_student == uid,
+                and_(PracticeModel.num_postural_errors.is_not(None), PracticeModel.num_musical_errors.is_not(None)),
+            )
+            .order_by(PracticeModel.id)
+        )
+
+    def _is_analyzed(self, practice) -> bool:
+        return practice.num_postural_errors is not None and practice.num_musical_errors is not None
+
+    async def _fold(self, session, uid: str, practices: List) -> None:
+        deltas: Dict[RollupKey, PracticeStatsTotals] = defaultdict(PracticeStatsTotals)
+        for p in practices:
+            week_start = p.practice_datetime.date() - timedelta(days=p.practice_datetime.weekday())
+            delta = deltas[(p.id_scale, week_start)]
+            delta.num_practices += 1
+            delta.total_duration += p.duration
+            delta.total_bpm += p.bpm
+            delta.total_postural_errors += int(p.num_postural_errors)
+            delta.total_musical_errors += int(p.num_musical_errors)
+
+        existing = {
+            (row.id_scale, row.week_start): row
+            for row in (await session.execute(
+                select(PracticeStatsRollupModel).where(
+                    PracticeStatsRollupModel.id_student == uid,
+                    PracticeStatsRollupModel.week_start.in_({week for _, week in deltas}),
+                )
+            )).scalars()
+        }
+        for (scale_id, week_start), delta in deltas.items():
+            row = existing.get((scale_id, week_start))
+            if row is None:
+                session.add(PracticeStatsRollupModel(
+                    id_student=uid,
+                    id_scale=scale_id,
+                    week_start=week_start,
+                    num_practices=delta.num_practices,
+                    total_duration=delta.total_duration,
+                    total_bpm=delta.total_bpm,
+                    total_postural_errors=delta.total_postural_errors,
+                    total_musical_errors=delta.total_musical_errors,
+                ))
+            else:
+                row.num_practices += delta.num_practices
+                row.total_duration += delta.total_duration
+                row.total_bpm += delta.total_bpm
+                row.total_postural_errors += delta.total_postural_errors
+                row.total_musical_errors += delta.total_musical_errors
+
+    def _accumulate(self, totals: PracticeStatsTotals, row: PracticeStatsRollupModel) -> None:
+        totals.num_practices += row.num_practices
+        totals.total_duration += float(row.total_duration)
+        totals.total_bpm += float(row.total_bpm)
+        totals.total_postural_errors += row.total_postural_errors
+        totals.total_musical_errors += row.total_musical_errors
@@ -1,11 +1,14 @@
 import logging
 import asyncio
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from app.core.config import settings
 from app.core.logging import configure_logging
+from app.core.metrics import render_metrics
+from app.core.tracing import tracer
 from app.core.exceptions import (
     DatabaseConnectionException,
     PosturalErrorNotFoundException,
@@ -16,6 +19,10 @@ from app.core.exceptions import (
     ValidationException,
 )
 from app.infrastructure.database import mongo_connection, mysql_connection
+from app.infrastructure.database.scale_catalog import scale_catalog
+from app.infrastructure.database.startup import initialize_databases, readiness, retry_with_backoff
+from app.presentation.middleware.metrics import MetricsMiddleware
+from app.presentation.middleware.tracing import TracingMiddleware
 from app.presentation.middleware.exception_handler import (
     database_connection_exception_handler,
     postural_error_not_found_exception_handler,
@@ -32,6 +39,12 @@ from app.presentation.api.v1.report import router as get_report
 from app.presentation.api.v1.postural_error import router as get_postural_errors
 from app.presentation.api.v1.musical_error import router as get_musical_errors
 from app.presentation.api.v1.practice_metadata import router as finish_practice
+from app.presentation.api.v1.internal import router as internal
+from app.presentation.api.v1.dependencies import (
+    get_mongo_metadata_repository,
+    get_span_exporter,
+    get_video_deletion_worker,
+)
 
 
 # Configure logging
@@ -39,48 +52,46 @@ configure_logging()
 logger = logging.getLogger(__name__)
 
 
-async def initialize_databases(retry_delay: int = 5):
-    mysql_connected = False
-    mongo_connected = False
-    attempt = 0
-    
-    while not (mysql_connected and mongo_connected):
-        logger.info(f"Reintentando conexión a BDs (intento {attempt + 1})...")
-        await asyncio.sleep(retry_delay)
-        
-        attempt += 1
-        
-        # MySQL
-        if not mysql_connected:
-            try:
-                mysql_connection.mysql_connection.init_engine()
-                await mysql_connection.mysql_connection.verify_connection()
-                mysql_connected = True
-            except Exception as e:
-                logger.warning(f"⚠️  MySQL connection failed: {e}")
-        
-        # MongoDB
-        if not mongo_connected:
-            try:
-                mongo_connection.mongo_connection.connect()
-                await mongo_connection.mongo_connection.verify_connection()
-                mongo_connected = True
-            except Exception as e:
-                logger.warning(f"⚠️  MongoDB connection failed: {e}")
-    
-    logger.info("✅ Todas las conexiones de BD establecidas y verificadas")
+async def start_dependencies():
+    """Connects the databases and warms up caches and workers, then marks the service ready."""
+    await initialize_databases()
+
+    async def warm_up():
+        await get_mongo_metadata_repository().ensure_indexes()
+
+        # ---------- Caches ----------
+        scale_catalog.refresh_interval = settings.SCALE_CATALOG_REFRESH_SECONDS
+        await scale_catalog.load()
+
+    try:
+        await retry_with_backoff("Startup warm-up", warm_up, settings.DB_CONNECT_BASE_DELAY, settings.DB_CONNECT_MAX_DELAY)
+
+        # ---------- Background workers ----------
+        get_video_deletion_worker().start()
+    except Exception as e:
+        logger.error(f"Startup failed, the service will stay not ready: {e}", exc_info=True)
+        raise
+
+    readiness.mark("startup")
+    logger.info(f"{settings.APP_NAME} ready")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Environment: {settings.APP_ENV}")
 
-    # ---------- DB Connections ----------
-    await initialize_databases(retry_delay=5)
-    
+    # Connections are opened in the background so /livez answers right away;
+    # /readyz reports 503 until they are up
+    startup = asyncio.create_task(start_dependencies())
+
     yield
 
     # ---------- Shutdown ----------
+    readiness.shutting_down = True
+    startup.cancel()
+    with suppress(asyncio.CancelledError, Exception):
+        await startup
+    await get_video_deletion_worker().stop()
     await mysql_connection.mysql_connection.close_connections()
     await mongo_connection.mongo_connection.close()
     logger.info("Database connections closed")
@@ -102,6 +113,20 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Tracing
+    if settings.TRACING_ENABLED:
+        tracer.set_exporter(get_span_exporter())
+        app.add_middleware(TracingMiddleware, server_timing=settings.TRACING_SERVER_TIMING)
+
+    # Metrics
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            content, content_type = render_metrics()
+            return Response(content=content, media_type=content_type)
+
     # Exception Handlers
     app.add_exception_handler(PracticeServiceException, practice_service_exception_handler)
     app.add_exception_handler(UserNotFoundException, user_not_found_exception_handler)
@@ -123,12 +148,26 @@ def create_application() -> FastAPI:
             "environment": settings.APP_ENV,
         }
 
+    # Probes
+    @app.get("/livez", include_in_schema=False)
+    async def livez():
+        return {"status": "alive"}
+
+    @app.get("/readyz", include_in_schema=False)
+    async def readyz():
+        content = {"status": "ready" if readiness.ready else "not_ready", "checks": readiness.checks()}
+        if not readiness.ready:
+            return JSONResponse(content, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return content
+
     # Routers
     app.include_router(get_practices)
     app.include_router(get_report)
     app.include_router(get_postural_errors)
     app.include_router(get_musical_errors)
     app.include_router(finish_practice)
+    if settings.INTERNAL_ENDPOINTS_ENABLED:
+        app.include_router(internal)
 
     return app
 
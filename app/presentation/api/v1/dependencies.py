@@ -1,22 +1,40 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.tracing import LoggingSpanExporter, NoopSpanExporter, SpanExporter
 from app.application.use_cases.finish_practice_use_case import FinishPracticeUseCase
+from app.application.use_cases.get_error_summary_use_case import GetErrorSummaryUseCase
 from app.application.use_cases.get_musical_errors_use_case import GetMusicalErrorsUseCase
+from app.application.use_cases.get_practice_stats_use_case import GetPracticeStatsUseCase
 from app.application.use_cases.get_postural_errors_use_case import GetPosturalErrorsUseCase
 from app.application.use_cases.get_report_use_case import GetReportUseCase
 from app.application.use_cases.get_user_practices_use_case import GetUserPracticesUseCase
+from app.domain.entities.practice_metadata import PracticeMetadata
+from app.domain.repositories.cache_repo import ICacheRepository
+from app.domain.repositories.video_deletion_queue_repo import IVideoDeletionQueue
 from app.domain.services.musical_error_service import MusicalErrorService
 from app.domain.services.postural_error_service import PosturalErrorService
 from app.domain.services.practice_metadata_service import PracticeMetadataService
 from app.domain.services.practice_service import PracticeService
+from app.domain.services.practice_stats_service import PracticeStatsService
 from app.domain.services.report_service import ReportService
 from app.domain.services.video_service import VideoService
+from app.infrastructure.cache.memory_cache import InMemoryCache
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.queue.sqlite_video_deletion_queue import SQLiteVideoDeletionQueue
+from app.infrastructure.queue.video_deletion_worker import VideoDeletionWorker
 from app.infrastructure.repositories.local_report_repo import LocalReportRepository
 from app.infrastructure.repositories.local_video_repo import LocalVideoRepository
 from app.infrastructure.repositories.mongo_metadata_repo import MongoMetadataRepository
 from app.infrastructure.repositories.mysql_musical_error_repo import MySQLMusicalErrorRepository
 from app.infrastructure.repositories.mysql_postural_error_repo import MySQLPosturalErrorRepository
 from app.infrastructure.repositories.mysql_practice_repo import MySQLPracticeRepository
+from app.infrastructure.repositories.mysql_practice_stats_repo import MySQLPracticeStatsRepository
+from app.shared.enums import CacheBackend, SpanExporterType
 
 
 # Repositories
@@ -25,10 +43,18 @@ def get_mysql_practice_repository() -> MySQLPracticeRepository:
     """Get instance of MySQLPracticeRepository."""
     return MySQLPracticeRepository()
 
+@lru_cache()
+def get_practice_stats_repository() -> MySQLPracticeStatsRepository:
+    """Get instance of MySQLPracticeStatsRepository."""
+    return MySQLPracticeStatsRepository()
+
 @lru_cache()
 def get_mongo_metadata_repository() -> MongoMetadataRepository:
     """Get instance of MongoMetadataRepository."""
-    return MongoMetadataRepository()
+    return MongoMetadataRepository(
+        layout=settings.MONGO_METADATA_LAYOUT,
+        collection_name=settings.MONGO_METADATA_COLLECTION,
+    )
 
 @lru_cache
 def get_local_report_repository() -> LocalReportRepository:
@@ -48,7 +74,50 @@ def get_musical_error_repository() -> MySQLMusicalErrorRepository:
 @lru_cache()
 def get_video_repository() -> LocalVideoRepository:
     """Get instance of LocalVideoRepository."""
-    return LocalVideoRepository() 
+    # Own bounded pool, so slow deletions cannot starve the loop's default executor
+    return LocalVideoRepository(
+        executor=ThreadPoolExecutor(
+            max_workers=settings.VIDEO_DELETION_CONCURRENCY,
+            thread_name_prefix="video-deletion",
+        )
+    )
+
+# Queues
+@lru_cache()
+def get_video_deletion_queue() -> IVideoDeletionQueue:
+    """Get the durable queue of pending video deletions."""
+    return SQLiteVideoDeletionQueue(
+        path=settings.VIDEO_DELETION_QUEUE_PATH
+        or os.path.join(settings.CONTAINER_PATH, ".video_deletion_queue.db"),
+        max_attempts=settings.VIDEO_DELETION_MAX_ATTEMPTS,
+    )
+
+# Caches
+@lru_cache()
+def get_metadata_cache() -> ICacheRepository | None:
+    """Get the practice metadata cache configured by METADATA_CACHE_BACKEND."""
+    backend = CacheBackend(settings.METADATA_CACHE_BACKEND)
+    if backend == CacheBackend.MEMORY:
+        return InMemoryCache(max_size=settings.METADATA_CACHE_MAX_SIZE)
+    if backend == CacheBackend.REDIS:
+        return RedisCache(Redis.from_url(settings.REDIS_URL), entity_type=PracticeMetadata)
+    return None
+
+@lru_cache()
+def get_error_summary_cache() -> ICacheRepository:
+    """Get the in-process cache of finished practices' error summaries."""
+    return InMemoryCache(max_size=settings.ERROR_SUMMARY_CACHE_MAX_SIZE)
+
+# Tracing
+@lru_cache()
+def get_span_exporter() -> SpanExporter:
+    """Get the span exporter configured by TRACING_EXPORTER."""
+    if SpanExporterType(settings.TRACING_EXPORTER) == SpanExporterType.LOG:
+        return LoggingSpanExporter(
+            slow_ms=settings.TRACING_SLOW_MS,
+            repeated_span_threshold=settings.TRACING_REPEATED_SPAN_THRESHOLD,
+        )
+    return NoopSpanExporter()
 
 # Services
 @lru_cache()
@@ -59,7 +128,16 @@ def get_practice_service() -> PracticeService:
 @lru_cache()
 def get_practice_metadata_service() -> PracticeMetadataService:
     """Get instance of PracticeMetadataService."""
-    return PracticeMetadataService(metadata_repository=get_mongo_metadata_repository())
+    return PracticeMetadataService(
+        metadata_repository=get_mongo_metadata_repository(),
+        cache=get_metadata_cache(),
+        cache_ttl=settings.METADATA_CACHE_TTL_SECONDS,
+    )
+
+@lru_cache()
+def get_practice_stats_service() -> PracticeStatsService:
+    """Get instance of PracticeStatsService."""
+    return PracticeStatsService(stats_repository=get_practice_stats_repository())
 
 @lru_cache()
 def get_report_service() -> ReportService:
@@ -79,12 +157,29 @@ def get_musical_error_service() -> MusicalErrorService:
 @lru_cache()
 def get_practice_metadata_service() -> PracticeMetadataService:
     """Get instance of PracticeMetadataService."""
-    return PracticeMetadataService(metadata_repository=get_mongo_metadata_repository())
+    return PracticeMetadataService(
+        metadata_repository=get_mongo_metadata_repository(),
+        cache=get_metadata_cache(),
+        cache_ttl=settings.METADATA_CACHE_TTL_SECONDS,
+    )
 
 @lru_cache()
 def get_video_service() -> VideoService:
     """Get instance of VideoService."""
-    return VideoService(video_repository=get_video_repository())
+    return VideoService(
+        video_repository=get_video_repository(),
+        deletion_queue=get_video_deletion_queue(),
+    )
+
+@lru_cache()
+def get_video_deletion_worker() -> VideoDeletionWorker:
+    """Get the background worker draining the video deletion queue."""
+    return VideoDeletionWorker(
+        queue=get_video_deletion_queue(),
+        video_service=get_video_service(),
+        concurrency=settings.VIDEO_DELETION_CONCURRENCY,
+        poll_interval=settings.VIDEO_DELETION_POLL_SECONDS,
+    )
 
 
 # Use Cases
@@ -96,6 +191,11 @@ def get_practices_for_user_use_case() -> GetUserPracticesUseCase:
         practice_metadata_service=get_practice_metadata_service()
     )
     
+@lru_cache()
+def get_practice_stats_use_case() -> GetPracticeStatsUseCase:
+    """Get instance of GetPracticeStatsUseCase."""
+    return GetPracticeStatsUseCase(practice_stats_service=get_practice_stats_service())
+
 @lru_cache()
 def get_report_use_case() -> GetReportUseCase:
     """Get instance of GetReportUseCase."""
@@ -111,6 +211,17 @@ def get_musical_errors_use_case() -> GetMusicalErrorsUseCase:
     """Get instance of GetMusicalErrorsUseCase."""
     return GetMusicalErrorsUseCase(musical_error_service=get_musical_error_service())
 
+@lru_cache()
+def get_error_summary_use_case() -> GetErrorSummaryUseCase:
+    """Get instance of GetErrorSummaryUseCase."""
+    return GetErrorSummaryUseCase(
+        musical_error_service=get_musical_error_service(),
+        postural_error_service=get_postural_error_service(),
+        practice_service=get_practice_service(),
+        practice_metadata_service=get_practice_metadata_service(),
+        cache=get_error_summary_cache(),
+    )
+
 @lru_cache()
 def get_finish_practice_use_case() -> FinishPracticeUseCase:
     """Get instance of FinishPracticeUseCase."""
@@ -124,6 +235,10 @@ def get_user_practices_use_case_dependency() -> GetUserPracticesUseCase:
     """Dependency for injecting GetUserPracticesUseCase."""
     return get_practices_for_user_use_case()
 
+def get_practice_stats_use_case_dependency() -> GetPracticeStatsUseCase:
+    """Dependency for injecting GetPracticeStatsUseCase."""
+    return get_practice_stats_use_case()
+
 def get_report_use_case_dependency() -> GetReportUseCase:
     """Dependency for injecting GetReportUseCase."""
     return get_report_use_case()
@@ -136,6 +251,10 @@ def get_musical_errors_use_case_dependency() -> GetMusicalErrorsUseCase:
     """Dependency for injecting GetMusicalErrorsUseCase."""
     return get_musical_errors_use_case()
 
+def get_error_summary_use_case_dependency() -> GetErrorSummaryUseCase:
+    """Dependency for injecting GetErrorSummaryUseCase."""
+    return get_error_summary_use_case()
+
 def get_finish_practice_use_case_dependency() -> FinishPracticeUseCase:
     """Dependency for injecting FinishPracticeUseCase."""
     return get_finish_practice_use_case()
\ No newline at end of file
@@ -0,0 +1,34 @@
+import logging
+from typing import Any, Dict
+from fastapi import APIRouter, status
+
+from app.infrastructure.database.mongo_connection import mongo_connection
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.presentation.schemas.common_schema import StandardResponse
+
+logger = logging.getLogger(__name__)
+
+# Operator-only: mounted when INTERNAL_ENDPOINTS_ENABLED is set, and kept out of the OpenAPI schema
+router = APIRouter(prefix="/internal", tags=["Internal"], include_in_schema=False)
+
+
+@router.get(
+    "/pools",
+    response_model=StandardResponse[Dict[str, Any]],
+    status_code=status.HTTP_200_OK,
+    summary="Connection pool statistics",
+    description="Live MySQL and MongoDB pool usage: checked out connections, overflow, waiters and checkout wait times"
+)
+async def get_pool_stats():
+    """
+    Endpoint for operators to size the connection pools:
+    - `mysql`: SQLAlchemy pool counters and checkout wait histogram.
+    - `mongo`: driver pool counters aggregated over all servers and checkout wait histogram.
+    """
+    return StandardResponse.success(
+        data={
+            "mysql": mysql_connection.pool_stats(),
+            "mongo": mongo_connection.pool_stats(),
+        },
+        message="Pool statistics retrieved successfully"
+    )
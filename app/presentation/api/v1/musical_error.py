@@ -1,33 +1,167 @@
 import logging
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
-from typing import List
+from typing import List, Optional
+from app.application.use_cases.get_error_summary_use_case import GetErrorSummaryUseCase
 from app.application.use_cases.get_musical_errors_use_case import GetMusicalErrorsUseCase
-from app.presentation.api.v1.dependencies import get_musical_errors_use_case_dependency
+from app.core.config import settings
+from app.presentation.api.v1.dependencies import get_error_summary_use_case_dependency, get_musical_errors_use_case_dependency
+from app.presentation.responses import NDJSON_MEDIA_TYPE, accepts_ndjson, fast_success, ndjson_response
 from app.presentation.schemas.common_schema import StandardResponse
-from app.presentation.schemas.musical_error_schema import MusicalErrorItem, MusicalErrorResponse
+from app.presentation.schemas.musical_error_schema import (
+    MusicalErrorBatchItem,
+    MusicalErrorBatchResponse,
+    MusicalErrorItem,
+    MusicalErrorResponse,
+    MusicalErrorSummaryResponse,
+    NoteErrorCountItem,
+    TimeBucketItem,
+    musical_error_item_payload,
+)
+from app.shared.constants import ERRORS_BATCH_MAX_IDS, ERRORS_PAGE_MAX_LIMIT
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/musical-errors", tags=["Musical Errors"])
 
 
+# Declared before /{practice_id} so "batch" is not parsed as a practice id
+@router.get(
+    "/batch",
+    response_model=StandardResponse[MusicalErrorBatchResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get musical errors for several practices",
+    description=(
+        f"Retrieve the musical errors of up to {ERRORS_BATCH_MAX_IDS} practices in one request, "
+        "grouped by practice. Practices without errors are returned with an empty list."
+    )
+)
+async def get_musical_errors_batch(
+    practice_ids: List[int] = Query(..., description="Practice IDs (repeat the parameter for each id)"),
+    use_case: GetMusicalErrorsUseCase = Depends(get_musical_errors_use_case_dependency)
+):
+    """Endpoint that retrieves musical errors for several practices with a single query."""
+
+    logger.info("Retrieving musical errors for %s practices", len(practice_ids))
+
+    errors_by_practice = await use_case.execute_batch(practice_ids=practice_ids)
+    message = f"Retrieved musical errors for {len(errors_by_practice)} practices"
+
+    if settings.FAST_JSON_RESPONSES:
+        return fast_success(
+            data={
+                "practices": [
+                    {
+                        "practice_id": practice_id,
+                        "num_errors": len(errors),
+                        "errors": [musical_error_item_payload(e) for e in errors],
+                    }
+                    for practice_id, errors in errors_by_practice.items()
+                ]
+            },
+            message=message
+        )
+
+    response = MusicalErrorBatchResponse(
+        practices=[
+            MusicalErrorBatchItem(
+                practice_id=practice_id,
+                num_errors=len(errors),
+                errors=[MusicalErrorItem(
+                    min_sec=e.min_sec,
+                    note_played=e.note_played,
+                    note_correct=e.note_correct
+                ) for e in errors]
+            )
+            for practice_id, errors in errors_by_practice.items()
+        ]
+    )
+
+    return StandardResponse.success(data=response, message=message)
+
+
+@router.get(
+    "/{practice_id}/summary",
+    response_model=StandardResponse[MusicalErrorSummaryResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get musical error histograms for a practice",
+    description="Count the musical errors of a practice by (correct, played) note pair and by time bucket, computed in the database"
+)
+async def get_musical_errors_summary(
+    practice_id: int,
+    bucket_sec: int = Query(60, ge=1, le=3600, description="Width of the time buckets in seconds"),
+    use_case: GetErrorSummaryUseCase = Depends(get_error_summary_use_case_dependency)
+):
+    """Endpoint that retrieves the musical error histograms of a practice."""
+
+    logger.info("Retrieving musical error summary for practice_id=%s", practice_id)
+
+    summary = await use_case.musical_summary(practice_id=practice_id, bucket_sec=bucket_sec)
+
+    response = MusicalErrorSummaryResponse(
+        total=summary.total,
+        bucket_sec=summary.bucket_sec,
+        by_note=[NoteErrorCountItem(note_correct=n.note_correct, note_played=n.note_played, count=n.count) for n in summary.by_note],
+        by_time=[TimeBucketItem(start_sec=b.start_sec, count=b.count) for b in summary.by_time],
+    )
+
+    return StandardResponse.success(
+        data=response,
+        message=f"Summarized {summary.total} musical errors for practice {practice_id}"
+    )
+
+
 @router.get(
     "/{practice_id}",
     response_model=StandardResponse[MusicalErrorResponse],
     status_code=status.HTTP_200_OK,
     summary="Get musical errors for a practice",
-    description="Retrieve all musical errors detected for a specific practice ID"
+    description=(
+        "Retrieve all musical errors detected for a specific practice ID. With "
+        f"`Accept: {NDJSON_MEDIA_TYPE}` the errors are streamed as they are read, one "
+        "MusicalErrorItem per line. Passing limit, cursor, from_sec or to_sec returns one "
+        "page ordered by time instead."
+    ),
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}}
 )
 async def get_musical_errors(
     practice_id: int,
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=ERRORS_PAGE_MAX_LIMIT, description="Maximum number of errors to return (enables pagination)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+    from_sec: Optional[int] = Query(None, ge=0, description="Only errors at or after this second of the practice"),
+    to_sec: Optional[int] = Query(None, ge=0, description="Only errors at or before this second of the practice"),
     use_case: GetMusicalErrorsUseCase = Depends(get_musical_errors_use_case_dependency)
 ):
     """Endpoint that retrieves musical errors for a given practice."""
 
-    logger.info(f"Retrieving musical errors for practice_id={practice_id}")
+    paginated = any(value is not None for value in (limit, cursor, from_sec, to_sec))
+
+    if not paginated and accepts_ndjson(request.headers):
+        logger.info("Streaming musical errors for practice_id=%s", practice_id)
+        return await ndjson_response(use_case.stream(practice_id=practice_id), musical_error_item_payload)
 
-    errors_dto: List = await use_case.execute(practice_id=practice_id)
+    logger.info("Retrieving musical errors for practice_id=%s", practice_id)
+
+    next_cursor = None
+    if paginated:
+        page = await use_case.execute_page(
+            practice_id=practice_id, limit=limit, cursor=cursor, from_sec=from_sec, to_sec=to_sec
+        )
+        errors_dto: List = page.errors
+        next_cursor = page.next_cursor
+    else:
+        errors_dto: List = await use_case.execute(practice_id=practice_id)
+
+    if settings.FAST_JSON_RESPONSES:
+        return fast_success(
+            data={
+                "num_errors": len(errors_dto),
+                "errors": [musical_error_item_payload(e) for e in errors_dto],
+                "next_cursor": next_cursor,
+            },
+            message=f"Retrieved {len(errors_dto)} musical errors for practice {practice_id}"
+        )
 
     items = [
         MusicalErrorItem(
@@ -40,7 +174,8 @@ async def get_musical_errors(
 
     response = MusicalErrorResponse(
         num_errors=len(items),
-        errors=items
+        errors=items,
+        next_cursor=next_cursor
     )
 
     return StandardResponse.success(
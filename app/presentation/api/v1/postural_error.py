@@ -1,36 +1,159 @@
 import logging
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
-from typing import List
+from typing import List, Optional
+from app.application.use_cases.get_error_summary_use_case import GetErrorSummaryUseCase
 from app.application.use_cases.get_postural_errors_use_case import GetPosturalErrorsUseCase
-from app.presentation.api.v1.dependencies import get_postural_errors_use_case_dependency
+from app.core.config import settings
+from app.presentation.api.v1.dependencies import get_error_summary_use_case_dependency, get_postural_errors_use_case_dependency
+from app.presentation.responses import fast_success
 from app.presentation.schemas.common_schema import StandardResponse
 from app.presentation.schemas.postural_error_schema import (
+    ExplicationSummaryItem,
+    PosturalErrorBatchItem,
+    PosturalErrorBatchResponse,
     PosturalErrorItem,
     PosturalErrorResponse,
+    PosturalErrorSummaryResponse,
+    postural_error_item_payload,
 )
+from app.shared.constants import ERRORS_BATCH_MAX_IDS, ERRORS_PAGE_MAX_LIMIT
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/postural-errors", tags=["Postural Errors"])
 
 
+# Declared before /{practice_id} so "batch" is not parsed as a practice id
+@router.get(
+    "/batch",
+    response_model=StandardResponse[PosturalErrorBatchResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get postural errors for several practices",
+    description=(
+        f"Retrieve the postural errors of up to {ERRORS_BATCH_MAX_IDS} practices in one request, "
+        "grouped by practice. Practices without errors are returned with an empty list."
+    )
+)
+async def get_postural_errors_batch(
+    practice_ids: List[int] = Query(..., description="Practice IDs (repeat the parameter for each id)"),
+    use_case: GetPosturalErrorsUseCase = Depends(get_postural_errors_use_case_dependency)
+):
+    """Endpoint that retrieves postural errors for several practices with a single query."""
+
+    logger.info("Retrieving postural errors for %s practices", len(practice_ids))
+
+    errors_by_practice = await use_case.execute_batch(practice_ids=practice_ids)
+    message = f"Retrieved postural errors for {len(errors_by_practice)} practices"
+
+    if settings.FAST_JSON_RESPONSES:
+        return fast_success(
+            data={
+                "practices": [
+                    {
+                        "practice_id": practice_id,
+                        "num_errors": len(errors),
+                        "errors": [postural_error_item_payload(e) for e in errors],
+                    }
+                    for practice_id, errors in errors_by_practice.items()
+                ]
+            },
+            message=message
+        )
+
+    response = PosturalErrorBatchResponse(
+        practices=[
+            PosturalErrorBatchItem(
+                practice_id=practice_id,
+                num_errors=len(errors),
+                errors=[PosturalErrorItem(
+                    min_sec_init=e.min_sec_init,
+                    min_sec_end=e.min_sec_end,
+                    explication=e.explication,
+                ) for e in errors]
+            )
+            for practice_id, errors in errors_by_practice.items()
+        ]
+    )
+
+    return StandardResponse.success(data=response, message=message)
+
+
+@router.get(
+    "/{practice_id}/summary",
+    response_model=StandardResponse[PosturalErrorSummaryResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get postural error totals for a practice",
+    description="Total duration of the postural errors of a practice and counts by explanation, computed in the database"
+)
+async def get_postural_errors_summary(
+    practice_id: int,
+    use_case: GetErrorSummaryUseCase = Depends(get_error_summary_use_case_dependency)
+):
+    """Endpoint that retrieves the postural error totals of a practice."""
+
+    logger.info("Retrieving postural error summary for practice_id=%s", practice_id)
+
+    summary = await use_case.postural_summary(practice_id=practice_id)
+
+    response = PosturalErrorSummaryResponse(
+        total=summary.total,
+        total_duration_sec=summary.total_duration_sec,
+        by_explication=[
+            ExplicationSummaryItem(explication=e.explication, count=e.count, duration_sec=e.duration_sec)
+            for e in summary.by_explication
+        ],
+    )
+
+    return StandardResponse.success(
+        data=response,
+        message=f"Summarized {summary.total} postural errors for practice {practice_id}"
+    )
+
+
 @router.get(
     "/{practice_id}",
     response_model=StandardResponse[PosturalErrorResponse],
     status_code=status.HTTP_200_OK,
     summary="Get postural errors for a practice",
-    description="Retrieve all postural errors detected for a specific practice ID"
+    description=(
+        "Retrieve all postural errors detected for a specific practice ID. Passing limit, cursor, "
+        "from_sec or to_sec returns one page ordered by start time instead."
+    )
 )
 async def get_postural_errors(
     practice_id: int,
+    limit: Optional[int] = Query(None, ge=1, le=ERRORS_PAGE_MAX_LIMIT, description="Maximum number of errors to return (enables pagination)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+    from_sec: Optional[int] = Query(None, ge=0, description="Only errors starting at or after this second of the practice"),
+    to_sec: Optional[int] = Query(None, ge=0, description="Only errors starting at or before this second of the practice"),
     use_case: GetPosturalErrorsUseCase = Depends(get_postural_errors_use_case_dependency)
 ):
     """Endpoint that retrieves postural errors for a given practice."""
 
-    logger.info(f"Retrieving postural errors for practice_id={practice_id}")
+    paginated = any(value is not None for value in (limit, cursor, from_sec, to_sec))
 
-    errors_dto: List = await use_case.execute(practice_id=practice_id)
+    logger.info("Retrieving postural errors for practice_id=%s", practice_id)
+
+    next_cursor = None
+    if paginated:
+        page = await use_case.execute_page(
+            practice_id=practice_id, limit=limit, cursor=cursor, from_sec=from_sec, to_sec=to_sec
+        )
+        errors_dto: List = page.errors
+        next_cursor = page.next_cursor
+    else:
+        errors_dto: List = await use_case.execute(practice_id=practice_id)
+
+    if settings.FAST_JSON_RESPONSES:
+        return fast_success(
+            data={
+                "num_errors": len(errors_dto),
+                "errors": [postural_error_item_payload(e) for e in errors_dto],
+                "next_cursor": next_cursor,
+            },
+            message=f"Retrieved {len(errors_dto)} postural errors for practice {practice_id}"
+        )
 
     items = [
         PosturalErrorItem(
@@ -43,7 +166,8 @@ async def get_postural_errors(
 
     response = PosturalErrorResponse(
         num_errors=len(items),
-        errors=items
+        errors=items,
+        next_cursor=next_cursor
     )
 
     return StandardResponse.success(
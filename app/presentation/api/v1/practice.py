@@ -1,12 +1,18 @@
 import logging
+from dataclasses import asdict
 from fastapi import APIRouter, Depends, status, Query, Path, HTTPException
 from typing import List, Optional
 from datetime import date
 
+from app.application.use_cases.get_practice_stats_use_case import GetPracticeStatsUseCase
 from app.application.use_cases.get_user_practices_use_case import GetUserPracticesUseCase
-from app.presentation.api.v1.dependencies import get_user_practices_use_case_dependency
+from app.core.config import settings
+from app.presentation.api.v1.dependencies import get_practice_stats_use_case_dependency, get_user_practices_use_case_dependency
+from app.presentation.responses import fast_success
 from app.presentation.schemas.common_schema import StandardResponse
-from app.presentation.schemas.practice_schema import PracticeItem, PracticeResponse
+from app.presentation.schemas.practice_schema import PracticeItem, PracticeResponse, practice_item_payload
+from app.presentation.schemas.practice_stats_schema import PracticeStatsResponse, ScaleStatsItem, StatsItem, WeekStatsItem
+from app.shared.constants import PRACTICE_STATS_WEEKS
 
 
 logger = logging.getLogger(__name__)
@@ -22,15 +28,26 @@ router = APIRouter(prefix="/practice", tags=["Practices"])
 )
 async def get_user_practices(
     uid: str,
-    last_id: Optional[int] = Query(None, description="ID of the last practice from previous page for pagination"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+    last_id: Optional[int] = Query(None, description="ID of the last practice from previous page for pagination (prefer cursor)"),
     limit: Optional[int] = Query(None, description="Maximum number of practices to return"),
     use_case: GetUserPracticesUseCase = Depends(get_user_practices_use_case_dependency)
 ):
     """Endpoint that retrieves practices for a user within a given date range.""" 
 
-    logger.info(f"Retrieving practices for user {uid} with last_id={last_id} and limit {limit}")
+    logger.info("Retrieving practices for user %s with last_id=%s, cursor=%s and limit %s", uid, last_id, cursor, limit)
 
-    practices_dto: List = await use_case.get_all(uid=uid, last_id=last_id, limit=limit)
+    page = await use_case.get_all(uid=uid, last_id=last_id, limit=limit, cursor=cursor)
+
+    if settings.FAST_JSON_RESPONSES:
+        return fast_success(
+            data={
+                "num_practices": len(page.practices),
+                "practices": [practice_item_payload(p) for p in page.practices],
+                "next_cursor": page.next_cursor,
+            },
+            message=f"Retrieved {len(page.practices)} practices for user {uid}"
+        )
 
     # DTOs → PracticeItem
     items = [
@@ -50,12 +67,13 @@ async def get_user_practices(
             local_video_url=p.local_video_url,
             pdf_url=p.pdf_url,
         )
-        for p in practices_dto
+        for p in page.practices
     ]
 
     response = PracticeResponse(
         num_practices=len(items),
-        practices=items
+        practices=items,
+        next_cursor=page.next_cursor
     )
 
     return StandardResponse.success(
@@ -64,6 +82,37 @@ async def get_user_practices(
     )
 
 
+# Declared before /{uid}/{practice_id} so "stats" is not parsed as a practice id
+@router.get(
+    "/{uid}/stats",
+    response_model=StandardResponse[PracticeStatsResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get progress statistics for a user",
+    description="Average BPM, error rates per minute and total practice time, overall, per scale and per week"
+)
+async def get_user_practice_stats(
+    uid: str,
+    weeks: int = Query(PRACTICE_STATS_WEEKS, ge=1, le=104, description="Number of most recent weeks with practices to return"),
+    use_case: GetPracticeStatsUseCase = Depends(get_practice_stats_use_case_dependency)
+):
+    """Endpoint that retrieves the progress statistics of a user."""
+
+    logger.info("Retrieving practice stats for user %s", uid)
+
+    stats = await use_case.execute(uid=uid, weeks=weeks)
+
+    response = PracticeStatsResponse(
+        totals=StatsItem(**asdict(stats.totals)),
+        by_scale=[ScaleStatsItem(**asdict(s)) for s in stats.by_scale],
+        by_week=[WeekStatsItem(**asdict(w)) for w in stats.by_week],
+    )
+
+    return StandardResponse.success(
+        data=response,
+        message=f"Retrieved stats of {stats.totals.num_practices} practices for user {uid}"
+    )
+
+
 @router.get(
     "/{uid}/{practice_id}",
     response_model=StandardResponse[PracticeItem],
@@ -78,10 +127,16 @@ async def get_practice_by_id(
 ):
     """Endpoint that retrieves a specific practice by ID with current state from database."""
     
-    logger.info(f"Retrieving practice {practice_id} for user {uid}")
+    logger.info("Retrieving practice %s for user %s", practice_id, uid)
     
     # Obtener la práctica específica usando el use case existente
     practice = await use_case.get_one(uid=uid, practice_id=practice_id)
+
+    if settings.FAST_JSON_RESPONSES:
+        return fast_success(
+            data=practice_item_payload(practice),
+            message=f"Practice {practice_id} retrieved successfully"
+        )
         
     # Convertir DTO a PracticeItem
     item = PracticeItem(
@@ -101,7 +156,7 @@ async def get_practice_by_id(
         pdf_url=practice.pdf_url,
     )
         
-    logger.info(f"Successfully retrieved practice {practice_id} with state '{practice.state}' for user {uid}")
+    logger.info("Successfully retrieved practice %s with state '%s' for user %s", practice_id, practice.state, uid)
         
     return StandardResponse.success(
         data=item,
@@ -1,10 +1,17 @@
 import logging
-from fastapi import APIRouter, Depends, status, Path
+from fastapi import APIRouter, Body, Depends, status, Path
 
+from app.application.dto.practice_metadata_dto import PracticeMetadataDTO
 from app.application.use_cases.finish_practice_use_case import FinishPracticeUseCase
 from app.presentation.api.v1.dependencies import get_finish_practice_use_case_dependency
 from app.presentation.schemas.common_schema import StandardResponse
-from app.presentation.schemas.practice_metadata_schema import PracticeMetadataResponse
+from app.presentation.schemas.practice_metadata_schema import (
+    FinishPracticeBatchItem,
+    FinishPracticeBatchRequest,
+    FinishPracticeBatchResponse,
+    PracticeMetadataResponse,
+)
+from app.shared.constants import FINISH_BATCH_MAX_IDS
 
 logger = logging.getLogger(__name__)
 
@@ -29,19 +36,64 @@ async def finish_practice(
     - Returns updated practice metadata.
     """
 
-    logger.info(f"Finishing practice {practice_id} for user {uid}")
+    logger.info("Finishing practice %s for user %s", practice_id, uid)
 
     practice_metadata_dto = await use_case.execute(uid=uid, practice_id=practice_id)
 
-    response = PracticeMetadataResponse(
+    response = _metadata_response(practice_metadata_dto)
+
+    return StandardResponse.success(
+        data=response,
+        message=f"Practice {practice_id} finished successfully for user {uid}"
+    )
+
+
+@router.patch(
+    "/{uid}/finish",
+    response_model=StandardResponse[FinishPracticeBatchResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Finish several practices",
+    description=(
+        f"Finish up to {FINISH_BATCH_MAX_IDS} practices of a user in one request. "
+        "Practices that do not exist are reported as not finished instead of failing the request."
+    )
+)
+async def finish_practices(
+    uid: str = Path(..., description="User unique identifier"),
+    request: FinishPracticeBatchRequest = Body(...),
+    use_case: FinishPracticeUseCase = Depends(get_finish_practice_use_case_dependency)
+):
+    """
+    Endpoint that finishes several practices of a user with a single metadata update:
+    - Clears the `video_in_local` field of every practice found.
+    - Returns the result of each requested practice.
+    """
+
+    logger.info("Finishing %s practices for user %s", len(request.practice_ids), uid)
+
+    results = await use_case.execute_batch(uid=uid, practice_ids=request.practice_ids)
+
+    items = [
+        FinishPracticeBatchItem(
+            id_practice=practice_id,
+            finished=metadata is not None,
+            metadata=_metadata_response(metadata) if metadata is not None else None,
+        )
+        for practice_id, metadata in results.items()
+    ]
+    num_finished = sum(item.finished for item in items)
+
+    return StandardResponse.success(
+        data=FinishPracticeBatchResponse(num_finished=num_finished, practices=items),
+        message=f"Finished {num_finished} of {len(items)} practices for user {uid}"
+    )
+
+
+def _metadata_response(practice_metadata_dto: PracticeMetadataDTO) -> PracticeMetadataResponse:
+    return PracticeMetadataResponse(
         id_practice=practice_metadata_dto.id_practice,
         video_in_local=practice_metadata_dto.video_in_local,
         report=practice_metadata_dto.report,
         video_done=practice_metadata_dto.video_done,
         audio_done=practice_metadata_dto.audio_done,
     )
-
-    return StandardResponse.success(
-        data=response,
-        message=f"Practice {practice_id} finished successfully for user {uid}"
-    )
@@ -1,28 +1,45 @@
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import FileResponse, Response
 from app.application.use_cases.get_report_use_case import GetReportUseCase
-import io
 
 from app.presentation.api.v1.dependencies import get_report_use_case_dependency
+from app.presentation.responses import file_validators, is_not_modified
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
+# Reports can be regenerated, so clients must revalidate (cheap with the ETag)
+REPORT_CACHE_CONTROL = "private, no-cache"
+
 @router.get(
     "/{uid}/{practice_id}",
-    response_class=StreamingResponse,
+    response_class=FileResponse,
     status_code=status.HTTP_200_OK,
     summary="Download practice report",
-    description="Download the PDF report for a specific practice"
+    description=(
+        "Download the PDF report for a specific practice. Supports Range requests "
+        "and conditional requests (If-None-Match / If-Modified-Since return 304)."
+    ),
+    responses={
+        206: {"description": "Partial content for a Range request"},
+        304: {"description": "Report not modified since the cached version"},
+    },
 )
 async def download_report(
     uid: str,
     practice_id: int,
+    request: Request,
     use_case: GetReportUseCase = Depends(get_report_use_case_dependency),
 ):
-    pdf_content = await use_case.execute(uid, practice_id)
+    report_file = await use_case.get_file(uid, practice_id)
+    headers = {**file_validators(report_file.size, report_file.modified_ns), "cache-control": REPORT_CACHE_CONTROL}
+
+    if is_not_modified(request.headers, headers):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    return StreamingResponse(
-        io.BytesIO(pdf_content),
+    # Streamed from disk in chunks (or handed to the server via pathsend when supported)
+    return FileResponse(
+        report_file.path,
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename=report_{practice_id}.pdf"}
+        filename=f"report_{practice_id}.pdf",
+        headers=headers,
     )
@@ -0,0 +1,75 @@
+import time
+
+from app.core.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUEST_SIZE,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_METHODS,
+    HTTP_RESPONSE_SIZE,
+    OTHER_METHOD,
+    UNMATCHED_ROUTE,
+)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request latency, in-flight requests and payload sizes.
+
+    Requests are labeled with the route template (e.g. `/practice/{uid}`) that
+    the router stores in the scope, never with the raw path, and non-standard
+    methods are grouped under `other`. It wraps `send`
+    instead of using BaseHTTPMiddleware, so streamed and file responses are
+    passed through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"] if scope["method"] in HTTP_METHODS else OTHER_METHOD
+        status_code = 500
+        response_size = 0
+        size_from_header = False
+
+        async def send_with_metrics(message):
+            nonlocal status_code, response_size, size_from_header
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_length = _content_length(message.get("headers", ()))
+                if content_length is not None:
+                    response_size = content_length
+                    size_from_header = True
+            elif message["type"] == "http.response.body" and not size_from_header:
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            HTTP_REQUEST_DURATION.labels(method, route, str(status_code)).observe(elapsed)
+            HTTP_RESPONSE_SIZE.labels(method, route).observe(response_size)
+            request_size = _content_length(scope.get("headers", ()))
+            if request_size is not None:
+                HTTP_REQUEST_SIZE.labels(method, route).observe(request_size)
+
+
+def _content_length(headers):
+    """The Content-Length header as an int, or None when missing or malformed."""
+    for key, value in headers:
+        if key.lower() == b"content-length":
+            try:
+                length = int(value)
+            except ValueError:
+                return None
+            return length if length >= 0 else None
+    return None
@@ -0,0 +1,60 @@
+import re
+import time
+
+from app.core.metrics import UNMATCHED_ROUTE
+from app.core.tracing import new_id, span, start_trace, tracer
+
+# W3C trace-id: 32 lowercase hex characters, not all zeros
+_TRACE_ID = re.compile(r"(?!0{32})[0-9a-f]{32}")
+
+
+class TracingMiddleware:
+    """Pure ASGI middleware opening one trace per HTTP request.
+
+    The trace id is taken from an incoming W3C `traceparent` header when
+    present and valid, so spans can be joined with the caller's trace;
+    anything else gets a fresh id, since it is echoed in headers and logs. The response
+    carries the trace id (`X-Trace-Id`) and a `Server-Timing` header with the
+    time spent per span name; spans still open when the headers are sent
+    (e.g. a streamed body) only reach the exporter.
+    """
+
+    def __init__(self, app, server_timing: bool = True):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with start_trace(_trace_id_from_headers(scope.get("headers", ()))) as trace:
+            with span("total") as root:
+
+                async def send_with_trace(message):
+                    if message["type"] == "http.response.start":
+                        headers = list(message.get("headers", ()))
+                        headers.append((b"x-trace-id", trace.trace_id.encode("latin-1")))
+                        if self.server_timing:
+                            root.duration = time.perf_counter() - root.start
+                            headers.append((b"server-timing", trace.server_timing().encode("latin-1")))
+                        message = {**message, "headers": headers}
+                    await send(message)
+
+                try:
+                    await self.app(scope, receive, send_with_trace)
+                finally:
+                    route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                    trace.name = f"{scope['method']} {route}"
+
+        tracer.export(trace)
+
+
+def _trace_id_from_headers(headers) -> str:
+    for key, value in headers:
+        if key.lower() == b"traceparent":
+            # version-traceid-parentid-flags
+            parts = value.decode("latin-1").split("-")
+            if len(parts) == 4 and _TRACE_ID.fullmatch(parts[1]):
+                return parts[1]
+    return new_id(16)
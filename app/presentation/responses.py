@@ -0,0 +1,110 @@
+from decimal import Decimal
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, AsyncIterator, Callable, Dict
+
+import orjson
+from fastapi.responses import Response, StreamingResponse
+from starlette.datastructures import Headers
+
+from app.shared.constants import STREAM_YIELD_PER
+from app.shared.enums import ResponseCode
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _default(obj: Any) -> Any:
+    # MySQL Numeric columns come back as Decimal
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    raise TypeError(f"Type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson, without Pydantic validation."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default)
+
+
+def fast_success(data: Any = None, message: str = "Success", code: str = ResponseCode.SUCCESS) -> ORJSONResponse:
+    """Builds a StandardResponse-shaped body straight from plain data.
+
+    Returning a Response from an endpoint makes FastAPI skip `response_model`
+    validation, while the declared `response_model` still documents the
+    schema in OpenAPI. `data` must already match that schema.
+    """
+    return ORJSONResponse({"code": code, "message": message, "data": data})
+
+
+def file_validators(size: int, modified_ns: int) -> Dict[str, str]:
+    """ETag and Last-Modified headers for a file, derived from its size and mtime.
+
+    The ETag is strong, so it can also be used with If-Range.
+    """
+    return {
+        "etag": f'"{size:x}-{modified_ns:x}"',
+        "last-modified": formatdate(modified_ns / 1e9, usegmt=True),
+    }
+
+
+def is_not_modified(request_headers: Headers, validators: Dict[str, str]) -> bool:
+    """Evaluates If-None-Match / If-Modified-Since against the file validators (RFC 9110 13.2.2)."""
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: W/"x" matches "x"
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return validators["etag"] in tags
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            return parsedate_to_datetime(validators["last-modified"]) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def accepts_ndjson(request_headers: Headers) -> bool:
+    return NDJSON_MEDIA_TYPE in request_headers.get("accept", "")
+
+
+async def ndjson_response(
+    items: AsyncIterator[Any],
+    to_payload: Callable[[Any], Any],
+    chunk_rows: int = STREAM_YIELD_PER,
+) -> StreamingResponse:
+    """Streams `items` as newline-delimited JSON, one payload per line.
+
+    The first item is awaited before the response starts, so exceptions
+    raised up front (e.g. not found) still reach the exception handlers with
+    their status code. That line is flushed on its own; the rest are sent in
+    chunks of `chunk_rows` lines.
+    """
+    try:
+        first = await anext(items)
+    except StopAsyncIteration:
+        return StreamingResponse(iter(()), media_type=NDJSON_MEDIA_TYPE)
+
+    def line(item: Any) -> bytes:
+        return orjson.dumps(to_payload(item), default=_default) + b"\n"
+
+    async def body():
+        try:
+            yield line(first)
+            buffer = []
+            async for item in items:
+                buffer.append(line(item))
+                if len(buffer) >= chunk_rows:
+                    yield b"".join(buffer)
+                    buffer.clear()
+            if buffer:
+                yield b"".join(buffer)
+        finally:
+            await items.aclose()
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
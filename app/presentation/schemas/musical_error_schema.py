@@ -1,6 +1,8 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from app.application.dto.musical_error_dto import MusicalErrorDTO
+
 
 class MusicalErrorItem(BaseModel):
     """Single musical error entry"""
@@ -15,6 +17,7 @@ class MusicalErrorResponse(BaseModel):
 
     num_errors: int = Field(..., description="Number of musical errors detected", example=3)
     errors: List[MusicalErrorItem] = Field(..., description="List of musical errors detected", example=[])
+    next_cursor: Optional[str] = Field(None, description="Cursor to request the next page when paginating, null on the last page", example="WzEyLDQxXQ")
 
     class Config:
         schema_extra = {
@@ -35,4 +38,71 @@ class MusicalErrorResponse(BaseModel):
                     }
                 ]
             }
-        }
\ No newline at end of file
+        }
+
+
+
+class MusicalErrorBatchItem(BaseModel):
+    """Musical errors of one practice in a batch response"""
+
+    practice_id: int = Field(..., description="Practice ID", example=26)
+    num_errors: int = Field(..., description="Number of musical errors detected", example=1)
+    errors: List[MusicalErrorItem] = Field(..., description="List of musical errors detected", example=[])
+
+
+class MusicalErrorBatchResponse(BaseModel):
+    """Musical errors of several practices, in the order the ids were requested"""
+
+    practices: List[MusicalErrorBatchItem] = Field(..., description="Errors grouped by practice")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "practices": [
+                    {
+                        "practice_id": 26,
+                        "num_errors": 1,
+                        "errors": [
+                            {"min_sec": "00:12", "note_played": "C#", "note_correct": "D"}
+                        ]
+                    },
+                    {
+                        "practice_id": 27,
+                        "num_errors": 0,
+                        "errors": []
+                    }
+                ]
+            }
+        }
+
+
+class NoteErrorCountItem(BaseModel):
+    """Number of times a note was played instead of the correct one"""
+
+    note_correct: str = Field(..., description="Correct note that should have been played", example="D")
+    note_played: str = Field(..., description="Note that was played", example="C#")
+    count: int = Field(..., description="Number of errors", example=4)
+
+
+class TimeBucketItem(BaseModel):
+    """Number of errors within a time bucket of the practice"""
+
+    start_sec: int = Field(..., description="Start of the bucket in seconds", example=60)
+    count: int = Field(..., description="Number of errors in the bucket", example=7)
+
+
+class MusicalErrorSummaryResponse(BaseModel):
+    """Histograms of the musical errors of a practice"""
+
+    total: int = Field(..., description="Number of musical errors detected", example=11)
+    bucket_sec: int = Field(..., description="Width of the time buckets in seconds", example=60)
+    by_note: List[NoteErrorCountItem] = Field(..., description="Errors by (note_correct, note_played), most frequent first")
+    by_time: List[TimeBucketItem] = Field(..., description="Errors by time bucket, in time order (empty buckets omitted)")
+
+def musical_error_item_payload(e: MusicalErrorDTO) -> dict:
+    """MusicalErrorItem as a plain dict, for the fast JSON response mode"""
+    return {
+        "min_sec": e.min_sec,
+        "note_played": e.note_played,
+        "note_correct": e.note_correct,
+    }
@@ -1,6 +1,8 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from app.application.dto.postural_error_dto import PosturalErrorDTO
+
 
 class PosturalErrorItem(BaseModel):
     """Single postural error entry"""
@@ -15,6 +17,7 @@ class PosturalErrorResponse(BaseModel):
 
     num_errors: int = Field(..., description="Number of postural errors detected", example=2)
     errors: List[PosturalErrorItem] = Field(..., description="List of postural errors detected", example=[])
+    next_cursor: Optional[str] = Field(None, description="Cursor to request the next page when paginating, null on the last page", example="WzEyLDQxXQ")
 
     class Config:
         schema_extra = {
@@ -33,4 +36,63 @@ class PosturalErrorResponse(BaseModel):
                     }
                 ]
             }
-        }
\ No newline at end of file
+        }
+
+
+
+class PosturalErrorBatchItem(BaseModel):
+    """Postural errors of one practice in a batch response"""
+
+    practice_id: int = Field(..., description="Practice ID", example=26)
+    num_errors: int = Field(..., description="Number of postural errors detected", example=1)
+    errors: List[PosturalErrorItem] = Field(..., description="List of postural errors detected", example=[])
+
+
+class PosturalErrorBatchResponse(BaseModel):
+    """Postural errors of several practices, in the order the ids were requested"""
+
+    practices: List[PosturalErrorBatchItem] = Field(..., description="Errors grouped by practice")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "practices": [
+                    {
+                        "practice_id": 26,
+                        "num_errors": 1,
+                        "errors": [
+                            {"min_sec_init": "00:05", "min_sec_end": "00:12", "explication": "Incorrect wrist position"}
+                        ]
+                    },
+                    {
+                        "practice_id": 27,
+                        "num_errors": 0,
+                        "errors": []
+                    }
+                ]
+            }
+        }
+
+
+class ExplicationSummaryItem(BaseModel):
+    """Errors of a practice that share the same explanation"""
+
+    explication: str = Field(..., description="Explanation of the detected postural error", example="Incorrect wrist position")
+    count: int = Field(..., description="Number of errors", example=3)
+    duration_sec: int = Field(..., description="Total duration of these errors in seconds", example=21)
+
+
+class PosturalErrorSummaryResponse(BaseModel):
+    """Totals of the postural errors of a practice"""
+
+    total: int = Field(..., description="Number of postural errors detected", example=5)
+    total_duration_sec: int = Field(..., description="Total duration of the errors in seconds", example=34)
+    by_explication: List[ExplicationSummaryItem] = Field(..., description="Errors by explanation, most frequent first")
+
+def postural_error_item_payload(e: PosturalErrorDTO) -> dict:
+    """PosturalErrorItem as a plain dict, for the fast JSON response mode"""
+    return {
+        "min_sec_init": e.min_sec_init,
+        "min_sec_end": e.min_sec_end,
+        "explication": e.explication,
+    }
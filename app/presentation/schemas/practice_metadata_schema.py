@@ -1,5 +1,9 @@
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
+from app.shared.constants import FINISH_BATCH_MAX_IDS
+
 
 class PracticeMetadataResponse(BaseModel):
     """Metadata of a finished practice"""
@@ -20,3 +24,28 @@ class PracticeMetadataResponse(BaseModel):
                 "audio_done": True
             }
         }
+
+
+class FinishPracticeBatchRequest(BaseModel):
+    """Practices to finish in one request"""
+
+    practice_ids: List[int] = Field(
+        ...,
+        description=f"Practice IDs to finish (at most {FINISH_BATCH_MAX_IDS})",
+        example=[26, 27, 31],
+    )
+
+
+class FinishPracticeBatchItem(BaseModel):
+    """Result of finishing one practice of a batch"""
+
+    id_practice: int = Field(..., description="Practice ID", example=26)
+    finished: bool = Field(..., description="Whether the practice was found and finished", example=True)
+    metadata: Optional[PracticeMetadataResponse] = Field(None, description="Updated metadata, null when the practice was not found")
+
+
+class FinishPracticeBatchResponse(BaseModel):
+    """Results of a bulk finish, in request order"""
+
+    num_finished: int = Field(..., description="Number of practices finished", example=2)
+    practices: List[FinishPracticeBatchItem] = Field(..., description="Result of each requested practice")
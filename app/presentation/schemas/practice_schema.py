@@ -1,6 +1,8 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from app.application.dto.practice_dto import PracticeDTO
+
 class PracticeItem(BaseModel):
     """Single practice entry"""
     practice_id: int = Field(..., description="Practice ID", example=26)
@@ -23,6 +25,7 @@ class PracticeResponse(BaseModel):
     """Response with information about a registered practice"""
     num_practices: int = Field(..., description="Number of practices retrieved", example=5)
     practices: List[PracticeItem] = Field(..., description="List of practices", example=[])
+    next_cursor: Optional[str] = Field(None, description="Cursor to request the next page, null on the last page", example="WyIyMDIzLTEwLTAxVDE1OjMwOjAwIiwyNl0")
     
     class Config:
         schema_extra = {
@@ -44,6 +47,27 @@ class PracticeResponse(BaseModel):
                         "pdf_url": "http://example.com/sheet.pdf"
                     },
                     # More practice items...
-                ]
+                ],
+                "next_cursor": "WyIyMDIzLTEwLTAxVDE1OjMwOjAwIiwyNl0"
             }
-        }
\ No newline at end of file
+        }
+
+
+def practice_item_payload(p: PracticeDTO) -> dict:
+    """PracticeItem as a plain dict, for the fast JSON response mode"""
+    return {
+        "practice_id": p.id,
+        "scale": p.scale,
+        "scale_type": p.scale_type,
+        "duration": p.duration,
+        "bpm": p.bpm,
+        "figure": p.figure,
+        "octaves": p.octaves,
+        "num_postural_errors": p.num_postural_errors,
+        "num_musical_errors": p.num_musical_errors,
+        "date": p.date,
+        "time": p.time,
+        "state": p.state,
+        "local_video_url": p.local_video_url,
+        "pdf_url": p.pdf_url,
+    }
@@ -0,0 +1,29 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class StatsItem(BaseModel):
+    """Aggregates over a set of practices"""
+    num_practices: int = Field(..., description="Number of practices", example=14)
+    total_practice_sec: float = Field(..., description="Total practice time in seconds", example=4200)
+    avg_bpm: float = Field(..., description="Average beats per minute", example=96.5)
+    postural_errors_per_min: float = Field(..., description="Postural errors per minute of practice", example=0.4)
+    musical_errors_per_min: float = Field(..., description="Musical errors per minute of practice", example=1.2)
+
+
+class ScaleStatsItem(StatsItem):
+    """Aggregates of the practices of one scale"""
+    scale: str = Field(..., description="Scale practiced", example="C Major")
+    scale_type: str = Field(..., description="Scale type", example="Major")
+
+
+class WeekStatsItem(StatsItem):
+    """Aggregates of the practices of one week"""
+    week_start: str = Field(..., description="Monday of the week", example="2025-10-27")
+
+
+class PracticeStatsResponse(BaseModel):
+    """Progress statistics of a user"""
+    totals: StatsItem = Field(..., description="Aggregates over all the analyzed practices")
+    by_scale: List[ScaleStatsItem] = Field(..., description="Aggregates per scale, most practiced first")
+    by_week: List[WeekStatsItem] = Field(..., description="Aggregates per week with practices, newest first")
@@ -0,0 +1,119 @@
+"""
+Production entry point: gunicorn master with uvicorn workers (uvloop + httptools).
+
+The app is imported once in the master (`preload_app`) and forked into the
+workers, so they start faster and share the imported code pages. Database
+pools are created by each worker's lifespan after the fork and closed by it
+on graceful shutdown (SIGTERM waits up to GRACEFUL_TIMEOUT seconds for
+in-flight requests).
+
+Usage:
+    python -m app.server
+    python -m app.server --workers 4 --bind 0.0.0.0:8130
+"""
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+
+from gunicorn.app.base import BaseApplication
+from gunicorn.util import import_app
+from uvicorn_worker import UvicornWorker
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PracticeServiceWorker(UvicornWorker):
+    """Uvicorn worker pinned to uvloop and httptools, with the lifespan always run."""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
+
+
+def worker_count(configured: int = 0) -> int:
+    """Configured workers, or one per CPU core available to this process."""
+    if configured > 0:
+        return configured
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def post_fork(server, worker):
+    # The log listener thread of the master does not survive the fork
+    from app.core.logging import configure_logging
+    configure_logging()
+
+
+def worker_exit(server, worker):
+    from app.core.logging import stop_logging
+    stop_logging()
+
+
+def child_exit(server, worker):
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def prepare_metrics_dir(workers: int):
+    """Points prometheus_client to a fresh directory shared by the workers.
+
+    Must run before prometheus_client is imported, i.e. before the app.
+    """
+    if not settings.METRICS_ENABLED or workers < 2:
+        return
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR") or os.path.join(tempfile.gettempdir(), "practice-service-metrics")
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+
+
+class PracticeServiceApplication(BaseApplication):
+    def __init__(self, app_uri: str, options: dict):
+        self.app_uri = app_uri
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return import_app(self.app_uri)
+
+
+def build_options(bind: str, workers: int) -> dict:
+    return {
+        "bind": bind,
+        "workers": workers,
+        "worker_class": PracticeServiceWorker,
+        "preload_app": True,
+        "graceful_timeout": settings.GRACEFUL_TIMEOUT,
+        "timeout": settings.WORKER_TIMEOUT,
+        "keepalive": settings.KEEPALIVE_TIMEOUT,
+        "loglevel": settings.LOG_LEVEL.lower(),
+        "post_fork": post_fork,
+        "worker_exit": worker_exit,
+        "child_exit": child_exit,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app", default="app.main:app", help="ASGI app to serve (module:attribute or module:factory())")
+    parser.add_argument("--bind", default=f"{settings.HOST}:{settings.PRACTICE_SERVICE_PORT}")
+    parser.add_argument("--workers", type=int, default=settings.WORKERS, help="0 = one per CPU core")
+    args = parser.parse_args()
+
+    workers = worker_count(args.workers)
+    prepare_metrics_dir(workers)
+    logger.info(f"Starting {settings.APP_NAME} on {args.bind} with {workers} workers")
+    PracticeServiceApplication(args.app, build_options(args.bind, workers)).run()
+
+
+if __name__ == "__main__":
+    main()
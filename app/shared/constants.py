@@ -1 +1,7 @@
-PRACTICES_PAGE_LIMIT: int = 10
\ No newline at end of file
+PRACTICES_PAGE_LIMIT: int = 10
+ERRORS_BATCH_MAX_IDS: int = 50
+FINISH_BATCH_MAX_IDS: int = 100
+STREAM_YIELD_PER: int = 500
+ERRORS_PAGE_LIMIT: int = 100
+ERRORS_PAGE_MAX_LIMIT: int = 500
+PRACTICE_STATS_WEEKS: int = 12
\ No newline at end of file
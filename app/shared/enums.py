@@ -24,6 +24,19 @@ class PracticeState(str, Enum):
     IN_PROGRESS = "IN_PROGRESS" # Audio/video analysis or report in progress
     FINISHED = "FINISHED" # Audio/video analysis and report done and user deleted video in local
     
+class MetadataLayout(str, Enum):
+    EMBEDDED = "embedded" # Practices array embedded in each users document
+    COLLECTION = "collection" # One document per (uid, id_practice)
+    
+class CacheBackend(str, Enum):
+    NONE = "none"
+    MEMORY = "memory"
+    REDIS = "redis"
+
+class SpanExporterType(str, Enum):
+    NONE = "none"
+    LOG = "log"
+    
 class Figure(Enum):
     BLANCA = 0.5
     NEGRA = 1
@@ -0,0 +1,54 @@
+import base64
+import binascii
+import json
+from typing import Any, List, Optional, Tuple
+
+from app.core.exceptions import ValidationException
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encodes keyset pagination values into an opaque, URL-safe cursor."""
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decodes a cursor built by encode_cursor, checking it holds `size` values."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeError):
+        raise ValidationException("Invalid pagination cursor", details={"cursor": cursor})
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationException("Invalid pagination cursor", details={"cursor": cursor})
+    return values
+
+
+def decode_int_cursor(cursor: str, size: int) -> Tuple[int, ...]:
+    """Decodes a cursor made of `size` integers (e.g. (seconds, id))."""
+    values = decode_cursor(cursor, size)
+    if not all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+        raise ValidationException("Invalid pagination cursor", details={"cursor": cursor})
+    return tuple(values)
+
+
+def validate_time_window(from_sec: Optional[int], to_sec: Optional[int]) -> None:
+    if from_sec is not None and to_sec is not None and from_sec > to_sec:
+        raise ValidationException(
+            "from_sec must be lower than or equal to to_sec",
+            details={"from_sec": from_sec, "to_sec": to_sec}
+        )
+
+
+def unique_practice_ids(practice_ids: List[int], max_ids: int) -> List[int]:
+    """Drops duplicated ids (keeping request order) and enforces the batch size bounds."""
+    unique_ids = list(dict.fromkeys(practice_ids))
+    if not unique_ids:
+        raise ValidationException("At least one practice id is required")
+    if len(unique_ids) > max_ids:
+        raise ValidationException(
+            f"At most {max_ids} practice ids are allowed per request",
+            details={"max_ids": max_ids, "received": len(unique_ids)}
+        )
+    return unique_ids
@@ -0,0 +1,129 @@
+"""
+Benchmark: request throughput with and without FAST_JSON_RESPONSES.
+
+Serves the practice list and error list endpoints in-process (httpx +
+ASGITransport), with use cases replaced by fakes that return N DTOs, so the
+numbers isolate the response building and serialization cost.
+
+Usage:
+    python -m scripts.bench_fast_responses
+    python -m scripts.bench_fast_responses --rows 100 --requests 500
+"""
+import argparse
+import asyncio
+import os
+import time
+from decimal import Decimal
+
+# Settings requires the connection variables even though nothing connects here
+BENCH_ENV = {
+    "PRACTICE_SERVICE_PORT": "8130",
+    "MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_USER": "bench",
+    "MYSQL_PASSWORD": "bench", "MYSQL_DB": "bench",
+    "MONGO_HOST": "localhost", "MONGO_PORT": "27017", "MONGO_USER": "bench",
+    "MONGO_PASSWORD": "bench", "MONGO_DB": "bench",
+    "HOST_PATH": "/tmp", "CONTAINER_PATH": "/tmp",
+}
+for name, value in BENCH_ENV.items():
+    os.environ.setdefault(name, value)
+
+import httpx
+from fastapi import FastAPI
+
+from app.application.dto.musical_error_dto import MusicalErrorDTO
+from app.application.dto.postural_error_dto import PosturalErrorDTO
+from app.application.dto.practice_dto import PracticeDTO, PracticePageDTO
+from app.core.config import settings
+from app.presentation.api.v1 import dependencies
+from app.presentation.api.v1.musical_error import router as musical_error_router
+from app.presentation.api.v1.postural_error import router as postural_error_router
+from app.presentation.api.v1.practice import router as practice_router
+from app.shared.enums import PracticeState
+
+
+class FakePracticesUseCase:
+    def __init__(self, rows: int):
+        self.page = PracticePageDTO(
+            practices=[
+                PracticeDTO(
+                    id=i, scale="C", scale_type="Major", duration=Decimal("300"), bpm=Decimal("120"),
+                    figure="Negra", octaves=Decimal("2"), num_postural_errors=Decimal("3"),
+                    num_musical_errors=Decimal("5"), date="2025-11-01", time="10:00:00",
+                    state=PracticeState.COMPLETED, local_video_url=f"practice_{i}.mp4", pdf_url=f"report_{i}.pdf"
+                )
+                for i in range(rows)
+            ],
+            next_cursor=None,
+        )
+
+    async def get_all(self, **kwargs):
+        return self.page
+
+
+class FakeMusicalErrorsUseCase:
+    def __init__(self, rows: int):
+        self.errors = [
+            MusicalErrorDTO(id=i, min_sec=f"00:{i % 60:02d}", note_played="C#", note_correct="D", id_practice=1)
+            for i in range(rows)
+        ]
+
+    async def execute(self, practice_id: int):
+        return self.errors
+
+
+class FakePosturalErrorsUseCase:
+    def __init__(self, rows: int):
+        self.errors = [
+            PosturalErrorDTO(min_sec_init=f"00:{i % 60:02d}", min_sec_end=f"01:{i % 60:02d}", explication="Wrist too low")
+            for i in range(rows)
+        ]
+
+    async def execute(self, practice_id: int):
+        return self.errors
+
+
+def build_app(rows: int) -> FastAPI:
+    app = FastAPI()
+    app.include_router(practice_router)
+    app.include_router(musical_error_router)
+    app.include_router(postural_error_router)
+    app.dependency_overrides[dependencies.get_user_practices_use_case_dependency] = lambda: FakePracticesUseCase(rows)
+    app.dependency_overrides[dependencies.get_musical_errors_use_case_dependency] = lambda: FakeMusicalErrorsUseCase(rows)
+    app.dependency_overrides[dependencies.get_postural_errors_use_case_dependency] = lambda: FakePosturalErrorsUseCase(rows)
+    return app
+
+
+async def throughput(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    for _ in range(10):  # warm-up
+        (await client.get(path)).raise_for_status()
+    start = time.perf_counter()
+    for _ in range(requests):
+        await client.get(path)
+    return requests / (time.perf_counter() - start)
+
+
+async def run(rows: int, requests: int):
+    app = build_app(rows)
+    paths = ["/practice/bench-user", "/musical-errors/1", "/postural-errors/1"]
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        print(f"{'endpoint':>24} | {'default req/s':>13} | {'fast req/s':>10} | {'speedup':>7}")
+        print("-" * 64)
+        for path in paths:
+            settings.FAST_JSON_RESPONSES = False
+            default_rate = await throughput(client, path, requests)
+            settings.FAST_JSON_RESPONSES = True
+            fast_rate = await throughput(client, path, requests)
+            print(f"{path:>24} | {default_rate:>13,.0f} | {fast_rate:>10,.0f} | {fast_rate / default_rate:>6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100, help="Items returned by each endpoint")
+    parser.add_argument("--requests", type=int, default=300, help="Requests measured per endpoint and mode")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: full user document vs server-side projection of practice metadata.
+
+Compares, for growing sizes of the `users.practices` array, the payload
+returned by MongoDB (BSON bytes) and the lookup latency of:
+
+  - full:       find_one({"uid": ...}) and a Python scan of `practices`
+  - elemMatch:  find_one with an $elemMatch projection (single practice)
+  - filter:     aggregate with a $filter projection (page of practices)
+
+Runs against mongomock by default. Pass --mongo-uri to run it against a
+local mongod, where latency also includes the network round trip.
+
+Usage:
+    python scripts/bench_metadata_projection.py
+    python scripts/bench_metadata_projection.py --mongo-uri mongodb://localhost:27017 --sizes 100 1000 10000
+"""
+import argparse
+import statistics
+import time
+
+import bson
+
+DB_NAME = "bench_practice_metadata"
+UID = "bench-user"
+
+
+def get_collection(mongo_uri: str | None):
+    if mongo_uri:
+        from pymongo import MongoClient
+        client = MongoClient(mongo_uri)
+    else:
+        try:
+            import mongomock
+        except ImportError:
+            raise SystemExit("mongomock is required without --mongo-uri (pip install -r requirements-dev.txt)")
+        client = mongomock.MongoClient()
+    return client[DB_NAME]["users"]
+
+
+def seed(collection, size: int):
+    collection.delete_many({"uid": UID})
+    collection.insert_one({
+        "uid": UID,
+        "practices": [
+            {
+                "id_practice": i,
+                "video_in_local": f"/app/storage/{UID}/videos/practice_{i}.mp4",
+                "report": f"/app/storage/{UID}/reports/report_{i}.pdf",
+                "video_done": True,
+                "audio_done": True,
+            }
+            for i in range(size)
+        ],
+    })
+
+
+def full_lookup(collection, practice_id: int):
+    doc = collection.find_one({"uid": UID})
+    for pr in doc.get("practices", []):
+        if pr.get("id_practice") == practice_id:
+            break
+    return doc
+
+
+def elem_match_lookup(collection, practice_id: int):
+    return collection.find_one(
+        {"uid": UID},
+        {"_id": 0, "practices": {"$elemMatch": {"id_practice": practice_id}}},
+    )
+
+
+def filter_lookup(collection, practice_ids: list[int]):
+    return next(collection.aggregate([
+        {"$match": {"uid": UID}},
+        {"$project": {
+            "_id": 0,
+            "practices": {
+                "$filter": {
+                    "input": {"$ifNull": ["$practices", []]},
+                    "as": "pr",
+                    "cond": {"$in": ["$$pr.id_practice", practice_ids]},
+                }
+            },
+        }},
+    ]))
+
+
+def measure(fn, repeat: int):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return len(bson.encode(result)), statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mongo-uri", default=None, help="Run against a real mongod instead of mongomock")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--page", type=int, default=10, help="Practices requested by the $filter lookup")
+    args = parser.parse_args()
+
+    collection = get_collection(args.mongo_uri)
+    print(f"{'practices':>10} | {'strategy':>10} | {'bytes':>10} | {'median ms':>10}")
+    print("-" * 50)
+    try:
+        for size in args.sizes:
+            seed(collection, size)
+            target = size - 1  # worst case for the Python scan
+            page = list(range(max(0, size - args.page), size))
+            strategies = [
+                ("full", lambda: full_lookup(collection, target)),
+                ("elemMatch", lambda: elem_match_lookup(collection, target)),
+                ("filter", lambda: filter_lookup(collection, page)),
+            ]
+            for name, fn in strategies:
+                size_bytes, median_ms = measure(fn, args.repeat)
+                print(f"{size:>10} | {name:>10} | {size_bytes:>10} | {median_ms:>10.3f}")
+    finally:
+        collection.delete_many({"uid": UID})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark: ORM read path vs lean column read path for a user's practices.
+
+Compares rows/s of:
+
+  - orm:   full PracticeModel entities with a joinedload of Scale
+  - lean:  MySQLPracticeRepository's column select, with scale names
+           resolved from an in-memory catalog
+
+Runs against an in-memory SQLite database, so it measures the Python
+side (row hydration and entity building), not the network.
+
+Usage:
+    python -m scripts.bench_practice_read_path
+    python -m scripts.bench_practice_read_path --rows 10000 --rounds 10
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, joinedload
+
+from app.domain.entities.practice import Practice
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.practice_model import PracticeModel
+from app.infrastructure.database.models.scale_model import ScaleModel
+from app.infrastructure.repositories.mysql_practice_repo import MySQLPracticeRepository
+
+UID = "bench-user"
+
+
+def seed(session: Session, rows: int):
+    session.add(ScaleModel(id=1, name="C", scale_type="Major"))
+    start = datetime(2025, 1, 1, 8, 0, 0)
+    session.add_all([
+        PracticeModel(
+            id=i + 1,
+            practice_datetime=start + timedelta(minutes=i),
+            num_postural_errors=i % 7,
+            num_musical_errors=i % 5,
+            duration=300,
+            bpm=120,
+            figure=1,
+            octaves=2,
+            total_notes_played=64,
+            id_student=UID,
+            id_scale=1,
+        )
+        for i in range(rows)
+    ])
+    session.commit()
+
+
+def load_scales(session: Session) -> dict:
+    # What the scale catalog holds once loaded
+    rows = session.execute(select(ScaleModel.id, ScaleModel.name, ScaleModel.scale_type)).all()
+    return {scale_id: (name, scale_type) for scale_id, name, scale_type in rows}
+
+
+def orm_path(session: Session) -> list[Practice]:
+    """Original read path: full ORM entities with a joined Scale."""
+    models = session.execute(
+        select(PracticeModel)
+        .options(joinedload(PracticeModel.scale))
+        .where(PracticeModel.id_student == UID)
+        .order_by(PracticeModel.practice_datetime.desc(), PracticeModel.id.desc())
+    ).scalars().all()
+    session.expunge_all()
+    return [
+        Practice(
+            id=m.id,
+            scale=m.scale.name if m.scale else "",
+            scale_type=m.scale.scale_type if m.scale else "",
+            duration=m.duration,
+            bpm=m.bpm,
+            figure=m.figure,
+            octaves=m.octaves,
+            num_postural_errors=m.num_postural_errors,
+            num_musical_errors=m.num_musical_errors,
+            date=m.practice_datetime.strftime("%Y-%m-%d"),
+            time=m.practice_datetime.strftime("%H:%M:%S"),
+            state="",
+            local_video_url="",
+            pdf_url="",
+        )
+        for m in models
+    ]
+
+
+def lean_path(session: Session, scales: dict) -> list[Practice]:
+    repo = MySQLPracticeRepository()
+    rows = session.execute(
+        repo._select_practices()
+        .where(PracticeModel.id_student == UID)
+        .order_by(PracticeModel.practice_datetime.desc(), PracticeModel.id.desc())
+    ).all()
+    return [repo._row_to_entity(row, scales) for row in rows]
+
+
+def rows_per_sec(fn, rows: int, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return rows / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5, help="Runs per path; the best one is reported")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            seed(session, args.rows)
+            scales = load_scales(session)
+            orm_rate = rows_per_sec(lambda: orm_path(session), args.rows, args.rounds)
+            lean_rate = rows_per_sec(lambda: lean_path(session, scales), args.rows, args.rounds)
+    finally:
+        engine.dispose()
+
+    print(f"ORM path:  {orm_rate:,.0f} rows/s")
+    print(f"Lean path: {lean_rate:,.0f} rows/s ({lean_rate / orm_rate:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
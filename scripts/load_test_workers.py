@@ -0,0 +1,107 @@
+"""
+Load test: throughput of the production server (app.server) as workers are added.
+
+For each worker count it starts `python -m app.server` on a local port,
+serving the in-process benchmark app of scripts.bench_fast_responses (fake
+use cases, so no database is needed and the cost measured is request
+handling and serialization), then hammers one endpoint from several client
+processes and reports requests per second.
+
+Usage:
+    python -m scripts.load_test_workers
+    python -m scripts.load_test_workers --workers 1 2 4 --clients 8 --duration 10
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from scripts.bench_fast_responses import BENCH_ENV
+
+APP = "scripts.bench_fast_responses:build_app({rows})"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=1).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server did not answer {url} within {timeout}s")
+
+
+async def hammer(url: str, duration: float, concurrency: int) -> int:
+    done = 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=10) as client:
+        async def loop():
+            nonlocal done
+            while time.monotonic() < deadline:
+                (await client.get(url)).raise_for_status()
+                done += 1
+
+        await asyncio.gather(*(loop() for _ in range(concurrency)))
+    return done
+
+
+def client_process(args) -> int:
+    url, duration, concurrency = args
+    return asyncio.run(hammer(url, duration, concurrency))
+
+
+def run(workers: int, args) -> float:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.server", "--app", APP.format(rows=args.rows),
+         "--bind", f"127.0.0.1:{port}", "--workers", str(workers)],
+        env={**BENCH_ENV, **os.environ, "LOG_LEVEL": "WARNING", "APP_ENV": "production", "FAST_JSON_RESPONSES": "true"},
+    )
+    try:
+        wait_until_ready(base_url + args.path)
+        with multiprocessing.Pool(args.clients) as pool:
+            counts = pool.map(client_process, [(base_url + args.path, args.duration, args.concurrency)] * args.clients)
+        return sum(counts) / args.duration
+    finally:
+        server.terminate()
+        server.wait(timeout=60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to compare")
+    parser.add_argument("--clients", type=int, default=4, help="Client processes generating load")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent requests per client process")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds of load per worker count")
+    parser.add_argument("--rows", type=int, default=100, help="Items returned by the endpoint")
+    parser.add_argument("--path", default="/practice/bench-user", help="Endpoint to load")
+    args = parser.parse_args()
+
+    print(f"{'workers':>7} | {'req/s':>9} | {'scaling':>7}")
+    print("-" * 30)
+    baseline = None
+    for workers in args.workers:
+        rate = run(workers, args)
+        baseline = baseline or rate
+        print(f"{workers:>7} | {rate:>9,.0f} | {rate / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Offline migration: embedded `users.practices` arrays -> per-practice collection.
+
+Copies every entry of each user's `practices` array into its own document
+in the metadata collection (one document per (uid, id_practice)), which is
+the storage used by MongoMetadataRepository when MONGO_METADATA_LAYOUT is
+"collection".
+
+The migration is resumable: users are processed in `_id` order and the last
+migrated `_id` is checkpointed in the `migrations` collection after every
+batch, so an interrupted run continues where it stopped. Writes use
+unordered bulk inserts against the unique (uid, id_practice) index, and
+duplicate-key errors are skipped, so re-running a batch never overwrites
+documents that already exist in the target collection.
+
+Usage:
+    python -m scripts.migrate_practice_metadata
+    python -m scripts.migrate_practice_metadata --batch-size 500 --dry-run
+    python -m scripts.migrate_practice_metadata --restart
+"""
+import argparse
+import logging
+from datetime import datetime, timezone
+
+from pymongo import ASCENDING, MongoClient
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger("migrate_practice_metadata")
+
+MIGRATION_ID = "practice_metadata_collection_v1"
+METADATA_FIELDS = ("video_in_local", "report", "video_done", "audio_done")
+DUPLICATE_KEY_ERROR = 11000
+
+
+def user_doc_to_practice_docs(user_doc: dict) -> list[dict]:
+    """Flattens the embedded practices array of a user into per-practice documents."""
+    uid = user_doc["uid"]
+    docs = []
+    for pr in user_doc.get("practices") or []:
+        if pr.get("id_practice") is None:
+            continue
+        doc = {"uid": uid, "id_practice": pr["id_practice"]}
+        doc.update({field: pr[field] for field in METADATA_FIELDS if field in pr})
+        docs.append(doc)
+    return docs
+
+
+def insert_missing(collection, practice_docs: list[dict]) -> int:
+    """Bulk inserts the documents, skipping the ones already migrated. Returns the inserted count."""
+    try:
+        result = collection.insert_many(practice_docs, ordered=False)
+        return len(result.inserted_ids)
+    except BulkWriteError as e:
+        errors = e.details.get("writeErrors", [])
+        if any(err.get("code") != DUPLICATE_KEY_ERROR for err in errors):
+            raise
+        return e.details.get("nInserted", 0)
+
+
+def migrate(db, collection_name: str, batch_size: int, dry_run: bool = False, restart: bool = False) -> dict:
+    target = db[collection_name]
+    checkpoints = db["migrations"]
+
+    if not dry_run:
+        target.create_index(
+            [("uid", ASCENDING), ("id_practice", ASCENDING)],
+            unique=True,
+            name="uq_uid_id_practice",
+        )
+
+    checkpoint = None if restart else checkpoints.find_one({"_id": MIGRATION_ID})
+    last_user_id = checkpoint.get("last_user_id") if checkpoint else None
+    stats = {
+        "users": checkpoint.get("users", 0) if checkpoint else 0,
+        "practices": checkpoint.get("practices", 0) if checkpoint else 0,
+        "inserted": checkpoint.get("inserted", 0) if checkpoint else 0,
+    }
+    if last_user_id is not None:
+        logger.info(f"Resuming after user _id={last_user_id} ({stats['users']} users already migrated)")
+
+    while True:
+        query = {"uid": {"$exists": True}}
+        if last_user_id is not None:
+            query["_id"] = {"$gt": last_user_id}
+
+        users = list(
+            db["users"]
+            .find(query, {"uid": 1, "practices": 1})
+            .sort("_id", ASCENDING)
+            .limit(batch_size)
+        )
+        if not users:
+            break
+
+        practice_docs = [doc for user in users for doc in user_doc_to_practice_docs(user)]
+        if practice_docs and not dry_run:
+            stats["inserted"] += insert_missing(target, practice_docs)
+
+        last_user_id = users[-1]["_id"]
+        stats["users"] += len(users)
+        stats["practices"] += len(practice_docs)
+
+        if not dry_run:
+            checkpoints.update_one(
+                {"_id": MIGRATION_ID},
+                {"$set": {**stats, "last_user_id": last_user_id, "updated_at": datetime.now(timezone.utc)}},
+                upsert=True,
+            )
+        logger.info(
+            f"Batch done: {len(users)} users, {len(practice_docs)} practices "
+            f"(total users={stats['users']}, practices={stats['practices']}, inserted={stats['inserted']})"
+        )
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=200, help="Users migrated per bulk write")
+    parser.add_argument("--dry-run", action="store_true", help="Count what would be migrated without writing")
+    parser.add_argument("--restart", action="store_true", help="Ignore the stored checkpoint and start over")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    from app.core.config import settings
+
+    client = MongoClient(settings.MONGO_URI)
+    try:
+        stats = migrate(
+            client[settings.MONGO_DB],
+            settings.MONGO_METADATA_COLLECTION,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            restart=args.restart,
+        )
+        logger.info(f"Migration finished: {stats}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
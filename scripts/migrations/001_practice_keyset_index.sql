@@ -0,0 +1,11 @@
+-- Keyset pagination index for GET /practice/{uid}
+--
+-- Serves `WHERE id_student = ? AND (practice_datetime, id) < (?, ?)
+-- ORDER BY practice_datetime DESC, id DESC LIMIT ?` as a range scan,
+-- so every page costs O(limit) regardless of how deep it is.
+--
+-- Apply with:
+--   mysql -h $MYSQL_HOST -P $MYSQL_PORT -u $MYSQL_USER -p $MYSQL_DB < scripts/migrations/001_practice_keyset_index.sql
+
+CREATE INDEX ix_practice_student_datetime_id
+    ON Practice (id_student, practice_datetime DESC, id DESC);
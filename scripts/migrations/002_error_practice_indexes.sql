@@ -0,0 +1,14 @@
+-- Lookup indexes for the error endpoints
+--
+-- The unique constraints on MusicalError and PosturalError lead with the
+-- timestamp columns, so `WHERE id_practice = ?` and the batch endpoints'
+-- `WHERE id_practice IN (...)` were full table scans. InnoDB appends the
+-- primary key to secondary indexes, so these also return rows ordered by
+-- (id_practice, id) without a filesort.
+--
+-- Apply with:
+--   mysql -h $MYSQL_HOST -P $MYSQL_PORT -u $MYSQL_USER -p $MYSQL_DB < scripts/migrations/002_error_practice_indexes.sql
+
+CREATE INDEX ix_musical_error_practice ON MusicalError (id_practice);
+
+CREATE INDEX ix_postural_error_practice ON PosturalError (id_practice);
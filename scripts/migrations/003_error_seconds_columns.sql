@@ -0,0 +1,31 @@
+-- Numeric time columns for the paginated / time-window error endpoints
+--
+-- MusicalError.min_sec and PosturalError.min_sec_init are 'mm:ss' strings,
+-- which cannot be range-filtered or ordered numerically. `seconds` is a
+-- VIRTUAL generated column derived from them, so rows inserted by the
+-- analysis services get it automatically and no backfill pass is needed:
+-- adding the column is an instant metadata change, and building the index
+-- computes and stores the value of every existing row online (LOCK=NONE).
+--
+-- The composite index serves `WHERE id_practice = ? AND seconds BETWEEN ? AND ?
+-- ORDER BY seconds, id LIMIT ?` as a range scan (InnoDB appends the primary
+-- key, so the `id` tie-breaker needs no filesort).
+--
+-- Apply before deploying the version that reads the column:
+--   mysql -h $MYSQL_HOST -P $MYSQL_PORT -u $MYSQL_USER -p $MYSQL_DB < scripts/migrations/003_error_seconds_columns.sql
+
+ALTER TABLE MusicalError
+    ADD COLUMN seconds INT AS (SUBSTR(min_sec, 1, INSTR(min_sec, ':') - 1) * 60 + SUBSTR(min_sec, INSTR(min_sec, ':') + 1)) VIRTUAL,
+    ALGORITHM=INSTANT;
+
+CREATE INDEX ix_musical_error_practice_seconds
+    ON MusicalError (id_practice, seconds)
+    ALGORITHM=INPLACE LOCK=NONE;
+
+ALTER TABLE PosturalError
+    ADD COLUMN seconds INT AS (SUBSTR(min_sec_init, 1, INSTR(min_sec_init, ':') - 1) * 60 + SUBSTR(min_sec_init, INSTR(min_sec_init, ':') + 1)) VIRTUAL,
+    ALGORITHM=INSTANT;
+
+CREATE INDEX ix_postural_error_practice_seconds
+    ON PosturalError (id_practice, seconds)
+    ALGORITHM=INPLACE LOCK=NONE;
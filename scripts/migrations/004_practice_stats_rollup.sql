@@ -0,0 +1,31 @@
+-- Rollup tables for GET /practice/{uid}/stats
+--
+-- PracticeStatsRollup holds running totals per (student, scale, week);
+-- PracticeStatsWatermark the newest practice id of each student already
+-- added to them. The service folds newer practices in on demand, so the
+-- stats endpoint reads a few rollup rows instead of every Practice row.
+--
+-- After creating the tables, fill them for existing practices with:
+--   python -m scripts.rebuild_practice_stats
+--
+-- Apply with:
+--   mysql -h $MYSQL_HOST -P $MYSQL_PORT -u $MYSQL_USER -p $MYSQL_DB < scripts/migrations/004_practice_stats_rollup.sql
+
+CREATE TABLE PracticeStatsRollup (
+    id_student VARCHAR(128) NOT NULL,
+    id_scale INT NOT NULL,
+    week_start DATE NOT NULL,
+    num_practices INT NOT NULL DEFAULT 0,
+    total_duration NUMERIC(14, 2) NOT NULL DEFAULT 0,
+    total_bpm NUMERIC(14, 2) NOT NULL DEFAULT 0,
+    total_postural_errors INT NOT NULL DEFAULT 0,
+    total_musical_errors INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (id_student, id_scale, week_start)
+);
+
+CREATE TABLE PracticeStatsWatermark (
+    id_student VARCHAR(128) NOT NULL,
+    last_practice_id INT NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL,
+    PRIMARY KEY (id_student)
+);
@@ -0,0 +1,16 @@
+-- Practices skipped by the stats rollup while their analysis was pending
+--
+-- The PracticeStatsWatermark of a student moves past practices whose error
+-- counts are still NULL. Their ids are kept here and folded into
+-- PracticeStatsRollup by a later refresh, once the counts are written. A
+-- practice whose analysis never completes therefore no longer holds back
+-- the stats of every newer practice.
+--
+-- Apply with:
+--   mysql -h $MYSQL_HOST -P $MYSQL_PORT -u $MYSQL_USER -p $MYSQL_DB < scripts/migrations/005_practice_stats_pending.sql
+
+CREATE TABLE PracticeStatsPending (
+    id_student VARCHAR(128) NOT NULL,
+    id_practice INT NOT NULL,
+    PRIMARY KEY (id_student, id_practice)
+);
@@ -0,0 +1,64 @@
+"""
+Rebuilds the practice stats rollup (PracticeStatsRollup / PracticeStatsWatermark
+/ PracticeStatsPending).
+
+For each student, drops the rollup rows, watermark and pending practices
+and recomputes them from all of their Practice rows in one transaction, so
+the stats endpoint keeps serving consistent numbers while the rebuild runs.
+Use it after creating the tables (scripts/migrations/004 and 005) or to
+repair a student whose practices were edited after being rolled up.
+
+Usage:
+    python -m scripts.rebuild_practice_stats
+    python -m scripts.rebuild_practice_stats --uid <student uid>
+"""
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import select
+
+logger = logging.getLogger("rebuild_practice_stats")
+
+
+async def rebuild(uids: list[str] | None = None) -> dict:
+    from app.infrastructure.database.models.practice_model import PracticeModel
+    from app.infrastructure.database.mysql_connection import mysql_connection
+    from app.infrastructure.repositories.mysql_practice_stats_repo import MySQLPracticeStatsRepository
+
+    if not uids:
+        async with mysql_connection.get_async_session() as session:
+            result = await session.execute(select(PracticeModel.id_student).distinct().order_by(PracticeModel.id_student))
+            uids = list(result.scalars())
+
+    repo = MySQLPracticeStatsRepository()
+    stats = {"students": 0, "practices": 0}
+    for uid in uids:
+        stats["practices"] += await repo.rebuild_user_stats(uid)
+        stats["students"] += 1
+        if stats["students"] % 100 == 0:
+            logger.info(f"Rebuilt {stats['students']}/{len(uids)} students ({stats['practices']} practices)")
+    return stats
+
+
+async def run(uids: list[str] | None):
+    from app.infrastructure.database.mysql_connection import mysql_connection
+
+    try:
+        stats = await rebuild(uids)
+        logger.info(f"Rebuild finished: {stats}")
+    finally:
+        await mysql_connection.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uid", action="append", help="Only rebuild this student (repeatable)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(run(args.uid))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Storage reconciliation: local video/report files vs practice metadata in Mongo.
+
+Walks CONTAINER_PATH/<uid>/{videos,reports} and compares it with Mongo:
+
+- orphaned videos: `practice_<id>.mp4` files of practices whose
+  `video_in_local` is already empty. They are deleted and their size is
+  reported as reclaimed.
+- unknown videos: files of practices (or users) that have no metadata. They
+  are only reported, unless --delete-unknown is given, since the metadata
+  of a practice being uploaded may not exist yet.
+- dangling metadata: practices whose `report` or `video_in_local` is set
+  but whose file is missing. They are reported, never modified.
+
+User directories are listed with `os.scandir` by a small thread pool and
+checked against Mongo with one query per batch of users. Every directory
+listing and file deletion takes a token from a shared rate limiter, and
+files modified in the last --min-age-seconds are never touched, so the job
+can run next to the live service. Users present in Mongo but without a
+storage directory are not visited.
+
+Usage:
+    python -m scripts.reconcile_storage --dry-run
+    python -m scripts.reconcile_storage --workers 4 --ops-per-second 200
+"""
+import argparse
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pymongo import MongoClient
+
+logger = logging.getLogger("reconcile_storage")
+
+VIDEO_NAME = re.compile(r"^practice_(\d+)\.mp4$")
+REPORT_NAME = re.compile(r"^report_(\d+)\.pdf$")
+METADATA_FIELDS = ("id_practice", "video_in_local", "report")
+
+
+class RateLimiter:
+    """Spaces out operations to at most `rate` per second across all threads (0 = unlimited)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+@dataclass
+class StoredFile:
+    path: str
+    size: int
+    modified: float
+
+
+@dataclass
+class UserFiles:
+    uid: str
+    videos: Dict[int, StoredFile] = field(default_factory=dict)
+    reports: Dict[int, StoredFile] = field(default_factory=dict)
+
+
+def _scan_dir(path: str, pattern: re.Pattern, limiter: RateLimiter) -> Dict[int, StoredFile]:
+    limiter.wait()
+    files = {}
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match and entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    files[int(match.group(1))] = StoredFile(entry.path, st.st_size, st.st_mtime)
+    except FileNotFoundError:
+        pass
+    return files
+
+
+def scan_user(root: str, uid: str, limiter: RateLimiter) -> UserFiles:
+    """Lists the videos and reports stored for a user, keyed by practice id."""
+    user_dir = os.path.join(root, uid)
+    return UserFiles(
+        uid=uid,
+        videos=_scan_dir(os.path.join(user_dir, "videos"), VIDEO_NAME, limiter),
+        reports=_scan_dir(os.path.join(user_dir, "reports"), REPORT_NAME, limiter),
+    )
+
+
+def iter_user_dirs(root: str) -> Iterator[str]:
+    """User directories at the storage root. Hidden entries (e.g. the deletion queue file) are skipped."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if not entry.name.startswith(".") and entry.is_dir(follow_symlinks=False):
+                yield entry.name
+
+
+def fetch_metadata(db, layout: str, collection_name: str, uids: List[str]) -> Dict[str, Dict[int, dict]]:
+    """Practice metadata of a batch of users in one query: uid -> id_practice -> document."""
+    metadata: Dict[str, Dict[int, dict]] = {uid: {} for uid in uids}
+    if layout == "collection":
+        cursor = db[collection_name].find(
+            {"uid": {"$in": uids}},
+            {"_id": 0, "uid": 1, **{name: 1 for name in METADATA_FIELDS}},
+        )
+        for doc in cursor:
+            metadata[doc["uid"]][doc.get("id_practice")] = doc
+    else:
+        cursor = db["users"].find(
+            {"uid": {"$in": uids}},
+            {"_id": 0, "uid": 1, **{f"practices.{name}": 1 for name in METADATA_FIELDS}},
+        )
+        for user_doc in cursor:
+            for pr in user_doc.get("practices") or []:
+                metadata[user_doc["uid"]][pr.get("id_practice")] = pr
+    return metadata
+
+
+def _batches(items: Iterator[str], size: int) -> Iterator[List[str]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _delete(stored: StoredFile, limiter: RateLimiter) -> Tuple[StoredFile, Optional[OSError]]:
+    limiter.wait()
+    try:
+        os.remove(stored.path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        return stored, e
+    return stored, None
+
+
+def reconcile(
+    db,
+    root: str,
+    layout: str = "embedded",
+    collection_name: str = "practice_metadata",
+    batch_size: int = 100,
+    workers: int = 4,
+    ops_per_second: float = 100.0,
+    min_age_seconds: float = 3600.0,
+    dry_run: bool = False,
+    delete_unknown: bool = False,
+) -> dict:
+    limiter = RateLimiter(ops_per_second)
+    cutoff = time.time() - min_age_seconds
+    stats = {
+        "users": 0,
+        "videos": 0,
+        "orphaned_videos": 0,
+        "unknown_videos": 0,
+        "deleted_videos": 0,
+        "bytes_reclaimed": 0,
+        "delete_errors": 0,
+        "dangling_reports": 0,
+        "dangling_videos": 0,
+    }
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reconcile") as executor:
+        for uids in _batches(iter_user_dirs(root), batch_size):
+            scanned = list(executor.map(lambda uid: scan_user(root, uid, limiter), uids))
+            metadata = fetch_metadata(db, layout, collection_name, uids)
+
+            to_delete: List[StoredFile] = []
+            for files in scanned:
+                practices = metadata[files.uid]
+                stats["users"] += 1
+                stats["videos"] += len(files.videos)
+
+                for practice_id, stored in files.videos.items():
+                    practice = practices.get(practice_id)
+                    if practice is None:
+                        stats["unknown_videos"] += 1
+                        logger.info(f"Video without metadata: {stored.path}")
+                        if not delete_unknown:
+                            continue
+                    elif practice.get("video_in_local"):
+                        continue
+                    else:
+                        stats["orphaned_videos"] += 1
+                    if stored.modified <= cutoff:
+                        to_delete.append(stored)
+
+                for practice_id, practice in practices.items():
+                    if practice.get("report") and practice_id not in files.reports:
+                        stats["dangling_reports"] += 1
+                        logger.info(f"Report of uid={files.uid}, practice_id={practice_id} is missing on disk")
+                    if practice.get("video_in_local") and practice_id not in files.videos:
+                        stats["dangling_videos"] += 1
+                        logger.info(f"Video of uid={files.uid}, practice_id={practice_id} is missing on disk")
+
+            if dry_run:
+                stats["bytes_reclaimed"] += sum(stored.size for stored in to_delete)
+                stats["deleted_videos"] += len(to_delete)
+            else:
+                for stored, error in executor.map(lambda s: _delete(s, limiter), to_delete):
+                    if error is not None:
+                        stats["delete_errors"] += 1
+                        logger.warning(f"Could not delete {stored.path}: {error}")
+                        continue
+                    stats["deleted_videos"] += 1
+                    stats["bytes_reclaimed"] += stored.size
+
+            logger.info(
+                f"Batch done: {len(uids)} users (total users={stats['users']}, "
+                f"deleted={stats['deleted_videos']}, reclaimed={stats['bytes_reclaimed']} bytes)"
+            )
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=100, help="Users checked per Mongo query")
+    parser.add_argument("--workers", type=int, default=4, help="Threads listing directories and deleting files")
+    parser.add_argument("--ops-per-second", type=float, default=100.0, help="Max directory listings + deletions per second (0 = unlimited)")
+    parser.add_argument("--min-age-seconds", type=float, default=3600.0, help="Never delete files modified more recently than this")
+    parser.add_argument("--delete-unknown", action="store_true", help="Also delete videos that have no metadata")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be reclaimed without deleting")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    from app.core.config import settings
+
+    client = MongoClient(settings.MONGO_URI)
+    try:
+        stats = reconcile(
+            client[settings.MONGO_DB],
+            settings.CONTAINER_PATH,
+            layout=settings.MONGO_METADATA_LAYOUT,
+            collection_name=settings.MONGO_METADATA_COLLECTION,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            ops_per_second=args.ops_per_second,
+            min_age_seconds=args.min_age_seconds,
+            dry_run=args.dry_run,
+            delete_unknown=args.delete_unknown,
+        )
+        logger.info(f"Reconciliation finished: {stats}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+import os
+
+# Settings requires the connection variables at import time; tests never connect
+for name, value in {
+    "PRACTICE_SERVICE_PORT": "8130",
+    "MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_USER": "test",
+    "MYSQL_PASSWORD": "test", "MYSQL_DB": "test",
+    "MONGO_HOST": "localhost", "MONGO_PORT": "27017", "MONGO_USER": "test",
+    "MONGO_PASSWORD": "test", "MONGO_DB": "test",
+    "HOST_PATH": "/tmp", "CONTAINER_PATH": "/tmp",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,61 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.domain.entities.practice_metadata import PracticeMetadata
+from app.infrastructure.cache import memory_cache
+from app.infrastructure.cache.memory_cache import InMemoryCache
+from app.infrastructure.cache.redis_cache import RedisCache
+
+
+def _metadata(practice_id: int) -> PracticeMetadata:
+    return PracticeMetadata(id_practice=practice_id, video_in_local="", report="r.pdf", video_done=True, audio_done=True)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_expires_entries_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(memory_cache.time, "monotonic", lambda: now[0])
+    cache = InMemoryCache(max_size=10)
+
+    await cache.set("short", "a", ttl=5)
+    await cache.set("forever", "b", ttl=None)
+    now[0] += 10
+
+    assert await cache.get("short") is None
+    assert await cache.get("forever") == "b"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryCache(max_size=2)
+
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.get("a")
+    await cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert await cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_round_trips_entities_and_deletes():
+    cache = RedisCache(FakeAsyncRedis(), entity_type=PracticeMetadata)
+
+    await cache.set_many({"k1": _metadata(1), "k2": _metadata(2)}, ttl=60)
+    assert await cache.get_many(["k1", "k2", "k3"]) == {"k1": _metadata(1), "k2": _metadata(2)}
+
+    await cache.delete("k1")
+    assert await cache.get("k1") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_sets_ttl_only_when_given():
+    client = FakeAsyncRedis()
+    cache = RedisCache(client, entity_type=PracticeMetadata, key_prefix="")
+
+    await cache.set("with_ttl", _metadata(1), ttl=2.5)
+    await cache.set("no_ttl", _metadata(2), ttl=None)
+
+    assert 0 < await client.pttl("with_ttl") <= 2500
+    assert await client.pttl("no_ttl") == -1
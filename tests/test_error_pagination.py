@@ -0,0 +1,90 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.application.use_cases.get_musical_errors_use_case import GetMusicalErrorsUseCase
+from app.application.use_cases.get_postural_errors_use_case import GetPosturalErrorsUseCase
+from app.core.exceptions import ValidationException
+from app.domain.services.musical_error_service import MusicalErrorService
+from app.domain.services.postural_error_service import PosturalErrorService
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.musical_error_model import MusicalErrorModel
+from app.infrastructure.database.models.postural_error_model import PosturalErrorModel
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.repositories.mysql_musical_error_repo import MySQLMusicalErrorRepository
+from app.infrastructure.repositories.mysql_postural_error_repo import MySQLPosturalErrorRepository
+
+# Inserted out of time order, with two errors sharing a second
+MUSICAL = [(1, "01:05", "E"), (2, "00:12", "C#"), (3, "10:00", "C#"), (4, "00:40", "C#"), (5, "00:40", "E"), (6, "02:30", "C#")]
+
+
+@pytest_asyncio.fixture
+async def sessions(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'errors.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session:
+        session.add_all([
+            MusicalErrorModel(id=error_id, min_sec=min_sec, note_played=note_played, note_correct="D", id_practice=26)
+            for error_id, min_sec, note_played in MUSICAL
+        ])
+        session.add_all([
+            PosturalErrorModel(id=1, min_sec_init="00:30", min_sec_end="00:35", frame=1, explication="Wrist", id_practice=26),
+            PosturalErrorModel(id=2, min_sec_init="00:05", min_sec_end="00:09", frame=1, explication="Elbow", id_practice=26),
+            PosturalErrorModel(id=3, min_sec_init="00:50", min_sec_end="01:10", frame=1, explication="Back", id_practice=27),
+        ])
+        await session.commit()
+
+    monkeypatch.setattr(mysql_connection, "get_async_session", sessions)
+    yield sessions
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_seconds_column_is_generated_from_min_sec(sessions):
+    errors = await MySQLMusicalErrorRepository().get_musical_errors_page(26, limit=10)
+
+    assert [(e.id, e.seconds) for e in errors] == [(2, 12), (4, 40), (5, 40), (1, 65), (6, 150), (3, 600)]
+
+
+@pytest.mark.asyncio
+async def test_cursor_walks_all_pages_in_time_order(sessions):
+    use_case = GetMusicalErrorsUseCase(MusicalErrorService(MySQLMusicalErrorRepository()))
+
+    seen, cursor = [], None
+    while True:
+        page = await use_case.execute_page(26, limit=2, cursor=cursor)
+        seen.extend(e.id for e in page.errors)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [2, 4, 5, 1, 6, 3]
+
+
+@pytest.mark.asyncio
+async def test_time_window_filters_errors_near_playback_position(sessions):
+    use_case = GetMusicalErrorsUseCase(MusicalErrorService(MySQLMusicalErrorRepository()))
+
+    page = await use_case.execute_page(26, from_sec=30, to_sec=90)
+
+    assert [e.min_sec for e in page.errors] == ["00:40", "00:40", "01:05"]
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_postural_window_filters_by_start_time_and_practice(sessions):
+    use_case = GetPosturalErrorsUseCase(PosturalErrorService(MySQLPosturalErrorRepository()))
+
+    page = await use_case.execute_page(26, from_sec=0, to_sec=60)
+
+    assert [e.explication for e in page.errors] == ["Elbow", "Wrist"]
+
+
+@pytest.mark.asyncio
+async def test_inverted_window_is_rejected(sessions):
+    use_case = GetPosturalErrorsUseCase(PosturalErrorService(MySQLPosturalErrorRepository()))
+
+    with pytest.raises(ValidationException):
+        await use_case.execute_page(26, from_sec=60, to_sec=10)
@@ -0,0 +1,136 @@
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock
+from pymongo.errors import ServerSelectionTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.application.use_cases.get_error_summary_use_case import GetErrorSummaryUseCase
+from app.core.exceptions import PracticeNotFoundException
+from app.domain.entities.error_summary import MusicalErrorSummary, NoteErrorCount, PosturalErrorSummary
+from app.domain.entities.practice_metadata import PracticeMetadata
+from app.domain.services.practice_metadata_service import PracticeMetadataService
+from app.infrastructure.cache.memory_cache import InMemoryCache
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.musical_error_model import MusicalErrorModel
+from app.infrastructure.database.models.postural_error_model import PosturalErrorModel
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.repositories.mysql_musical_error_repo import MySQLMusicalErrorRepository
+from app.infrastructure.repositories.mysql_postural_error_repo import MySQLPosturalErrorRepository
+
+
+@pytest_asyncio.fixture
+async def sessions(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'errors.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session:
+        session.add_all([
+            MusicalErrorModel(min_sec="00:12", note_played="C#", note_correct="D", id_practice=26),
+            MusicalErrorModel(min_sec="00:45", note_played="C#", note_correct="D", id_practice=26),
+            MusicalErrorModel(min_sec="01:30", note_played="F", note_correct="E", id_practice=26),
+            MusicalErrorModel(min_sec="00:10", note_played="A", note_correct="B", id_practice=27),
+        ])
+        session.add_all([
+            PosturalErrorModel(min_sec_init="00:05", min_sec_end="00:12", frame=1, explication="Wrist", id_practice=26),
+            PosturalErrorModel(min_sec_init="01:00", min_sec_end="01:04", frame=1, explication="Wrist", id_practice=26),
+            PosturalErrorModel(min_sec_init="00:20", min_sec_end="00:30", frame=1, explication="Elbow", id_practice=26),
+        ])
+        await session.commit()
+
+    monkeypatch.setattr(mysql_connection, "get_async_session", sessions)
+    yield sessions
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_musical_summary_groups_by_note_pair_and_time_bucket(sessions):
+    summary = await MySQLMusicalErrorRepository().get_musical_error_summary(26, bucket_sec=60)
+
+    assert summary.total == 3
+    assert [(n.note_correct, n.note_played, n.count) for n in summary.by_note] == [("D", "C#", 2), ("E", "F", 1)]
+    assert [(b.start_sec, b.count) for b in summary.by_time] == [(0, 2), (60, 1)]
+
+
+@pytest.mark.asyncio
+async def test_postural_summary_sums_durations_by_explication(sessions):
+    summary = await MySQLPosturalErrorRepository().get_postural_error_summary(26)
+
+    assert summary.total == 3
+    assert summary.total_duration_sec == 21
+    assert [(e.explication, e.count, e.duration_sec) for e in summary.by_explication] == [("Wrist", 2, 11), ("Elbow", 1, 10)]
+
+
+@pytest.mark.asyncio
+async def test_summary_of_practice_without_errors_is_empty(sessions):
+    summary = await MySQLPosturalErrorRepository().get_postural_error_summary(99)
+
+    assert summary == PosturalErrorSummary()
+
+
+def _use_case(metadata: PracticeMetadata, owner_side_effect=None, metadata_side_effect=None):
+    musical_service = AsyncMock()
+    musical_service.get_musical_error_summary.return_value = MusicalErrorSummary(
+        bucket_sec=60, total=2, by_note=[NoteErrorCount(note_correct="D", note_played="C#", count=2)]
+    )
+    practice_service = AsyncMock()
+    practice_service.get_practice_owner.return_value = "uid123"
+    practice_service.get_practice_owner.side_effect = owner_side_effect
+    metadata_repo = AsyncMock()
+    metadata_repo.get_practice_metadata.return_value = metadata
+    metadata_repo.get_practice_metadata.side_effect = metadata_side_effect
+    use_case = GetErrorSummaryUseCase(
+        musical_error_service=musical_service,
+        postural_error_service=AsyncMock(),
+        practice_service=practice_service,
+        practice_metadata_service=PracticeMetadataService(metadata_repo),
+        cache=InMemoryCache(),
+    )
+    return use_case, musical_service
+
+
+@pytest.mark.asyncio
+async def test_summary_of_finished_practice_is_memoized():
+    finished = PracticeMetadata(id_practice=26, video_in_local="", report="r.pdf", video_done=True, audio_done=True)
+    use_case, musical_service = _use_case(finished)
+
+    first = await use_case.musical_summary(26, bucket_sec=60)
+    second = await use_case.musical_summary(26, bucket_sec=60)
+
+    assert first == second
+    assert first.by_note[0].count == 2
+    musical_service.get_musical_error_summary.assert_awaited_once_with(26, 60)
+
+
+@pytest.mark.asyncio
+async def test_summary_of_unfinished_practice_is_recomputed():
+    in_progress = PracticeMetadata(id_practice=26, video_in_local="v.mp4", report="", video_done=True, audio_done=False)
+    use_case, musical_service = _use_case(in_progress)
+
+    await use_case.musical_summary(26, bucket_sec=60)
+    await use_case.musical_summary(26, bucket_sec=60)
+
+    assert musical_service.get_musical_error_summary.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_summary_is_not_memoized_when_owner_lookup_fails():
+    finished = PracticeMetadata(id_practice=26, video_in_local="", report="r.pdf", video_done=True, audio_done=True)
+    use_case, musical_service = _use_case(finished, owner_side_effect=PracticeNotFoundException(26))
+
+    await use_case.musical_summary(26, bucket_sec=60)
+    await use_case.musical_summary(26, bucket_sec=60)
+
+    assert musical_service.get_musical_error_summary.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_summary_is_served_when_metadata_store_is_unavailable():
+    finished = PracticeMetadata(id_practice=26, video_in_local="", report="r.pdf", video_done=True, audio_done=True)
+    use_case, musical_service = _use_case(finished, metadata_side_effect=ServerSelectionTimeoutError("mongo down"))
+
+    first = await use_case.musical_summary(26, bucket_sec=60)
+    await use_case.musical_summary(26, bucket_sec=60)
+
+    assert first.total == 2
+    assert musical_service.get_musical_error_summary.await_count == 2
@@ -0,0 +1,97 @@
+import httpx
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock
+from fastapi import FastAPI
+
+from app.application.use_cases.get_musical_errors_use_case import GetMusicalErrorsUseCase
+from app.application.use_cases.get_postural_errors_use_case import GetPosturalErrorsUseCase
+from app.core.exceptions import ValidationException
+from app.domain.entities.musical_error import MusicalError
+from app.domain.entities.postural_error import PosturalError
+from app.domain.services.musical_error_service import MusicalErrorService
+from app.domain.services.postural_error_service import PosturalErrorService
+from app.presentation.api.v1.dependencies import (
+    get_musical_errors_use_case_dependency,
+    get_postural_errors_use_case_dependency,
+)
+from app.presentation.api.v1.musical_error import router as musical_error_router
+from app.presentation.api.v1.postural_error import router as postural_error_router
+from app.shared.constants import ERRORS_BATCH_MAX_IDS
+
+
+@pytest.fixture
+def musical_repo():
+    repo = AsyncMock()
+    repo.get_musical_errors_by_practice_ids.return_value = {
+        26: [MusicalError(id=1, min_sec="00:12", note_played="C#", note_correct="D", id_practice=26)],
+        27: [],
+    }
+    return repo
+
+
+@pytest.fixture
+def postural_repo():
+    repo = AsyncMock()
+    repo.get_postural_errors_by_practice_ids.return_value = {
+        26: [],
+        27: [PosturalError(id=1, min_sec_init="00:05", min_sec_end="00:12", explication="Wrist", id_practice=27)],
+    }
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_dedups_ids_and_keeps_request_order(musical_repo):
+    use_case = GetMusicalErrorsUseCase(MusicalErrorService(musical_repo))
+
+    result = await use_case.execute_batch([27, 26, 27])
+
+    musical_repo.get_musical_errors_by_practice_ids.assert_awaited_once_with([27, 26])
+    assert list(result) == [27, 26]
+    assert result[27] == []
+    assert result[26][0].note_correct == "D"
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_rejects_too_many_ids(postural_repo):
+    use_case = GetPosturalErrorsUseCase(PosturalErrorService(postural_repo))
+
+    with pytest.raises(ValidationException):
+        await use_case.execute_batch(list(range(ERRORS_BATCH_MAX_IDS + 1)))
+
+    postural_repo.get_postural_errors_by_practice_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_rejects_empty_ids(postural_repo):
+    use_case = GetPosturalErrorsUseCase(PosturalErrorService(postural_repo))
+
+    with pytest.raises(ValidationException):
+        await use_case.execute_batch([])
+
+
+@pytest_asyncio.fixture
+async def client(musical_repo, postural_repo):
+    app = FastAPI()
+    app.include_router(musical_error_router)
+    app.include_router(postural_error_router)
+    app.dependency_overrides[get_musical_errors_use_case_dependency] = (
+        lambda: GetMusicalErrorsUseCase(MusicalErrorService(musical_repo))
+    )
+    app.dependency_overrides[get_postural_errors_use_case_dependency] = (
+        lambda: GetPosturalErrorsUseCase(PosturalErrorService(postural_repo))
+    )
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_batch_endpoints_group_errors_by_practice(client):
+    musical = (await client.get("/musical-errors/batch", params={"practice_ids": [26, 27]})).json()
+    postural = (await client.get("/postural-errors/batch", params={"practice_ids": [26, 27]})).json()
+
+    assert musical["data"]["practices"] == [
+        {"practice_id": 26, "num_errors": 1, "errors": [{"min_sec": "00:12", "note_played": "C#", "note_correct": "D"}]},
+        {"practice_id": 27, "num_errors": 0, "errors": []},
+    ]
+    assert [p["num_errors"] for p in postural["data"]["practices"]] == [0, 1]
@@ -0,0 +1,44 @@
+from decimal import Decimal
+
+import orjson
+
+from app.application.dto.musical_error_dto import MusicalErrorDTO
+from app.application.dto.postural_error_dto import PosturalErrorDTO
+from app.application.dto.practice_dto import PracticeDTO
+from app.presentation.responses import fast_success
+from app.presentation.schemas.common_schema import StandardResponse
+from app.presentation.schemas.musical_error_schema import MusicalErrorItem, musical_error_item_payload
+from app.presentation.schemas.postural_error_schema import PosturalErrorItem, postural_error_item_payload
+from app.presentation.schemas.practice_schema import PracticeItem, practice_item_payload
+from app.shared.enums import PracticeState
+
+
+def _validated_body(model, payload: dict) -> dict:
+    """Body produced by the default path: response_model validation then JSON."""
+    response = StandardResponse[model].success(data=model(**payload), message="ok")
+    return orjson.loads(response.model_dump_json())
+
+
+def test_fast_practice_payload_matches_practice_item_schema():
+    dto = PracticeDTO(
+        id=26, scale="C", scale_type="Major", duration=Decimal("300"), bpm=Decimal("120"), figure="Negra",
+        octaves=Decimal("2"), num_postural_errors=Decimal("0"), num_musical_errors=Decimal("1"), date="2023-10-01",
+        time="15:30:00", state=PracticeState.COMPLETED, local_video_url="v.mp4", pdf_url="r.pdf"
+    )
+    payload = practice_item_payload(dto)
+
+    fast_body = orjson.loads(fast_success(data=payload, message="ok").body)
+
+    assert fast_body == _validated_body(PracticeItem, payload)
+
+
+def test_fast_error_payloads_match_item_schemas():
+    musical = musical_error_item_payload(
+        MusicalErrorDTO(id=1, min_sec="00:12", note_played="C#", note_correct="D", id_practice=26)
+    )
+    postural = postural_error_item_payload(
+        PosturalErrorDTO(min_sec_init="00:05", min_sec_end="00:12", explication="Incorrect wrist position")
+    )
+
+    assert orjson.loads(fast_success(data=musical, message="ok").body) == _validated_body(MusicalErrorItem, musical)
+    assert orjson.loads(fast_success(data=postural, message="ok").body) == _validated_body(PosturalErrorItem, postural)
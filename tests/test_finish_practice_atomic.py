@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+from app.core.exceptions import PracticeNotFoundException, UserNotFoundException
+from app.infrastructure.database.mongo_connection import mongo_connection
+from app.infrastructure.repositories.mongo_metadata_repo import MongoMetadataRepository
+
+NUM_PRACTICES = 20
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = AsyncMongoMockClient()["test"]
+    monkeypatch.setattr(mongo_connection, "connect", lambda: db)
+    return db
+
+
+@pytest.fixture
+def repo(db):
+    return MongoMetadataRepository()
+
+
+async def _insert_user(db, uid: str = "uid123"):
+    await db["users"].insert_one({
+        "uid": uid,
+        "practices": [
+            {"id_practice": i, "video_in_local": f"videos/{i}.mp4", "report": f"r{i}.pdf", "video_done": True, "audio_done": i % 2 == 0}
+            for i in range(1, NUM_PRACTICES + 1)
+        ],
+    })
+
+
+@pytest.mark.asyncio
+async def test_finish_practice_returns_updated_subdocument(db, repo):
+    await _insert_user(db)
+
+    metadata = await repo.finish_practice("uid123", 4)
+
+    assert metadata.id_practice == 4
+    assert metadata.video_in_local == ""
+    assert metadata.report == "r4.pdf"
+    assert metadata.audio_done is True
+    user = await db["users"].find_one({"uid": "uid123"})
+    assert [pr["video_in_local"] for pr in user["practices"] if pr["id_practice"] != 4] == [
+        f"videos/{i}.mp4" for i in range(1, NUM_PRACTICES + 1) if i != 4
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parallel_finishes_clear_each_practice_exactly_once(db, repo):
+    await _insert_user(db)
+    practice_ids = list(range(1, NUM_PRACTICES + 1))
+
+    # Every practice finished twice concurrently: both calls succeed and see the cleared state
+    results = await asyncio.gather(*(repo.finish_practice("uid123", i) for i in practice_ids * 2))
+
+    assert sorted(m.id_practice for m in results) == sorted(practice_ids * 2)
+    assert all(m.video_in_local == "" for m in results)
+    user = await db["users"].find_one({"uid": "uid123"})
+    assert len(user["practices"]) == NUM_PRACTICES
+    assert all(pr["video_in_local"] == "" for pr in user["practices"])
+    assert all(pr["report"] == f"r{pr['id_practice']}.pdf" for pr in user["practices"])
+
+
+@pytest.mark.asyncio
+async def test_finish_practice_tells_missing_user_from_missing_practice(db, repo):
+    await _insert_user(db)
+    await db["users"].insert_one({"uid": "no-practices"})
+
+    with pytest.raises(UserNotFoundException):
+        await repo.finish_practice("unknown", 1)
+    with pytest.raises(PracticeNotFoundException):
+        await repo.finish_practice("uid123", 999)
+    with pytest.raises(PracticeNotFoundException):
+        await repo.finish_practice("no-practices", 1)
@@ -0,0 +1,218 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from mongomock_motor import AsyncMongoMockClient
+
+from app.application.use_cases.finish_practice_use_case import FinishPracticeUseCase
+from app.core.exceptions import (
+    PracticeNotFoundException,
+    PracticeServiceException,
+    UserNotFoundException,
+    ValidationException,
+)
+from app.domain.entities.practice_metadata import PracticeMetadata
+from app.domain.services.practice_metadata_service import PracticeMetadataService
+from app.domain.services.video_service import VideoService
+from app.infrastructure.cache.memory_cache import InMemoryCache
+from app.infrastructure.database.mongo_connection import mongo_connection
+from app.infrastructure.queue.sqlite_video_deletion_queue import SQLiteVideoDeletionQueue
+from app.infrastructure.repositories.mongo_metadata_repo import MongoMetadataRepository
+from app.presentation.api.v1.dependencies import get_finish_practice_use_case_dependency
+from app.presentation.api.v1.practice_metadata import router
+from app.presentation.middleware.exception_handler import practice_service_exception_handler
+from app.shared.constants import FINISH_BATCH_MAX_IDS
+
+
+def _metadata(practice_id: int, video_in_local: str = "") -> PracticeMetadata:
+    return PracticeMetadata(
+        id_practice=practice_id, video_in_local=video_in_local, report="r.pdf", video_done=True, audio_done=True
+    )
+
+
+def _embedded_db(matched_count: int, practices: list, user_exists: bool = True):
+    users = MagicMock()
+    users.update_one = AsyncMock(return_value=SimpleNamespace(matched_count=matched_count))
+    users.count_documents = AsyncMock(return_value=int(user_exists))
+    users.aggregate.return_value.to_list = AsyncMock(return_value=[{"practices": practices}] if matched_count else [])
+    return {"users": users}
+
+
+@pytest.mark.asyncio
+async def test_embedded_layout_finishes_all_practices_in_one_update(monkeypatch):
+    db = _embedded_db(1, [{"id_practice": 1, "video_in_local": "", "report": "r.pdf"}])
+    monkeypatch.setattr(mongo_connection, "connect", lambda: db)
+
+    metadata = await MongoMetadataRepository().finish_practices("uid1", [1, 2])
+
+    db["users"].update_one.assert_awaited_once_with(
+        {"uid": "uid1", "practices.id_practice": {"$in": [1, 2]}},
+        {"$set": {"practices.$[pr].video_in_local": ""}},
+        array_filters=[{"pr.id_practice": {"$in": [1, 2]}}],
+    )
+    assert list(metadata) == [1]
+    assert metadata[1].video_in_local == ""
+
+
+@pytest.mark.asyncio
+async def test_embedded_layout_raises_when_user_is_missing(monkeypatch):
+    db = _embedded_db(0, [], user_exists=False)
+    monkeypatch.setattr(mongo_connection, "connect", lambda: db)
+
+    with pytest.raises(UserNotFoundException):
+        await MongoMetadataRepository().finish_practices("missing", [1])
+
+
+@pytest.mark.asyncio
+async def test_embedded_layout_without_matching_practices_finishes_nothing(monkeypatch):
+    # e.g. a user document without a practices array
+    db = _embedded_db(0, [], user_exists=True)
+    monkeypatch.setattr(mongo_connection, "connect", lambda: db)
+
+    assert await MongoMetadataRepository().finish_practices("uid1", [1, 2]) == {}
+    db["users"].count_documents.assert_awaited_once_with({"uid": "uid1"}, limit=1)
+
+
+@pytest.fixture
+def collection_repo(monkeypatch):
+    db = AsyncMongoMockClient()["test"]
+    monkeypatch.setattr(mongo_connection, "connect", lambda: db)
+    return MongoMetadataRepository(layout="collection", collection_name="practice_metadata"), db
+
+
+@pytest.mark.asyncio
+async def test_collection_layout_finishes_only_requested_practices(collection_repo):
+    repo, db = collection_repo
+    await db["practice_metadata"].insert_many([
+        {"uid": "uid1", "id_practice": i, "video_in_local": f"videos/{i}.mp4", "report": "r.pdf"} for i in range(1, 5)
+    ])
+
+    metadata = await repo.finish_practices("uid1", [1, 3, 99])
+
+    assert sorted(metadata) == [1, 3]
+    untouched = await db["practice_metadata"].find_one({"uid": "uid1", "id_practice": 2})
+    assert untouched["video_in_local"] == "videos/2.mp4"
+
+
+@pytest.mark.asyncio
+async def test_collection_layout_tells_missing_user_from_missing_practice(collection_repo):
+    repo, db = collection_repo
+    await db["users"].insert_one({"uid": "uid1"})
+
+    with pytest.raises(PracticeNotFoundException):
+        await repo.get_practice_metadata("uid1", 99)
+    with pytest.raises(PracticeNotFoundException):
+        await repo.finish_practice("uid1", 99)
+    assert await repo.finish_practices("uid1", [99]) == {}
+
+    with pytest.raises(UserNotFoundException):
+        await repo.get_practice_metadata("missing", 1)
+    with pytest.raises(UserNotFoundException):
+        await repo.finish_practice("missing", 1)
+    with pytest.raises(UserNotFoundException):
+        await repo.finish_practices("missing", [1])
+
+
+@pytest.mark.asyncio
+async def test_service_invalidates_cached_entries():
+    repo = AsyncMock()
+    repo.finish_practices.return_value = {1: _metadata(1)}
+    cache = InMemoryCache()
+    service = PracticeMetadataService(repo, cache=cache)
+    await cache.set("practice_metadata:uid1:1", _metadata(1, "videos/1.mp4"))
+
+    await service.finish_practices("uid1", [1, 2])
+
+    assert await cache.get("practice_metadata:uid1:1") is None
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_reports_missing_practices_and_schedules_found_ones():
+    metadata_service = AsyncMock()
+    metadata_service.finish_practices.return_value = {3: _metadata(3), 1: _metadata(1)}
+    video_service = AsyncMock()
+    use_case = FinishPracticeUseCase(metadata_service, video_service)
+
+    results = await use_case.execute_batch("uid1", [1, 2, 1, 3])
+
+    metadata_service.finish_practices.assert_awaited_once_with("uid1", [1, 2, 3])
+    assert list(results) == [1, 2, 3]
+    assert results[2] is None
+    video_service.schedule_video_deletions.assert_awaited_once_with("uid1", [1, 3])
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_enforces_batch_size():
+    use_case = FinishPracticeUseCase(AsyncMock(), AsyncMock())
+
+    with pytest.raises(ValidationException):
+        await use_case.execute_batch("uid1", list(range(FINISH_BATCH_MAX_IDS + 1)))
+    with pytest.raises(ValidationException):
+        await use_case.execute_batch("uid1", [])
+
+
+@pytest.mark.asyncio
+async def test_schedule_video_deletions_without_queue_deletes_concurrently():
+    repo = AsyncMock()
+    repo.delete_video.side_effect = [True, OSError("busy"), False]
+    service = VideoService(repo)
+
+    await service.schedule_video_deletions("uid1", [1, 2, 3])
+
+    assert repo.delete_video.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_schedule_video_deletions_enqueues_in_one_batch(tmp_path):
+    queue = SQLiteVideoDeletionQueue(str(tmp_path / "queue.db"))
+    repo = AsyncMock()
+    service = VideoService(repo, deletion_queue=queue)
+
+    await service.schedule_video_deletions("uid1", [1, 2, 3])
+
+    assert await queue.depth() == 3
+    repo.delete_video.assert_not_awaited()
+
+
+@pytest_asyncio.fixture
+async def client(collection_repo):
+    repo, db = collection_repo
+    await db["practice_metadata"].insert_many([
+        {"uid": "uid1", "id_practice": i, "video_in_local": f"videos/{i}.mp4", "report": "r.pdf"} for i in (1, 2)
+    ])
+    video_service = AsyncMock()
+    app = FastAPI()
+    app.include_router(router)
+    app.add_exception_handler(PracticeServiceException, practice_service_exception_handler)
+    app.dependency_overrides[get_finish_practice_use_case_dependency] = (
+        lambda: FinishPracticeUseCase(PracticeMetadataService(repo), video_service)
+    )
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client, video_service
+
+
+@pytest.mark.asyncio
+async def test_bulk_finish_endpoint_returns_per_id_results(client):
+    client, video_service = client
+
+    response = await client.patch("/practice/uid1/finish", json={"practice_ids": [2, 7, 1]})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["num_finished"] == 2
+    assert [(p["id_practice"], p["finished"]) for p in data["practices"]] == [(2, True), (7, False), (1, True)]
+    assert data["practices"][0]["metadata"]["video_in_local"] == ""
+    assert data["practices"][1]["metadata"] is None
+    video_service.schedule_video_deletions.assert_awaited_once_with("uid1", [2, 1])
+
+
+@pytest.mark.asyncio
+async def test_bulk_finish_endpoint_rejects_empty_batch(client):
+    client, _ = client
+
+    response = await client.patch("/practice/uid1/finish", json={"practice_ids": []})
+
+    assert response.status_code == 400
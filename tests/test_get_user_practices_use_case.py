@@ -0,0 +1,133 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock
+from app.application.use_cases.get_user_practices_use_case import GetUserPracticesUseCase
+from app.core.exceptions import PracticeNotFoundException, UserNotFoundException, ValidationException
+from app.domain.entities.practice import Practice
+from app.domain.entities.practice_metadata import PracticeMetadata
+from app.shared.enums import PracticeState
+
+
+def _practice(practice_id: int) -> Practice:
+    return Practice(
+        id=practice_id,
+        scale="C Major",
+        scale_type="Major",
+        duration=120,
+        bpm=100,
+        figure=1,
+        octaves=2,
+        num_postural_errors=0,
+        num_musical_errors=1,
+        date="2025-11-01",
+        time="10:00:00",
+        state="",
+        local_video_url="",
+        pdf_url=""
+    )
+
+
+def _metadata(practice_id: int, video_in_local: str = "", report: str = "r.pdf") -> PracticeMetadata:
+    return PracticeMetadata(
+        id_practice=practice_id, video_in_local=video_in_local, report=report, video_done=True, audio_done=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_one_fetches_mysql_and_mongo_concurrently():
+    both_started = asyncio.Event()
+    started = []
+
+    async def wait_for_other(name, result):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return result
+
+    async def get_practice_by_id(uid, practice_id):
+        return await wait_for_other("mysql", _practice(practice_id))
+
+    async def get_practice_metadata(uid, practice_id):
+        return await wait_for_other("mongo", _metadata(practice_id))
+
+    practice_service = AsyncMock()
+    practice_service.get_practice_by_id.side_effect = get_practice_by_id
+    metadata_service = AsyncMock()
+    metadata_service.get_practice_metadata.side_effect = get_practice_metadata
+    use_case = GetUserPracticesUseCase(practice_service, metadata_service)
+
+    result = await use_case.get_one("uid123", 7)
+
+    assert sorted(started) == ["mongo", "mysql"]
+    assert result.id == 7
+    assert result.state == PracticeState.FINISHED
+
+
+@pytest.mark.asyncio
+async def test_get_one_mysql_not_found_wins_over_mongo_error():
+    practice_service = AsyncMock()
+    practice_service.get_practice_by_id.side_effect = PracticeNotFoundException(practice_id=7)
+    metadata_service = AsyncMock()
+    metadata_service.get_practice_metadata.side_effect = UserNotFoundException(user_id="uid123")
+    use_case = GetUserPracticesUseCase(practice_service, metadata_service)
+
+    with pytest.raises(PracticeNotFoundException):
+        await use_case.get_one("uid123", 7)
+
+
+@pytest.mark.asyncio
+async def test_get_one_raises_mongo_error_when_mysql_succeeds():
+    practice_service = AsyncMock()
+    practice_service.get_practice_by_id.return_value = _practice(7)
+    metadata_service = AsyncMock()
+    metadata_service.get_practice_metadata.side_effect = UserNotFoundException(user_id="uid123")
+    use_case = GetUserPracticesUseCase(practice_service, metadata_service)
+
+    with pytest.raises(UserNotFoundException):
+        await use_case.get_one("uid123", 7)
+
+
+@pytest.mark.asyncio
+async def test_get_all_fetches_metadata_in_one_call():
+    practice_service = AsyncMock()
+    practice_service.get_practices_for_user.return_value = [_practice(1), _practice(2)]
+    metadata_service = AsyncMock()
+    metadata_service.get_practices_metadata.return_value = {
+        1: _metadata(1),
+        2: _metadata(2, video_in_local="v2.mp4"),
+    }
+    use_case = GetUserPracticesUseCase(practice_service, metadata_service)
+
+    result = await use_case.get_all("uid123")
+
+    metadata_service.get_practices_metadata.assert_awaited_once_with("uid123", [1, 2])
+    assert [p.state for p in result.practices] == [PracticeState.FINISHED, PracticeState.COMPLETED]
+    assert result.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_all_returns_cursor_of_last_practice_when_page_is_full():
+    practice_service = AsyncMock()
+    practice_service.get_practices_for_user.return_value = [_practice(5), _practice(4)]
+    metadata_service = AsyncMock()
+    metadata_service.get_practices_metadata.return_value = {5: _metadata(5), 4: _metadata(4)}
+    use_case = GetUserPracticesUseCase(practice_service, metadata_service)
+
+    first_page = await use_case.get_all("uid123", limit=2)
+    await use_case.get_all("uid123", limit=2, cursor=first_page.next_cursor)
+
+    assert first_page.next_cursor is not None
+    practice_service.get_practices_for_user.assert_awaited_with(
+        "uid123", None, 2, (datetime(2025, 11, 1, 10, 0, 0), 4)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_all_rejects_malformed_cursor():
+    use_case = GetUserPracticesUseCase(AsyncMock(), AsyncMock())
+
+    with pytest.raises(ValidationException):
+        await use_case.get_all("uid123", cursor="not-a-cursor")
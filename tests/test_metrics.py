@@ -0,0 +1,134 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from prometheus_client import REGISTRY
+
+from app.core.metrics import instrument_repository, render_metrics
+from app.presentation.middleware.metrics import MetricsMiddleware
+
+
+def _sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@instrument_repository("test")
+class FakeRepository:
+    async def get_item(self, item_id: int) -> int:
+        if item_id < 0:
+            raise ValueError("negative id")
+        return item_id
+
+    async def stream_items(self, count: int):
+        for i in range(count):
+            yield i
+
+    async def _helper(self):
+        return None
+
+    def sync_method(self):
+        return "untouched"
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return PlainTextResponse("x" * item_id)
+
+    @app.post("/items")
+    async def create_item():
+        return {"created": True}
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_middleware_labels_requests_by_route_template(app):
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    size_labels = {"method": "GET", "route": "/items/{item_id}"}
+    count_before = _sample("http_request_duration_seconds_count", labels)
+    size_before = _sample("http_response_size_bytes_sum", size_labels)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/items/10")
+        await client.get("/items/20")
+
+    assert _sample("http_request_duration_seconds_count", labels) - count_before == 2
+    assert _sample("http_response_size_bytes_sum", size_labels) - size_before == 30
+    assert _sample("http_requests_in_progress", {"method": "GET"}) == 0
+
+
+@pytest.mark.asyncio
+async def test_middleware_groups_unknown_paths_and_records_request_size(app):
+    unmatched = {"method": "GET", "route": "unmatched", "status": "404"}
+    request_size = {"method": "POST", "route": "/items"}
+    unmatched_before = _sample("http_request_duration_seconds_count", unmatched)
+    size_before = _sample("http_request_size_bytes_sum", request_size)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/does-not-exist/1")
+        await client.get("/does-not-exist/2")
+        await client.post("/items", content=b"0123456789")
+
+    assert _sample("http_request_duration_seconds_count", unmatched) - unmatched_before == 2
+    assert _sample("http_request_size_bytes_sum", request_size) - size_before == 10
+
+
+@pytest.mark.asyncio
+async def test_middleware_groups_unknown_methods_and_ignores_malformed_content_length():
+    async def inner(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"abc")]})
+        await send({"type": "http.response.body", "body": b"12345"})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "FOO", "path": "/", "headers": [(b"content-length", b"not-a-number")]}
+    labels = {"method": "other", "route": "unmatched"}
+    count_before = _sample("http_request_duration_seconds_count", {**labels, "status": "200"})
+    size_before = _sample("http_response_size_bytes_sum", labels)
+    request_size_before = _sample("http_request_size_bytes_count", labels)
+
+    await MetricsMiddleware(inner)(scope, None, send)
+
+    assert [m["type"] for m in sent] == ["http.response.start", "http.response.body"]
+    assert _sample("http_request_duration_seconds_count", {**labels, "status": "200"}) - count_before == 1
+    assert _sample("http_request_duration_seconds_count", {"method": "FOO", "route": "unmatched", "status": "200"}) == 0
+    # The response size falls back to the body bytes; the request size is not observed
+    assert _sample("http_response_size_bytes_sum", labels) - size_before == 5
+    assert _sample("http_request_size_bytes_count", labels) == request_size_before
+    assert _sample("http_requests_in_progress", {"method": "other"}) == 0
+
+
+@pytest.mark.asyncio
+async def test_instrument_repository_times_public_async_methods():
+    repo = FakeRepository()
+    ok = {"backend": "test", "repository": "FakeRepository", "method": "get_item", "outcome": "ok"}
+    error = {**ok, "outcome": "error"}
+    stream = {**ok, "method": "stream_items"}
+
+    assert await repo.get_item(3) == 3
+    with pytest.raises(ValueError):
+        await repo.get_item(-1)
+    assert [i async for i in repo.stream_items(3)] == [0, 1, 2]
+
+    assert _sample("repository_operation_duration_seconds_count", ok) == 1
+    assert _sample("repository_operation_duration_seconds_count", error) == 1
+    assert _sample("repository_operation_duration_seconds_count", stream) == 1
+    assert _sample("repository_operation_duration_seconds_count", {**ok, "method": "_helper"}) == 0
+    assert repo.sync_method() == "untouched"
+    assert FakeRepository.get_item.__name__ == "get_item"
+
+
+def test_render_metrics_uses_prometheus_text_format():
+    content, content_type = render_metrics()
+
+    assert content_type.startswith("text/plain")
+    assert b"# TYPE http_request_duration_seconds histogram" in content
+    assert b"# TYPE repository_operation_duration_seconds histogram" in content
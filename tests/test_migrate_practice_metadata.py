@@ -0,0 +1,58 @@
+import mongomock
+
+from scripts.migrate_practice_metadata import migrate, user_doc_to_practice_docs
+
+
+def _seed_users(db, count: int, practices_per_user: int):
+    db["users"].insert_many([
+        {
+            "uid": f"user{u}",
+            "practices": [
+                {"id_practice": u * 100 + p, "video_in_local": f"v{p}.mp4", "report": "", "video_done": True, "audio_done": False}
+                for p in range(practices_per_user)
+            ],
+        }
+        for u in range(count)
+    ])
+
+
+def test_user_doc_to_practice_docs_flattens_practices():
+    docs = user_doc_to_practice_docs({
+        "uid": "user1",
+        "practices": [
+            {"id_practice": 1, "video_in_local": "v1.mp4", "report": "r1.pdf", "video_done": True, "audio_done": True},
+            {"video_in_local": "orphan.mp4"},
+        ],
+    })
+
+    assert docs == [
+        {"uid": "user1", "id_practice": 1, "video_in_local": "v1.mp4", "report": "r1.pdf", "video_done": True, "audio_done": True}
+    ]
+
+
+def test_migrate_copies_all_practices_in_batches():
+    db = mongomock.MongoClient().db
+    _seed_users(db, count=5, practices_per_user=3)
+
+    stats = migrate(db, "practice_metadata", batch_size=2)
+
+    assert stats["users"] == 5
+    assert stats["practices"] == 15
+    assert db["practice_metadata"].count_documents({}) == 15
+    assert db["practice_metadata"].find_one({"uid": "user4", "id_practice": 402})["video_in_local"] == "v2.mp4"
+
+
+def test_migrate_resumes_from_checkpoint_without_overwriting():
+    db = mongomock.MongoClient().db
+    _seed_users(db, count=2, practices_per_user=2)
+    migrate(db, "practice_metadata", batch_size=10)
+
+    # Newer state written through the collection layout must survive a re-run
+    db["practice_metadata"].update_one({"uid": "user0", "id_practice": 0}, {"$set": {"video_in_local": ""}})
+    db["users"].insert_one({"uid": "user9", "practices": [{"id_practice": 900, "video_in_local": "v.mp4"}]})
+
+    stats = migrate(db, "practice_metadata", batch_size=10)
+
+    assert stats["users"] == 3
+    assert db["practice_metadata"].count_documents({}) == 5
+    assert db["practice_metadata"].find_one({"uid": "user0", "id_practice": 0})["video_in_local"] == ""
@@ -50,3 +50,15 @@ async def test_get_musical_errors_by_practice_handles_exception():
 
     assert "DB error" in str(exc.value)
     mock_repo.get_musical_errors_by_practice_id.assert_awaited_once_with(5)
+
+
+@pytest.mark.asyncio
+async def test_get_musical_errors_by_practices_uses_single_repo_call():
+    mock_repo = AsyncMock()
+    mock_repo.get_musical_errors_by_practice_ids.return_value = {101: [], 102: []}
+    service = MusicalErrorService(mock_repo)
+
+    result = await service.get_musical_errors_by_practices([101, 102])
+
+    mock_repo.get_musical_errors_by_practice_ids.assert_awaited_once_with([101, 102])
+    assert result == {101: [], 102: []}
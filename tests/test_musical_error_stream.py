@@ -0,0 +1,89 @@
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.application.use_cases.get_musical_errors_use_case import GetMusicalErrorsUseCase
+from app.core.exceptions import MusicalErrorNotFoundException, PracticeServiceException
+from app.domain.services.musical_error_service import MusicalErrorService
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.musical_error_model import MusicalErrorModel
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.repositories.mysql_musical_error_repo import MySQLMusicalErrorRepository
+from app.presentation.api.v1.dependencies import get_musical_errors_use_case_dependency
+from app.presentation.api.v1.musical_error import router
+from app.presentation.middleware.exception_handler import practice_service_exception_handler
+from app.shared.constants import STREAM_YIELD_PER
+
+ROWS = STREAM_YIELD_PER * 2 + 7
+
+
+@pytest_asyncio.fixture
+async def repo(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'errors.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session:
+        session.add_all([
+            MusicalErrorModel(id=i + 1, min_sec=f"{i // 60:02d}:{i % 60:02d}", note_played="C#", note_correct="D", id_practice=26)
+            for i in range(ROWS)
+        ])
+        await session.commit()
+
+    monkeypatch.setattr(mysql_connection, "get_async_session", sessions)
+    yield MySQLMusicalErrorRepository()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_all_rows_in_id_order(repo):
+    ids = [error.id async for error in repo.stream_musical_errors_by_practice_id(26)]
+
+    assert ids == list(range(1, ROWS + 1))
+
+
+@pytest.mark.asyncio
+async def test_stream_raises_not_found_before_first_item(repo):
+    with pytest.raises(MusicalErrorNotFoundException):
+        await anext(repo.stream_musical_errors_by_practice_id(99))
+
+
+@pytest_asyncio.fixture
+async def client(repo):
+    app = FastAPI()
+    app.include_router(router)
+    app.add_exception_handler(PracticeServiceException, practice_service_exception_handler)
+    app.dependency_overrides[get_musical_errors_use_case_dependency] = (
+        lambda: GetMusicalErrorsUseCase(MusicalErrorService(repo))
+    )
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_ndjson_endpoint_streams_one_item_per_line(client):
+    response = await client.get("/musical-errors/26", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.content.splitlines()
+    assert len(lines) == ROWS
+    assert orjson.loads(lines[0]) == {"min_sec": "00:00", "note_played": "C#", "note_correct": "D"}
+
+
+@pytest.mark.asyncio
+async def test_ndjson_endpoint_keeps_404_for_missing_practice(client):
+    response = await client.get("/musical-errors/99", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_json_remains_the_default(client):
+    response = await client.get("/musical-errors/26")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["data"]["num_errors"] == ROWS
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.database.mongo_connection import mongo_connection
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.database.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    MongoPoolListener,
+    WaitHistogram,
+)
+from app.presentation.api.v1.internal import router
+
+
+def test_wait_histogram_buckets_are_cumulative():
+    histogram = WaitHistogram(buckets=(0.01, 0.1, 1.0))
+    for seconds in (0.005, 0.01, 0.05, 0.5, 3.0):
+        histogram.observe(seconds)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 5
+    assert snapshot["sum_seconds"] == pytest.approx(3.565)
+    assert snapshot["buckets"] == {"0.01": 2, "0.1": 3, "1.0": 4, "+Inf": 5}
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_tracks_checkouts_and_timeouts(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    pool = engine.sync_engine.pool
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            busy = pool.stats()
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        stats = pool.stats()
+    finally:
+        await engine.dispose()
+
+    assert busy["checked_out"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["checked_in"] == 1
+    assert stats["waiting"] == 0
+    assert stats["timeouts"] == 1
+    assert stats["checkout_wait"]["count"] == 2
+    assert stats["checkout_wait"]["sum_seconds"] >= 0.05
+
+
+def test_mongo_listener_counts_pool_events():
+    listener = MongoPoolListener()
+    for _ in range(2):
+        listener.connection_created(SimpleNamespace())
+        listener.connection_check_out_started(SimpleNamespace())
+        listener.connection_checked_out(SimpleNamespace(duration=0.002))
+    listener.connection_checked_in(SimpleNamespace())
+    listener.connection_check_out_started(SimpleNamespace())
+    listener.connection_check_out_failed(SimpleNamespace(reason="timeout", duration=0.2))
+
+    stats = listener.stats()
+
+    assert stats["open_connections"] == 2
+    assert stats["checked_out"] == 1
+    assert stats["waiting"] == 0
+    assert stats["check_out_failures"] == {"timeout": 1}
+    assert stats["checkout_wait"]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_pools_endpoint_reports_both_pools(monkeypatch):
+    monkeypatch.setattr(mysql_connection, "pool_stats", lambda: {"size": 10, "checked_out": 3})
+    app = FastAPI()
+    app.include_router(router)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/internal/pools")
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["mysql"] == {"size": 10, "checked_out": 3}
+    assert data["mongo"]["max_pool_size"] == mongo_connection.pool_stats()["max_pool_size"]
+    assert data["mongo"]["checked_out"] == 0
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import AsyncMock
 from app.domain.services.practice_metadata_service import PracticeMetadataService
 from app.domain.entities.practice_metadata import PracticeMetadata
+from app.infrastructure.cache.memory_cache import InMemoryCache
 
 
 @pytest.mark.asyncio
@@ -51,3 +52,87 @@ async def test_get_practice_metadata_raises_exception():
 
     with pytest.raises(Exception, match="Metadata fetch failed"):
         await service.get_practice_metadata("user123", 99)
+
+
+@pytest.mark.asyncio
+async def test_get_practices_metadata_returns_dict_by_practice_id():
+    mock_repo = AsyncMock()
+    mock_repo.get_practices_metadata.return_value = {
+        10: PracticeMetadata(id_practice=10, video_in_local="", report="r10.pdf", video_done=True, audio_done=True),
+        12: PracticeMetadata(id_practice=12, video_in_local="v12.mp4", report="", video_done=False, audio_done=True),
+    }
+    service = PracticeMetadataService(mock_repo)
+
+    result = await service.get_practices_metadata("user123", [10, 12])
+
+    mock_repo.get_practices_metadata.assert_awaited_once_with("user123", [10, 12])
+    assert set(result) == {10, 12}
+    assert result[12].video_in_local == "v12.mp4"
+
+
+@pytest.mark.asyncio
+async def test_get_practice_metadata_is_served_from_cache_on_second_call():
+    mock_repo = AsyncMock()
+    mock_repo.get_practice_metadata.return_value = PracticeMetadata(
+        id_practice=10, video_in_local="local/video1.mp4", report="", video_done=True, audio_done=False
+    )
+    service = PracticeMetadataService(mock_repo, cache=InMemoryCache(), cache_ttl=30)
+
+    first = await service.get_practice_metadata("user123", 10)
+    second = await service.get_practice_metadata("user123", 10)
+
+    mock_repo.get_practice_metadata.assert_awaited_once_with("user123", 10)
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_get_practices_metadata_caches_finished_practices_without_ttl():
+    mock_repo = AsyncMock()
+    mock_repo.get_practices_metadata.return_value = {
+        1: PracticeMetadata(id_practice=1, video_in_local="", report="r1.pdf", video_done=True, audio_done=True),
+        2: PracticeMetadata(id_practice=2, video_in_local="v2.mp4", report="", video_done=False, audio_done=False),
+    }
+    cache = AsyncMock()
+    cache.get_many.return_value = {}
+    service = PracticeMetadataService(mock_repo, cache=cache, cache_ttl=30)
+
+    result = await service.get_practices_metadata("user123", [1, 2])
+
+    assert set(result) == {1, 2}
+    cache.set_many.assert_any_await({"practice_metadata:user123:1": result[1]}, None)
+    cache.set_many.assert_any_await({"practice_metadata:user123:2": result[2]}, 30)
+
+
+@pytest.mark.asyncio
+async def test_get_practices_metadata_fetches_only_cache_misses():
+    cached = PracticeMetadata(id_practice=1, video_in_local="", report="r1.pdf", video_done=True, audio_done=True)
+    mock_repo = AsyncMock()
+    mock_repo.get_practices_metadata.return_value = {
+        2: PracticeMetadata(id_practice=2, video_in_local="v2.mp4", report="", video_done=True, audio_done=True),
+    }
+    cache = InMemoryCache()
+    await cache.set("practice_metadata:user123:1", cached)
+    service = PracticeMetadataService(mock_repo, cache=cache)
+
+    result = await service.get_practices_metadata("user123", [1, 2])
+
+    mock_repo.get_practices_metadata.assert_awaited_once_with("user123", [2])
+    assert result[1] is cached
+
+
+@pytest.mark.asyncio
+async def test_finish_practice_invalidates_cache():
+    mock_repo = AsyncMock()
+    mock_repo.get_practice_metadata.return_value = PracticeMetadata(
+        id_practice=11, video_in_local="local/video2.mp4", report="All good", video_done=True, audio_done=True
+    )
+    mock_repo.finish_practice.return_value = PracticeMetadata(
+        id_practice=11, video_in_local="", report="All good", video_done=True, audio_done=True
+    )
+    cache = InMemoryCache()
+    service = PracticeMetadataService(mock_repo, cache=cache)
+    await service.get_practice_metadata("user123", 11)
+
+    await service.finish_practice("user123", 11)
+
+    assert await cache.get("practice_metadata:user123:11") is None
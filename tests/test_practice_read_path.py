@@ -0,0 +1,22 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models.base import Base
+from scripts.bench_practice_read_path import lean_path, load_scales, orm_path, seed
+
+ROWS = 200
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session, ROWS)
+        yield session
+    engine.dispose()
+
+
+def test_lean_read_path_matches_orm_path(session):
+    assert lean_path(session, load_scales(session)) == orm_path(session)
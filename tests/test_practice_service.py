@@ -29,7 +29,7 @@ async def test_get_practices_for_user_returns_list():
 
     result = await service.get_practices_for_user("uid123")
 
-    mock_repo.get_practices_for_user.assert_awaited_once_with("uid123", None, None)
+    mock_repo.get_practices_for_user.assert_awaited_once_with("uid123", None, None, None)
     assert isinstance(result, list)
     assert result[0].scale == "C Major"
 
@@ -0,0 +1,140 @@
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.application.use_cases.get_practice_stats_use_case import GetPracticeStatsUseCase
+from app.domain.services.practice_stats_service import PracticeStatsService
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.practice_model import PracticeModel
+from app.infrastructure.database.models.scale_model import ScaleModel
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.database.scale_catalog import scale_catalog
+from app.infrastructure.repositories.mysql_practice_stats_repo import MySQLPracticeStatsRepository
+
+UID = "stats-user"
+
+
+def _practice(practice_id, when, scale_id=1, duration=300, bpm=100, postural=2, musical=5, uid=UID):
+    return PracticeModel(
+        id=practice_id, practice_datetime=when, duration=duration, bpm=bpm, figure=1, octaves=1,
+        total_notes_played=32, num_postural_errors=postural, num_musical_errors=musical,
+        id_student=uid, id_scale=scale_id,
+    )
+
+
+@pytest_asyncio.fixture
+async def sessions(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session:
+        session.add_all([ScaleModel(id=1, name="C", scale_type="Major"), ScaleModel(id=2, name="A", scale_type="Minor")])
+        session.add_all([
+            _practice(1, datetime(2025, 10, 27, 10)),                        # Monday
+            _practice(2, datetime(2025, 11, 2, 18), bpm=120),                 # Sunday, same week
+            _practice(3, datetime(2025, 11, 4, 9), scale_id=2, duration=600, musical=0),
+            _practice(4, datetime(2025, 11, 4, 9), uid="someone-else"),
+        ])
+        await session.commit()
+
+    monkeypatch.setattr(mysql_connection, "get_async_session", sessions)
+    monkeypatch.setattr(scale_catalog, "_scales", {})
+    monkeypatch.setattr(scale_catalog, "_loaded_at", None)
+    yield sessions
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_stats_aggregate_by_scale_and_week(sessions):
+    use_case = GetPracticeStatsUseCase(PracticeStatsService(MySQLPracticeStatsRepository()))
+
+    stats = await use_case.execute(UID, weeks=12)
+
+    assert stats.totals.num_practices == 3
+    assert stats.totals.total_practice_sec == 1200
+    assert stats.totals.avg_bpm == round(320 / 3, 2)
+    assert stats.totals.musical_errors_per_min == 0.5
+    assert [(s.scale, s.scale_type, s.num_practices) for s in stats.by_scale] == [("C", "Major", 2), ("A", "Minor", 1)]
+    assert [(w.week_start, w.num_practices) for w in stats.by_week] == [("2025-11-03", 1), ("2025-10-27", 2)]
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_folds_new_practices(sessions):
+    repo = MySQLPracticeStatsRepository()
+
+    assert await repo.refresh_user_stats(UID) == 3
+    assert await repo.refresh_user_stats(UID) == 0
+
+    async with sessions() as session:
+        session.add(_practice(10, datetime(2025, 11, 5, 9)))
+        await session.commit()
+
+    assert await repo.refresh_user_stats(UID) == 1
+    assert (await repo.get_user_stats(UID, weeks=12)).totals.num_practices == 4
+
+
+@pytest.mark.asyncio
+async def test_watermark_is_created_before_the_locking_refresh(sessions):
+    repo = MySQLPracticeStatsRepository()
+
+    # Idempotent: a refresh that lost the race to create the row just reuses it
+    await repo._ensure_watermark(UID, datetime(2025, 11, 5))
+    await repo._ensure_watermark(UID, datetime(2025, 11, 5))
+
+    assert await repo.refresh_user_stats(UID) == 3
+    assert await repo.refresh_user_stats(UID) == 0
+
+
+@pytest.mark.asyncio
+async def test_practices_pending_analysis_do_not_hold_back_newer_ones(sessions):
+    repo = MySQLPracticeStatsRepository()
+    async with sessions() as session:
+        session.add(_practice(10, datetime(2025, 11, 5, 9), postural=None, musical=None))
+        session.add(_practice(11, datetime(2025, 11, 6, 9)))
+        session.add(_practice(12, datetime(2025, 11, 7, 9)))
+        await session.commit()
+
+    assert await repo.refresh_user_stats(UID) == 5
+    assert (await repo.get_user_stats(UID, weeks=12)).totals.num_practices == 5
+    # Nothing to fold while the analysis is pending: no locking refresh on every read
+    assert await repo._has_new_practices(UID) is False
+    assert await repo.refresh_user_stats(UID) == 0
+
+    async with sessions() as session:
+        await session.execute(update(PracticeModel).where(PracticeModel.id == 10).values(num_postural_errors=1, num_musical_errors=1))
+        await session.commit()
+
+    assert await repo._has_new_practices(UID) is True
+    assert await repo.refresh_user_stats(UID) == 1
+    assert (await repo.get_user_stats(UID, weeks=12)).totals.num_practices == 6
+    assert await repo.refresh_user_stats(UID) == 0
+
+
+@pytest.mark.asyncio
+async def test_rebuild_folds_practices_left_pending(sessions):
+    repo = MySQLPracticeStatsRepository()
+    async with sessions() as session:
+        session.add(_practice(10, datetime(2025, 11, 5, 9), postural=None, musical=None))
+        await session.commit()
+    await repo.refresh_user_stats(UID)
+
+    async with sessions() as session:
+        await session.execute(update(PracticeModel).where(PracticeModel.id == 10).values(num_postural_errors=1, num_musical_errors=1))
+        await session.commit()
+
+    assert await repo.rebuild_user_stats(UID) == 4
+    assert await repo.refresh_user_stats(UID) == 0
+
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_incremental_rollup(sessions):
+    repo = MySQLPracticeStatsRepository()
+    await repo.refresh_user_stats(UID)
+    incremental = await repo.get_user_stats(UID, weeks=12)
+
+    assert await repo.rebuild_user_stats(UID) == 3
+    assert await repo.get_user_stats(UID, weeks=12) == incremental
@@ -0,0 +1,100 @@
+import os
+import time
+
+import mongomock
+import pytest
+
+from scripts.reconcile_storage import RateLimiter, reconcile
+
+
+def _write(path: str, size: int, age: float = 7200.0):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"\x00" * size)
+    modified = time.time() - age
+    os.utime(path, (modified, modified))
+    return path
+
+
+@pytest.fixture
+def storage(tmp_path):
+    root = str(tmp_path)
+    files = {
+        "orphan": _write(os.path.join(root, "user1", "videos", "practice_1.mp4"), 100),
+        "kept": _write(os.path.join(root, "user1", "videos", "practice_2.mp4"), 200),
+        "recent_orphan": _write(os.path.join(root, "user1", "videos", "practice_3.mp4"), 300, age=0),
+        "unknown": _write(os.path.join(root, "user2", "videos", "practice_9.mp4"), 400),
+        "report": _write(os.path.join(root, "user1", "reports", "report_1.pdf"), 10),
+    }
+    # Deletion queue database at the storage root must be ignored
+    _write(os.path.join(root, ".video_deletion_queue.db"), 10)
+    return root, files
+
+
+def _seed_embedded(db):
+    db["users"].insert_one({
+        "uid": "user1",
+        "practices": [
+            {"id_practice": 1, "video_in_local": "", "report": "report_1.pdf"},
+            {"id_practice": 2, "video_in_local": "videos/practice_2.mp4", "report": "report_2.pdf"},
+            {"id_practice": 3, "video_in_local": "", "report": ""},
+            {"id_practice": 4, "video_in_local": "videos/practice_4.mp4", "report": ""},
+        ],
+    })
+
+
+def test_reconcile_deletes_orphaned_videos_and_reports_dangling_metadata(storage):
+    root, files = storage
+    db = mongomock.MongoClient().db
+    _seed_embedded(db)
+
+    stats = reconcile(db, root, batch_size=1, ops_per_second=0)
+
+    assert not os.path.exists(files["orphan"])
+    assert os.path.exists(files["kept"])
+    assert os.path.exists(files["recent_orphan"])
+    assert os.path.exists(files["unknown"])
+    assert stats["users"] == 2
+    assert stats["orphaned_videos"] == 2
+    assert stats["deleted_videos"] == 1
+    assert stats["bytes_reclaimed"] == 100
+    assert stats["unknown_videos"] == 1
+    assert stats["dangling_reports"] == 1
+    assert stats["dangling_videos"] == 1
+
+
+def test_reconcile_dry_run_keeps_files(storage):
+    root, files = storage
+    db = mongomock.MongoClient().db
+    _seed_embedded(db)
+
+    stats = reconcile(db, root, dry_run=True, delete_unknown=True, ops_per_second=0)
+
+    assert all(os.path.exists(path) for path in files.values())
+    assert stats["deleted_videos"] == 2
+    assert stats["bytes_reclaimed"] == 500
+
+
+def test_reconcile_collection_layout(storage):
+    root, files = storage
+    db = mongomock.MongoClient().db
+    db["practice_metadata"].insert_many([
+        {"uid": "user1", "id_practice": 1, "video_in_local": "", "report": "report_1.pdf"},
+        {"uid": "user1", "id_practice": 2, "video_in_local": "videos/practice_2.mp4", "report": ""},
+    ])
+
+    stats = reconcile(db, root, layout="collection", ops_per_second=0)
+
+    assert not os.path.exists(files["orphan"])
+    assert os.path.exists(files["kept"])
+    assert stats["bytes_reclaimed"] == 100
+
+
+def test_rate_limiter_spaces_out_operations():
+    limiter = RateLimiter(rate=100)
+
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.wait()
+
+    assert time.monotonic() - start >= 0.05
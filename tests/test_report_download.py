@@ -0,0 +1,95 @@
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+
+from app.application.use_cases.get_report_use_case import GetReportUseCase
+from app.core.exceptions import ReportNotFoundException
+from app.domain.services.report_service import ReportService
+from app.infrastructure.repositories.local_report_repo import LocalReportRepository
+from app.presentation.api.v1.dependencies import get_report_use_case_dependency
+from app.presentation.api.v1.report import router
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 64
+
+
+@pytest.fixture
+def storage(tmp_path):
+    reports = tmp_path / "uid123" / "reports"
+    reports.mkdir(parents=True)
+    (reports / "report_10.pdf").write_bytes(PDF)
+    return tmp_path
+
+
+@pytest_asyncio.fixture
+async def client(storage):
+    use_case = GetReportUseCase(ReportService(LocalReportRepository(base_dir=str(storage))))
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_report_use_case_dependency] = lambda: use_case
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_download_streams_file_with_validators(client):
+    response = await client.get("/reports/uid123/10")
+
+    assert response.status_code == 200
+    assert response.content == PDF
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-length"] == str(len(PDF))
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"].startswith('"')
+    assert "last-modified" in response.headers
+    assert 'filename="report_10.pdf"' in response.headers["content-disposition"]
+
+
+@pytest.mark.asyncio
+async def test_download_range_returns_partial_content(client):
+    response = await client.get("/reports/uid123/10", headers={"Range": "bytes=0-7"})
+
+    assert response.status_code == 206
+    assert response.content == PDF[:8]
+    assert response.headers["content-range"] == f"bytes 0-7/{len(PDF)}"
+
+
+@pytest.mark.asyncio
+async def test_download_if_none_match_returns_304_without_body(client):
+    etag = (await client.get("/reports/uid123/10")).headers["etag"]
+
+    response = await client.get("/reports/uid123/10", headers={"If-None-Match": f"W/{etag}"})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_download_if_modified_since_returns_304(client):
+    last_modified = (await client.get("/reports/uid123/10")).headers["last-modified"]
+
+    response = await client.get("/reports/uid123/10", headers={"If-Modified-Since": last_modified})
+
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_download_changed_file_invalidates_etag(client, storage):
+    etag = (await client.get("/reports/uid123/10")).headers["etag"]
+    path = storage / "uid123" / "reports" / "report_10.pdf"
+    path.write_bytes(PDF + b"regenerated")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000_000))
+
+    response = await client.get("/reports/uid123/10", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.content.endswith(b"regenerated")
+
+
+@pytest.mark.asyncio
+async def test_download_missing_report_raises_not_found(client):
+    with pytest.raises(ReportNotFoundException):
+        await client.get("/reports/uid123/99")
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock
+from app.domain.entities.report_file import ReportFile
 from app.domain.services.report_service import ReportService
 
 
@@ -24,3 +25,16 @@ async def test_get_report_raises_exception():
 
     with pytest.raises(Exception, match="PDF not found"):
         await service.get_report("uid123", 10)
+
+
+@pytest.mark.asyncio
+async def test_get_report_file_returns_location_without_reading():
+    mock_repo = AsyncMock()
+    mock_repo.get_pdf_file.return_value = ReportFile(path="/storage/uid123/reports/report_10.pdf", size=8, modified_ns=1)
+    service = ReportService(mock_repo)
+
+    result = await service.get_report_file("uid123", 10)
+
+    mock_repo.get_pdf_file.assert_awaited_once_with("uid123", 10)
+    mock_repo.get_pdf.assert_not_called()
+    assert result.size == 8
@@ -0,0 +1,101 @@
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.exceptions import DatabaseConnectionException
+from app.infrastructure.database import scale_catalog as scale_catalog_module
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.practice_model import PracticeModel
+from app.infrastructure.database.models.scale_model import ScaleModel
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.database.scale_catalog import UNKNOWN_SCALE, ScaleCatalog, scale_catalog
+from app.infrastructure.repositories.mysql_practice_repo import MySQLPracticeRepository
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(scale_catalog_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.asyncio
+async def test_resolve_loads_catalog_once_within_refresh_interval(clock, mocker):
+    catalog = ScaleCatalog(refresh_interval=300)
+    fetch = mocker.patch.object(catalog, "_fetch_scales", AsyncMock(return_value={1: ("C", "Major")}))
+
+    first = await catalog.resolve([1])
+    clock[0] += 60
+    second = await catalog.resolve([1])
+
+    assert first == second == {1: ("C", "Major")}
+    fetch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_resolve_reloads_on_miss_after_cooldown(clock, mocker):
+    catalog = ScaleCatalog(refresh_interval=300, miss_cooldown=5)
+    fetch = mocker.patch.object(catalog, "_fetch_scales", AsyncMock(return_value={1: ("C", "Major")}))
+    await catalog.load()
+
+    # Within the cooldown an unknown id does not trigger a reload
+    assert await catalog.resolve([2]) == {2: UNKNOWN_SCALE}
+    assert fetch.await_count == 1
+
+    fetch.return_value = {1: ("C", "Major"), 2: ("D", "Minor")}
+    clock[0] += 10
+    assert await catalog.resolve([2]) == {2: ("D", "Minor")}
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_keeps_previous_catalog_when_refresh_fails(clock, mocker):
+    catalog = ScaleCatalog(refresh_interval=300)
+    fetch = mocker.patch.object(catalog, "_fetch_scales", AsyncMock(return_value={1: ("C", "Major")}))
+    await catalog.load()
+
+    fetch.side_effect = DatabaseConnectionException("MySQL down")
+    clock[0] += 600
+
+    assert await catalog.resolve([1]) == {1: ("C", "Major")}
+
+
+@pytest.mark.asyncio
+async def test_resolve_raises_when_catalog_never_loaded(mocker):
+    catalog = ScaleCatalog()
+    mocker.patch.object(catalog, "_fetch_scales", AsyncMock(side_effect=DatabaseConnectionException("MySQL down")))
+
+    with pytest.raises(DatabaseConnectionException):
+        await catalog.resolve([1])
+
+
+@pytest.mark.asyncio
+async def test_practice_repo_releases_its_connection_before_resolving_scales(tmp_path, monkeypatch):
+    # A single pooled connection: the catalog load must not wait for the one the query used
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'practices.db'}", pool_size=1, max_overflow=0, pool_timeout=0.5
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session:
+        session.add(ScaleModel(id=1, name="C", scale_type="Major"))
+        session.add(PracticeModel(
+            id=1, practice_datetime=datetime(2025, 1, 1, 8, 0), num_postural_errors=0, num_musical_errors=0,
+            duration=300, bpm=120, figure=1, octaves=2, total_notes_played=64, id_student="uid1", id_scale=1,
+        ))
+        await session.commit()
+    monkeypatch.setattr(mysql_connection, "get_async_session", sessions)
+    monkeypatch.setattr(scale_catalog, "_scales", {})
+    monkeypatch.setattr(scale_catalog, "_loaded_at", None)
+
+    try:
+        repo = MySQLPracticeRepository()
+        practices = await repo.get_practices_for_user("uid1")
+        practice = await repo.get_practice_by_id("uid1", 1)
+    finally:
+        await engine.dispose()
+
+    assert practices[0].scale == practice.scale == "C"
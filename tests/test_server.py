@@ -0,0 +1,35 @@
+import os
+
+from app.core.config import settings
+from app.server import PracticeServiceApplication, PracticeServiceWorker, build_options, prepare_metrics_dir, worker_count
+
+
+def test_worker_count_prefers_configuration_over_cpu_cores(monkeypatch):
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2}, raising=False)
+
+    assert worker_count(5) == 5
+    assert worker_count(0) == 3
+
+
+def test_options_preload_app_with_uvloop_httptools_workers():
+    app = PracticeServiceApplication("app.main:app", build_options("127.0.0.1:8130", 4))
+
+    assert app.cfg.workers == 4
+    assert app.cfg.preload_app is True
+    assert app.cfg.worker_class is PracticeServiceWorker
+    assert app.cfg.graceful_timeout == settings.GRACEFUL_TIMEOUT
+    assert PracticeServiceWorker.CONFIG_KWARGS == {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
+
+
+def test_metrics_dir_is_only_shared_between_several_workers(monkeypatch, tmp_path):
+    metrics_dir = tmp_path / "metrics"
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(metrics_dir))
+    metrics_dir.mkdir()
+    (metrics_dir / "histogram_1.db").write_bytes(b"stale")
+
+    prepare_metrics_dir(1)
+    assert (metrics_dir / "histogram_1.db").exists()
+
+    prepare_metrics_dir(2)
+    assert os.environ["PROMETHEUS_MULTIPROC_DIR"] == str(metrics_dir)
+    assert list(metrics_dir.iterdir()) == []
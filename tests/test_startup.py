@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.database import startup
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.database.pool_metrics import InstrumentedAsyncAdaptedQueuePool
+from app.infrastructure.database.startup import Readiness, backoff_delay, retry_with_backoff
+
+
+def test_backoff_delay_grows_exponentially_with_jitter():
+    delays = [backoff_delay(attempt, base_delay=0.5, max_delay=4.0) for attempt in range(6) for _ in range(50)]
+
+    assert all(0 <= delay <= 4.0 for delay in delays)
+    assert max(backoff_delay(0, 0.5, 4.0) for _ in range(50)) <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_retry_with_backoff_tries_immediately_and_until_success():
+    calls = []
+
+    async def flaky():
+        calls.append(time.monotonic())
+        if len(calls) < 3:
+            raise ConnectionError("not yet")
+
+    start = time.monotonic()
+    await retry_with_backoff("flaky", flaky, base_delay=0.01, max_delay=0.02)
+
+    assert len(calls) == 3
+    assert calls[0] - start < 0.01
+
+
+@pytest.mark.asyncio
+async def test_initialize_databases_connects_in_parallel(monkeypatch):
+    async def slow_connect():
+        await asyncio.sleep(0.1)
+
+    monkeypatch.setattr(startup, "connect_mysql", slow_connect)
+    monkeypatch.setattr(startup, "connect_mongo", slow_connect)
+
+    start = time.monotonic()
+    await startup.initialize_databases()
+
+    assert time.monotonic() - start < 0.19
+
+
+@pytest.mark.asyncio
+async def test_mysql_prewarm_fills_the_pool(tmp_path, monkeypatch):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=5,
+    )
+    monkeypatch.setattr(mysql_connection, "async_engine", engine)
+    try:
+        await mysql_connection.prewarm(3)
+        stats = mysql_connection.pool_stats()
+    finally:
+        await engine.dispose()
+
+    assert stats["checked_in"] == 3
+    assert stats["checked_out"] == 0
+
+
+def test_readiness_requires_every_check_and_drops_on_shutdown():
+    readiness = Readiness("mysql", "mongo")
+    readiness.mark("mysql")
+    assert not readiness.ready
+
+    readiness.mark("mongo")
+    assert readiness.ready
+
+    readiness.shutting_down = True
+    assert not readiness.ready
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("enabled, expected_status", [(False, 404), (True, 200)])
+async def test_internal_endpoints_are_opt_in_and_undocumented(monkeypatch, enabled, expected_status):
+    import app.main as main
+
+    monkeypatch.setattr(main.settings, "INTERNAL_ENDPOINTS_ENABLED", enabled)
+    monkeypatch.setattr(mysql_connection, "pool_stats", lambda: {})
+    app = main.create_application()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.get("/internal/pools")).status_code == expected_status
+    assert not any(path.startswith("/internal") for path in app.openapi()["paths"])
+
+
+@pytest.mark.asyncio
+async def test_probes(monkeypatch):
+    import app.main as main
+
+    readiness = Readiness("mysql", "mongo", "startup")
+    monkeypatch.setattr(main, "readiness", readiness)
+    app = main.create_application()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.get("/livez")).status_code == 200
+
+        response = await client.get("/readyz")
+        assert response.status_code == 503
+        assert response.json()["checks"] == {"mysql": False, "mongo": False, "startup": False}
+
+        for check in ("mysql", "mongo", "startup"):
+            readiness.mark(check)
+        response = await client.get("/readyz")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
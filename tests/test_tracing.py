@@ -0,0 +1,166 @@
+import logging
+import re
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.application.use_cases.get_user_practices_use_case import GetUserPracticesUseCase
+from app.core.tracing import (
+    InMemorySpanExporter,
+    LoggingSpanExporter,
+    Span,
+    Trace,
+    current_trace_id,
+    span,
+    start_trace,
+    traced,
+    tracer,
+)
+from app.domain.entities.practice import Practice
+from app.domain.entities.practice_metadata import PracticeMetadata
+from app.domain.services.practice_metadata_service import PracticeMetadataService
+from app.domain.services.practice_service import PracticeService
+from app.presentation.api.v1 import dependencies
+from app.presentation.api.v1.practice import router as practice_router
+from app.presentation.middleware.tracing import TracingMiddleware
+
+
+def _practice(practice_id: int) -> Practice:
+    return Practice(
+        id=practice_id, scale="C", scale_type="Major", duration=120, bpm=100, figure=1, octaves=2,
+        num_postural_errors=0, num_musical_errors=1, date="2025-11-01", time="10:00:00",
+        state="", local_video_url="", pdf_url=""
+    )
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    previous = tracer.exporter
+    tracer.set_exporter(exporter)
+    yield exporter
+    tracer.set_exporter(previous)
+
+
+@pytest.fixture
+def app():
+    practice_repo = AsyncMock()
+    practice_repo.get_practices_for_user.return_value = [_practice(1), _practice(2)]
+    metadata_repo = AsyncMock()
+    metadata_repo.get_practices_metadata.return_value = {
+        i: PracticeMetadata(id_practice=i, video_in_local="", report="r.pdf", video_done=True, audio_done=True)
+        for i in (1, 2)
+    }
+    use_case = GetUserPracticesUseCase(PracticeService(practice_repo), PracticeMetadataService(metadata_repo))
+
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+    app.include_router(practice_router)
+    app.dependency_overrides[dependencies.get_user_practices_use_case_dependency] = lambda: use_case
+    return app
+
+
+@pytest.mark.asyncio
+async def test_request_spans_are_nested_and_exported(app, exporter):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/practice/uid123")
+
+    assert response.status_code == 200
+    [trace] = exporter.traces
+    assert trace.name == "GET /practice/{uid}"
+    assert response.headers["x-trace-id"] == trace.trace_id
+
+    by_name = {s.name: s for s in trace.spans}
+    root = by_name["total"]
+    use_case = by_name["GetUserPracticesUseCase.get_all"]
+    assert root.parent_id is None
+    assert use_case.parent_id == root.span_id
+    assert by_name["PracticeService.get_practices_for_user"].parent_id == use_case.span_id
+    assert by_name["PracticeMetadataService.get_practices_metadata"].parent_id == use_case.span_id
+    assert all(s.duration is not None for s in trace.spans)
+
+    server_timing = response.headers["server-timing"]
+    assert "GetUserPracticesUseCase.get_all;dur=" in server_timing
+    assert "PracticeService.get_practices_for_user;dur=" in server_timing
+
+
+@pytest.mark.asyncio
+async def test_trace_id_is_taken_from_traceparent(app, exporter):
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/practice/uid123", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"})
+
+    assert response.headers["x-trace-id"] == trace_id
+    assert exporter.traces[0].trace_id == trace_id
+    assert current_trace_id() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("trace_id", ["0" * 32, "4BF92F3577B34DA6A3CE929D0E0E4736", "<script>alert(1)</script>" + "a" * 7])
+async def test_invalid_traceparent_trace_id_is_replaced(app, exporter, trace_id):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/practice/uid123", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"})
+
+    assert response.headers["x-trace-id"] != trace_id
+    assert re.fullmatch(r"[0-9a-f]{32}", response.headers["x-trace-id"])
+    assert exporter.traces[0].trace_id == response.headers["x-trace-id"]
+
+
+@pytest.mark.asyncio
+async def test_traced_records_nothing_outside_a_trace():
+    @traced
+    class Repo:
+        async def get(self):
+            return current_trace_id()
+
+        async def stream(self):
+            yield 1
+
+    assert await Repo().get() is None
+    assert [i async for i in Repo().stream()] == [1]
+    with span("orphan") as record:
+        assert record is None
+
+
+@pytest.mark.asyncio
+async def test_async_generator_span_covers_the_whole_stream():
+    @traced
+    class Repo:
+        async def stream(self, count):
+            for i in range(count):
+                yield i
+
+    with start_trace() as trace:
+        with span("total"):
+            items = [i async for i in Repo().stream(3)]
+
+    assert items == [0, 1, 2]
+    assert [s.name for s in trace.spans] == ["total", "Repo.stream"]
+    assert trace.spans[1].parent_id == trace.spans[0].span_id
+    assert trace.spans[1].duration is not None
+
+
+def test_server_timing_aggregates_repeated_spans():
+    trace = Trace(trace_id="t", spans=[
+        Span(name="Repo.get", span_id=str(i), parent_id=None, start=0, duration=0.002) for i in range(3)
+    ])
+
+    assert trace.server_timing() == 'Repo.get;dur=6.00;desc="x3"'
+    assert trace.repeated_spans(3) == {"Repo.get": 3}
+    assert trace.repeated_spans(4) == {}
+
+
+def test_logging_exporter_warns_on_repeated_spans(caplog):
+    trace = Trace(trace_id="t", name="GET /practice/{uid}", spans=[
+        Span(name="total", span_id="root", parent_id=None, start=0, duration=0.01),
+        *[Span(name="Repo.get", span_id=str(i), parent_id="root", start=0, duration=0.001) for i in range(5)],
+    ])
+
+    with caplog.at_level(logging.WARNING, logger="app.core.tracing"):
+        LoggingSpanExporter(slow_ms=500, repeated_span_threshold=5).export(trace)
+
+    assert "repeats spans {'Repo.get': 5}" in caplog.text
+    assert "Slow trace" not in caplog.text
@@ -0,0 +1,32 @@
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.shared.utils import decode_cursor, decode_int_cursor, encode_cursor, validate_time_window
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("2025-11-01T10:00:00", 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, size=2) == ["2025-11-01T10:00:00", 42]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", encode_cursor(1, 2, 3), encode_cursor({"a": 1})])
+def test_decode_cursor_rejects_invalid_values(cursor):
+    with pytest.raises(ValidationException):
+        decode_cursor(cursor, size=2)
+
+
+def test_decode_int_cursor_requires_integers():
+    assert decode_int_cursor(encode_cursor(12, 41), size=2) == (12, 41)
+
+    with pytest.raises(ValidationException):
+        decode_int_cursor(encode_cursor("12", 41), size=2)
+
+
+def test_validate_time_window_rejects_inverted_range():
+    validate_time_window(10, 10)
+    validate_time_window(None, 5)
+
+    with pytest.raises(ValidationException):
+        validate_time_window(20, 10)
@@ -0,0 +1,216 @@
+import asyncio
+import os
+import sqlite3
+from contextlib import closing
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.use_cases.finish_practice_use_case import FinishPracticeUseCase
+from app.domain.services.video_service import VideoService
+from app.infrastructure.queue.sqlite_video_deletion_queue import SQLiteVideoDeletionQueue
+from app.infrastructure.queue.video_deletion_worker import VideoDeletionWorker
+from app.infrastructure.repositories.local_video_repo import LocalVideoRepository
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SQLiteVideoDeletionQueue(str(tmp_path / "queue.db"), max_attempts=3, base_backoff=0.0)
+
+
+def _write_video(base_dir, uid, practice_id):
+    path = os.path.join(base_dir, uid, "videos", f"practice_{practice_id}.mp4")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"\x00" * 1024)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_idempotent_and_claim_leases_jobs(queue):
+    await queue.enqueue("uid1", 1)
+    await queue.enqueue("uid1", 1)
+    await queue.enqueue("uid1", 2)
+
+    assert await queue.depth() == 2
+    jobs = await queue.claim(10)
+    assert {(job.uid, job.practice_id) for job in jobs} == {("uid1", 1), ("uid1", 2)}
+    # Leased jobs are not handed out again
+    assert await queue.claim(10) == []
+
+    await queue.complete(jobs[0])
+    assert await queue.depth() == 1
+
+
+@pytest.mark.asyncio
+async def test_jobs_survive_a_new_queue_instance(tmp_path):
+    path = str(tmp_path / "queue.db")
+    await SQLiteVideoDeletionQueue(path).enqueue("uid1", 7)
+
+    jobs = await SQLiteVideoDeletionQueue(path).claim(10)
+
+    assert [(job.uid, job.practice_id) for job in jobs] == [("uid1", 7)]
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_then_given_up(queue):
+    await queue.enqueue("uid1", 1)
+
+    for attempt in range(3):
+        [job] = await queue.claim(10)
+        assert job.attempts == attempt
+        await queue.fail(job, "disk busy")
+
+    assert await queue.claim(10) == []
+    assert await queue.depth() == 0
+
+    # Finishing the practice again starts over
+    await queue.enqueue("uid1", 1)
+    [job] = await queue.claim(10)
+    assert job.attempts == 0
+
+
+@pytest.mark.asyncio
+async def test_backoff_delays_the_retry(tmp_path):
+    queue = SQLiteVideoDeletionQueue(str(tmp_path / "queue.db"), base_backoff=60.0)
+    await queue.enqueue("uid1", 1)
+    [job] = await queue.claim(10)
+
+    await queue.fail(job, "disk busy")
+
+    assert await queue.claim(10) == []
+    assert await queue.depth() == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_cannot_fail_or_complete_the_reclaimed_job(tmp_path):
+    queue = SQLiteVideoDeletionQueue(str(tmp_path / "queue.db"), max_attempts=1, lease_seconds=0.0, base_backoff=0.0)
+    await queue.enqueue("uid1", 1)
+    [stale] = await queue.claim(10)
+    # The first worker outlived its lease: the job is handed out again
+    [current] = await queue.claim(10)
+    assert current.lease_token != stale.lease_token
+
+    await queue.fail(stale, "too slow")
+    await queue.complete(stale)
+
+    assert await queue.depth() == 1
+    await queue.complete(current)
+    assert await queue.depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_file_without_lease_tokens_is_upgraded(tmp_path):
+    path = str(tmp_path / "queue.db")
+    with closing(sqlite3.connect(path)) as conn:
+        conn.execute(
+            """
+            CREATE TABLE video_deletions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, uid TEXT NOT NULL, practice_id INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL, last_error TEXT, created_at REAL NOT NULL, UNIQUE (uid, practice_id)
+            )
+            """
+        )
+        conn.execute("INSERT INTO video_deletions (uid, practice_id, available_at, created_at) VALUES ('uid1', 1, 0, 0)")
+        conn.commit()
+    queue = SQLiteVideoDeletionQueue(path)
+
+    [job] = await queue.claim(10)
+    await queue.complete(job)
+
+    assert await queue.depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_local_video_repository_deletes_in_executor(tmp_path):
+    path = _write_video(str(tmp_path), "uid1", 1)
+    repo = LocalVideoRepository(base_dir=str(tmp_path))
+
+    assert await repo.delete_video("uid1", 1) is True
+    assert not os.path.exists(path)
+    assert await repo.delete_video("uid1", 1) is False
+
+
+@pytest.mark.asyncio
+async def test_worker_deletes_queued_videos(tmp_path, queue):
+    path = _write_video(str(tmp_path), "uid1", 1)
+    video_service = VideoService(LocalVideoRepository(base_dir=str(tmp_path)), deletion_queue=queue)
+    worker = VideoDeletionWorker(queue, video_service, concurrency=2)
+
+    await video_service.schedule_video_deletion("uid1", 1)
+    await video_service.schedule_video_deletion("uid1", 2)  # No file: completed as missing
+    assert os.path.exists(path)
+
+    assert await worker.run_once() == 2
+    assert not os.path.exists(path)
+    assert await queue.depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_hands_failures_back_to_the_queue(queue):
+    video_service = AsyncMock()
+    video_service.delete_video.side_effect = [PermissionError("read-only"), True]
+    worker = VideoDeletionWorker(queue, video_service, concurrency=1)
+    await queue.enqueue("uid1", 1)
+
+    await worker.run_once()
+    assert await queue.depth() == 1
+
+    await worker.run_once()
+    assert await queue.depth() == 0
+    assert video_service.delete_video.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_worker_start_and_stop(queue):
+    video_service = AsyncMock()
+    video_service.delete_video.return_value = True
+    worker = VideoDeletionWorker(queue, video_service, poll_interval=0.01)
+    await queue.enqueue("uid1", 1)
+
+    worker.start()
+    for _ in range(100):
+        if not await queue.depth():
+            break
+        await asyncio.sleep(0.01)
+    await worker.stop()
+
+    video_service.delete_video.assert_awaited_once_with("uid1", 1)
+
+
+@pytest.mark.asyncio
+async def test_finish_practice_schedules_deletion_after_metadata_update():
+    calls = []
+    metadata_service = AsyncMock()
+    metadata_service.finish_practice.side_effect = lambda uid, pid: calls.append("finish") or "metadata"
+    video_service = AsyncMock()
+    video_service.schedule_video_deletion.side_effect = lambda uid, pid: calls.append("schedule")
+    use_case = FinishPracticeUseCase(metadata_service, video_service)
+
+    assert await use_case.execute("uid1", 1) == "metadata"
+    assert calls == ["finish", "schedule"]
+    video_service.delete_video.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_finish_practice_keeps_video_when_metadata_update_fails():
+    metadata_service = AsyncMock()
+    metadata_service.finish_practice.side_effect = ValueError("practice not found")
+    video_service = AsyncMock()
+    use_case = FinishPracticeUseCase(metadata_service, video_service)
+
+    with pytest.raises(ValueError):
+        await use_case.execute("uid1", 1)
+    video_service.schedule_video_deletion.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_finish_practice_succeeds_when_scheduling_fails():
+    metadata_service = AsyncMock()
+    metadata_service.finish_practice.return_value = "metadata"
+    video_service = AsyncMock()
+    video_service.schedule_video_deletion.side_effect = OSError("queue unavailable")
+    use_case = FinishPracticeUseCase(metadata_service, video_service)
+
+    assert await use_case.execute("uid1", 1) == "metadata"